@@ -1 +0,0 @@
-"""Alembic migraions."""
@@ -2,10 +2,10 @@ import asyncio
 from logging.config import fileConfig
 
 from alembic import context
-from sqlalchemy.ext.asyncio.engine import AsyncEngine
 from sqlalchemy.future import Connection
-from sqlmodel import SQLModel, create_engine
+from sqlmodel import SQLModel
 
+from egame179_backend.db.engine import create_db_engine
 from egame179_backend.settings import settings
 
 # this is the Alembic Config object, which provides
@@ -38,7 +38,7 @@ def run_migrations_offline() -> None:
 
     """
     context.configure(
-        url=str(settings.db_url),
+        url=settings.db_url,
         target_metadata=target_metadata,
         literal_binds=True,
         compare_type=True,
@@ -67,7 +67,7 @@ async def run_migrations_online() -> None:
     In this scenario we need to create an Engine
     and associate a connection with the context.
     """
-    connectable = AsyncEngine(create_engine(str(settings.db_url), future=True, pool_pre_ping=True))
+    connectable = create_db_engine(settings.db_url, pool_pre_ping=True)
 
     async with connectable.connect() as connection:
         await connection.run_sync(do_run_migrations)
@@ -77,5 +77,8 @@ async def run_migrations_online() -> None:
 
 if context.is_offline_mode():
     run_migrations_offline()
+elif "connection" in config.attributes:
+    # connection is provided by the caller (tests & benchmarks), e.g. to migrate SQLite database
+    do_run_migrations(config.attributes["connection"])
 else:
     asyncio.run(run_migrations_online())
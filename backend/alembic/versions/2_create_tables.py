@@ -11,7 +11,7 @@ from pathlib import Path
 
 import sqlalchemy as sa
 import yaml
-from alembic import op
+from alembic import context, op
 from passlib.context import CryptContext
 from sqlmodel.sql.sqltypes import AutoString
 
@@ -26,7 +26,9 @@ INITIAL_YAML_PATH = Path("alembic/initial_data.yaml")
 
 def upgrade() -> None:
     # ### commands auto generated by Alembic - please adjust! ###
-    initial_data = yaml.safe_load(INITIAL_YAML_PATH.read_text())
+    # initial data file can be set with `alembic -x initial_data=path/to/initial_data.yaml upgrade head`
+    initial_yaml_path = Path(context.get_x_argument(as_dictionary=True).get("initial_data", INITIAL_YAML_PATH))
+    initial_data = yaml.safe_load(initial_yaml_path.read_text())
     users = initial_data["users"]
     # tables with initial data
     create_users(users)
@@ -0,0 +1,45 @@
+"""Replace balances view with incrementally maintained balances table.
+
+Revision ID: 3
+Revises: 2
+Create Date: 2023-06-10 12:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3"
+down_revision = "2"
+branch_labels = None
+depends_on = None
+
+BALANCES_SQL = """
+    SELECT
+        ts.cycle,
+        ts.user,
+        SUM(ts.delta) OVER (PARTITION BY ts.user ORDER BY ts.cycle) AS balance
+    FROM (
+        SELECT t.cycle, t.user, SUM(t.amount) AS delta
+        FROM transactions t
+        GROUP BY t.cycle, t.user
+    ) AS ts
+"""
+
+
+def upgrade() -> None:
+    op.execute("DROP VIEW balances;")
+    op.create_table(
+        "balances",
+        sa.Column("cycle", sa.Integer, sa.ForeignKey("cycles.id")),
+        sa.Column("user", sa.Integer, sa.ForeignKey("users.id")),
+        sa.Column("balance", sa.Float, nullable=False),
+        sa.PrimaryKeyConstraint("cycle", "user"),
+    )
+    # fill running totals from the transactions ledger
+    op.execute(f"INSERT INTO balances (cycle, user, balance) {BALANCES_SQL}")
+
+
+def downgrade() -> None:
+    op.drop_table("balances")
+    op.execute(f"CREATE VIEW balances AS {BALANCES_SQL}")
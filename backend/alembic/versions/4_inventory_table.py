@@ -0,0 +1,37 @@
+"""Create inventory table maintained alongside production & supplies logs.
+
+Revision ID: 4
+Revises: 3
+Create Date: 2023-06-11 12:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "4"
+down_revision = "3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "inventory",
+        sa.Column("cycle", sa.Integer, sa.ForeignKey("cycles.id")),
+        sa.Column("user", sa.Integer, sa.ForeignKey("users.id")),
+        sa.Column("market", sa.Integer, sa.ForeignKey("markets.id")),
+        sa.Column("quantity", sa.Integer, nullable=False),
+        sa.PrimaryKeyConstraint("cycle", "user", "market"),
+    )
+    # fill inventory with current warehouses state
+    op.execute(
+        """
+        INSERT INTO inventory (cycle, user, market, quantity)
+        SELECT w.cycle, w.user, w.market, w.quantity FROM warehouses w
+        """,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("inventory")
@@ -0,0 +1,34 @@
+"""Create secondary indexes for DAO query predicates.
+
+Revision ID: 5
+Revises: 4
+Create Date: 2023-06-18 12:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5"
+down_revision = "4"
+branch_labels = None
+depends_on = None
+
+INDEXES = {  # {index name: (table, columns)}, primary keys cover queries by cycle
+    "ix_supplies_cycle_user_delivered": ("supplies", ["cycle", "user", "delivered"]),
+    "ix_production_user_cycle": ("production", ["user", "cycle"]),
+    "ix_production_cycle": ("production", ["cycle"]),
+    "ix_transactions_user_cycle_ts": ("transactions", ["user", "cycle", "ts"]),
+    "ix_bulletins_cycle": ("bulletins", ["cycle"]),
+    "ix_balances_user_cycle": ("balances", ["user", "cycle"]),
+    "ix_thetas_user_cycle": ("thetas", ["user", "cycle"]),
+}
+
+
+def upgrade() -> None:
+    for name, (table, columns) in INDEXES.items():
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, (table, _) in INDEXES.items():
+        op.drop_index(name, table_name=table)
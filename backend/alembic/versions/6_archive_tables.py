@@ -0,0 +1,101 @@
+"""Create archive tables for per-cycle logs of closed cycles.
+
+Revision ID: 6
+Revises: 5
+Create Date: 2023-06-25 12:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "6"
+down_revision = "5"
+branch_labels = None
+depends_on = None
+
+WAREHOUSES_SQL = """
+    CREATE VIEW warehouses AS
+    SELECT w.cycle, w.user, w.market, SUM(w.delta) OVER (PARTITION BY w.user, w.market ORDER BY w.cycle) AS quantity
+    FROM (
+        SELECT ps.cycle, ps.user, ps.market, SUM(ps.quantity) AS delta
+            FROM (
+                SELECT p.cycle, p.user, p.market, p.quantity AS quantity
+                FROM {production} p
+                UNION ALL
+                SELECT s.cycle, s.user, s.market, -COALESCE(NULLIF(s.sold, 0), s.quantity) AS quantity
+                FROM {supplies} s
+            ) AS ps
+        GROUP BY ps.cycle, ps.user, ps.market
+    ) AS w
+"""
+# columns are listed explicitly, so that live & archive tables don't depend on the same columns order
+ARCHIVED_COLUMNS = {
+    "transactions": "id, ts, cycle, user, amount, description",
+    "production": "id, ts, cycle, user, market, quantity",
+    "supplies": "id, ts_start, ts_finish, cycle, user, market, quantity, delivered, sold",
+    "bulletins": "id, ts, cycle, text",
+}
+
+
+def _whole_history(table: str) -> str:
+    columns = ARCHIVED_COLUMNS[table]
+    return f"(SELECT {columns} FROM {table} UNION ALL SELECT {columns} FROM {table}_archive)"  # noqa: S608
+
+
+def upgrade() -> None:
+    op.create_table(
+        "transactions_archive",
+        sa.Column("id", sa.Integer, autoincrement=False, primary_key=True),
+        sa.Column("ts", sa.DateTime, nullable=False),
+        sa.Column("cycle", sa.Integer, nullable=False),
+        sa.Column("user", sa.Integer, nullable=False),
+        sa.Column("amount", sa.Float, nullable=False),
+        sa.Column("description", sa.Text, nullable=False),
+    )
+    op.create_table(
+        "production_archive",
+        sa.Column("id", sa.Integer, autoincrement=False, primary_key=True),
+        sa.Column("ts", sa.DateTime, nullable=False),
+        sa.Column("cycle", sa.Integer, nullable=False),
+        sa.Column("user", sa.Integer, nullable=False),
+        sa.Column("market", sa.Integer, nullable=False),
+        sa.Column("quantity", sa.Integer, nullable=False),
+    )
+    op.create_table(
+        "supplies_archive",
+        sa.Column("id", sa.Integer, autoincrement=False, primary_key=True),
+        sa.Column("ts_start", sa.DateTime),
+        sa.Column("ts_finish", sa.DateTime),
+        sa.Column("cycle", sa.Integer, nullable=False),
+        sa.Column("user", sa.Integer, nullable=False),
+        sa.Column("market", sa.Integer, nullable=False),
+        sa.Column("quantity", sa.Integer, nullable=False),
+        sa.Column("delivered", sa.Integer),
+        sa.Column("sold", sa.Integer),
+    )
+    op.create_table(
+        "bulletins_archive",
+        sa.Column("id", sa.Integer, autoincrement=False, primary_key=True),
+        sa.Column("ts", sa.DateTime, nullable=False),
+        sa.Column("cycle", sa.Integer, nullable=False),
+        sa.Column("text", sa.Text, nullable=False),
+    )
+    op.create_index("ix_transactions_archive_user_cycle_ts", "transactions_archive", ["user", "cycle", "ts"])
+    op.create_index("ix_production_archive_user_cycle", "production_archive", ["user", "cycle"])
+    # warehouses view (reconciliation of inventory table) reads whole history
+    op.execute("DROP VIEW warehouses;")
+    op.execute(
+        WAREHOUSES_SQL.format(
+            production=_whole_history("production"),
+            supplies=_whole_history("supplies"),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP VIEW warehouses;")
+    op.execute(WAREHOUSES_SQL.format(production="production", supplies="supplies"))
+    for table, columns in ARCHIVED_COLUMNS.items():
+        op.execute(f"INSERT INTO {table} ({columns}) SELECT {columns} FROM {table}_archive")  # noqa: S608
+        op.drop_table(f"{table}_archive")
@@ -0,0 +1,85 @@
+"""Drop auxiliary zero production & transactions, carry warehouses over by cycles calendar.
+
+Revision ID: 7
+Revises: 6
+Create Date: 2023-07-02 12:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7"
+down_revision = "6"
+branch_labels = None
+depends_on = None
+
+WAREHOUSES_SQL = """
+    CREATE VIEW warehouses AS
+    SELECT w.cycle, w.user, w.market, SUM(w.delta) OVER (PARTITION BY w.user, w.market ORDER BY w.cycle) AS quantity
+    FROM (
+        SELECT ps.cycle, ps.user, ps.market, SUM(ps.quantity) AS delta
+            FROM (
+                SELECT p.cycle, p.user, p.market, p.quantity AS quantity
+                FROM (
+                    SELECT cycle, user, market, quantity FROM production
+                    UNION ALL
+                    SELECT cycle, user, market, quantity FROM production_archive
+                ) p
+                UNION ALL
+                SELECT s.cycle, s.user, s.market, -COALESCE(NULLIF(s.sold, 0), s.quantity) AS quantity
+                FROM (
+                    SELECT cycle, user, market, quantity, sold FROM supplies
+                    UNION ALL
+                    SELECT cycle, user, market, quantity, sold FROM supplies_archive
+                ) s
+                {carry_over}
+            ) AS ps
+        GROUP BY ps.cycle, ps.user, ps.market
+    ) AS w
+"""
+# warehouses of users with transactions are carried over to the next cycle of every finished cycle
+CARRY_OVER_SQL = """
+                UNION ALL
+                SELECT c.id + 1 AS cycle, u.user, m.id AS market, 0 AS quantity
+                FROM cycles c
+                JOIN (
+                    SELECT t.user, MIN(t.cycle) AS cycle
+                    FROM (
+                        SELECT cycle, user FROM transactions
+                        UNION ALL
+                        SELECT cycle, user FROM transactions_archive
+                    ) t
+                    GROUP BY t.user
+                ) AS u ON u.cycle <= c.id
+                CROSS JOIN markets m
+                WHERE c.ts_finish IS NOT NULL
+"""
+AUXILIARY_PRODUCTION_SQL = """
+    INSERT INTO production (ts, cycle, user, market, quantity)
+    SELECT c.ts_finish, i.cycle, i.user, i.market, 0
+    FROM inventory i
+    JOIN cycles c ON c.id = i.cycle - 1
+"""
+AUXILIARY_TRANSACTIONS_SQL = """
+    INSERT INTO transactions (ts, cycle, user, amount, description)
+    SELECT c.ts_finish, b.cycle, b.user, 0, 'Ugly hack'
+    FROM balances b
+    JOIN cycles c ON c.id = b.cycle - 1
+"""
+
+
+def upgrade() -> None:
+    for production in ("production", "production_archive"):
+        op.execute(f"DELETE FROM {production} WHERE quantity = 0")  # noqa: S608
+    for transactions in ("transactions", "transactions_archive"):
+        op.execute(f"DELETE FROM {transactions} WHERE amount = 0")  # noqa: S608
+    op.execute("DROP VIEW warehouses;")
+    op.execute(WAREHOUSES_SQL.format(carry_over=CARRY_OVER_SQL))
+
+
+def downgrade() -> None:
+    op.execute("DROP VIEW warehouses;")
+    op.execute(WAREHOUSES_SQL.format(carry_over=""))
+    # auxiliary records are restored from carried over running totals
+    op.execute(AUXILIARY_PRODUCTION_SQL)
+    op.execute(AUXILIARY_TRANSACTIONS_SQL)
@@ -0,0 +1,23 @@
+"""Create transactions cycle index for history cursors.
+
+Revision ID: 8
+Revises: 7
+Create Date: 2023-07-09 12:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8"
+down_revision = "7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # `since_id` cursor returns the rest of the cursor's cycle too (see `TransactionDAO.select`)
+    op.create_index("ix_transactions_cycle", "transactions", ["cycle"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transactions_cycle", table_name="transactions")
@@ -0,0 +1,27 @@
+"""Create access tokens revocations table, shared by all workers.
+
+Revision ID: 9
+Revises: 8
+Create Date: 2023-07-16 12:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9"
+down_revision = "8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "token_revocations",
+        sa.Column("user", sa.Integer, primary_key=True, autoincrement=False),
+        sa.Column("revoked_at", sa.Float, nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("token_revocations")
@@ -1,7 +1,11 @@
+from typing import Any
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, SecurityScopes
 from jose import JWTError, jwt
 
+from egame179_backend.api.auth.token_cache import TokenCache, VerifiedToken, get_token_cache
+from egame179_backend.db.token_revocation import TokenRevocationDAO
 from egame179_backend.db.user import User, UserDAO
 from egame179_backend.settings import settings
 
@@ -22,22 +26,31 @@ async def get_current_user(  # noqa: WPS238, C901
     security_scopes: SecurityScopes,
     token: str = Depends(oauth2_scheme),
     user_dao: UserDAO = Depends(),
+    revocation_dao: TokenRevocationDAO = Depends(),
+    token_cache: TokenCache = Depends(get_token_cache),
 ) -> User:
     """Get current authorized user.
 
+    User is built from token claims, older tokens without them are checked in database.
+    Verified tokens are cached until expiration, so repeated requests skip decoding.
+    Revocation of the user tokens is loaded from database on cache miss (revoked by other workers).
+
     Args:
         security_scopes (SecurityScopes): fastAPI security scopes.
         token (str): authorization token.
         user_dao (UserDAO): DAO for users table.
+        revocation_dao (TokenRevocationDAO): DAO for token revocations table.
+        token_cache (TokenCache): verified tokens cache.
 
     Raises:
         credentials_exception: JWTError
         credentials_exception: Token is invalid
         credentials_exception: User not found
+        credentials_exception: Token is revoked
         HTTPException: User have no permissions
 
     Returns:
-        User: user information from database.
+        User: user information from token claims or database.
     """
     if security_scopes.scopes:
         authenticate_value = f"Bearer scope='{security_scopes.scope_str}'"
@@ -49,23 +62,41 @@ async def get_current_user(  # noqa: WPS238, C901
         detail="Invalid authentication token",
         headers={"WWW-Authenticate": authenticate_value},
     )
-    try:  # check token decoding
-        payload = jwt.decode(token, settings.jwt_secret, algorithms=[ALGORITHM])
-    except JWTError as exc:
-        raise credentials_exception from exc
+    verified = token_cache.get(token)
+    if verified is None:
+        try:  # check token decoding
+            payload = jwt.decode(token, settings.jwt_secret, algorithms=[ALGORITHM])
+        except JWTError as exc:
+            raise credentials_exception from exc
+        user = await _get_token_user(payload, user_dao)
+        if user is None:
+            raise credentials_exception
+        verified = VerifiedToken(
+            user=user,
+            scopes=frozenset(payload.get("scopes", [])),
+            expires=payload.get("exp"),
+            issued=payload.get("iat"),
+        )
+        revoked_at = await revocation_dao.get(user.id)
+        if revoked_at is not None:
+            token_cache.revoke(user.id, revoked_at)
+        token_cache.add(token, verified)
+    if token_cache.is_revoked(verified):
+        raise credentials_exception
     # check token permissions
-    token_scopes = set(payload.get("scopes", []))
-    if not token_scopes.issuperset(security_scopes.scopes):
+    if not verified.scopes.issuperset(security_scopes.scopes):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not enough permissions",
             headers={"WWW-Authenticate": authenticate_value},
         )
-    user: User | None = None
-    # check valid username
+    return verified.user
+
+
+async def _get_token_user(payload: dict[str, Any], user_dao: UserDAO) -> User | None:
     username: str | None = payload.get("sub")
-    if username is not None:
-        user = await user_dao.get_by_name(username)  # check user in database
-    if user is None:
-        raise credentials_exception
-    return user
+    if username is None:
+        return None
+    if "uid" in payload and "role" in payload:  # user claims (see `views.user_claims`), no database check
+        return User(id=payload["uid"], role=payload["role"], name=username, login=None, password=None)
+    return await user_dao.get_by_name(username)  # older tokens: check user in database
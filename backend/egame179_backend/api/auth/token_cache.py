@@ -0,0 +1,132 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from starlette.requests import Request
+
+from egame179_backend.db.user import User
+
+
+@dataclass(frozen=True)
+class VerifiedToken:
+    """Decoded & verified access token."""
+
+    user: User
+    scopes: frozenset[str]
+    expires: float | None  # token `exp` timestamp
+    issued: float | None = None  # token `iat` timestamp
+
+
+class TokenCache:
+    """LRU cache of verified access tokens, so authenticated requests skip JWT decoding & user lookup.
+
+    Entries are dropped on token expiration. Cached users must not be mutated by callers,
+    `invalidate` should be called after manual changes of users (together with topology cache).
+    Also keeps revocations: tokens of the user issued before revocation are rejected (see `is_revoked`).
+    Cache is process-local, as other application caches. Revocations are saved in database by the revoke endpoint
+    and loaded on cache miss, so other workers reject revoked tokens, that they haven't cached yet.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """Create empty cache.
+
+        Args:
+            maxsize (int): max number of cached tokens, 0 - disable cache.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._tokens: OrderedDict[str, VerifiedToken] = OrderedDict()
+        self._revoked: dict[int, float] = {}  # {user: revocation timestamp}
+
+    def get(self, token: str) -> VerifiedToken | None:
+        """Get verified token.
+
+        Args:
+            token (str): encoded access token.
+
+        Returns:
+            VerifiedToken | None: verified token or None if it is not cached or expired.
+        """
+        verified = self._tokens.get(token)
+        if verified is not None and verified.expires is not None and verified.expires <= time.time():
+            del self._tokens[token]  # noqa: WPS420
+            verified = None
+        if verified is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._tokens.move_to_end(token)
+        return verified
+
+    def add(self, token: str, verified: VerifiedToken) -> None:
+        """Cache verified token.
+
+        Args:
+            token (str): encoded access token.
+            verified (VerifiedToken): verified token.
+        """
+        if not self.maxsize:
+            return
+        self._tokens[token] = verified
+        self._tokens.move_to_end(token)
+        while len(self._tokens) > self.maxsize:
+            self._tokens.popitem(last=False)
+
+    def revoke(self, user: int, revoked_at: float) -> None:
+        """Revoke all tokens of the user issued till the revocation time.
+
+        Args:
+            user (int): user id.
+            revoked_at (float): revocation timestamp.
+        """
+        if revoked_at <= self._revoked.get(user, 0):
+            return
+        self._revoked[user] = revoked_at
+        for token in [token for token, verified in self._tokens.items() if verified.user.id == user]:
+            del self._tokens[token]  # noqa: WPS420
+
+    def is_revoked(self, verified: VerifiedToken) -> bool:
+        """Check if token is revoked.
+
+        Args:
+            verified (VerifiedToken): verified token.
+
+        Returns:
+            bool: True if tokens of the user were revoked after the token was issued.
+        """
+        revoked_at = self._revoked.get(verified.user.id)
+        if revoked_at is None:
+            return False
+        return verified.issued is None or verified.issued <= revoked_at
+
+    def invalidate(self) -> None:
+        """Drop all cached tokens."""
+        self._tokens.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            dict[str, Any]: entries count, max size, hits, misses & revoked users count.
+        """
+        return {
+            "entries": len(self._tokens),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "revoked": len(self._revoked),
+        }
+
+
+def get_token_cache(request: Request) -> TokenCache:
+    """Get application verified tokens cache.
+
+    Args:
+        request (Request): current request.
+
+    Returns:
+        TokenCache: verified tokens cache.
+    """
+    return request.app.state.token_cache
@@ -1,12 +1,14 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Security, status
 from fastapi.security import OAuth2PasswordRequestForm
 from jose import jwt
 
 from egame179_backend.api.auth.dependencies import ALGORITHM, get_current_user
 from egame179_backend.api.auth.schema import Token, UserInfo
+from egame179_backend.api.auth.token_cache import TokenCache, get_token_cache
+from egame179_backend.db.token_revocation import TokenRevocationDAO
 from egame179_backend.db.user import User, UserDAO
 from egame179_backend.settings import settings
 
@@ -25,7 +27,23 @@ def create_access_token(payload: dict[str, Any]) -> str:
         str: encoded token
     """
     expire = datetime.utcnow() + timedelta(minutes=TOKEN_EXPIRE_MINUTES)
-    return jwt.encode({**payload, "exp": expire}, settings.jwt_secret, algorithm=ALGORITHM)
+    # fractional issue time: tokens issued right after revocation are valid (see `TokenCache.is_revoked`)
+    issued = datetime.now(timezone.utc).timestamp()
+    return jwt.encode({**payload, "exp": expire, "iat": issued}, settings.jwt_secret, algorithm=ALGORITHM)
+
+
+def user_claims(user: User) -> dict[str, Any]:
+    """Get access token payload of the user.
+
+    Token carries immutable user info, so authenticated requests don't read users table (see `get_current_user`).
+
+    Args:
+        user (User): user info.
+
+    Returns:
+        dict[str, Any]: token payload.
+    """
+    return {"sub": user.name, "scopes": [user.role], "uid": user.id, "role": user.role}
 
 
 @router.post("/token")
@@ -49,7 +67,7 @@ async def get_access_token(form_data: OAuth2PasswordRequestForm = Depends(), dao
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    access_token = create_access_token({"sub": user.name, "scopes": [user.role]})
+    access_token = create_access_token(user_claims(user))
     return Token(access_token=access_token, token_type="bearer")  # noqa: S106
 
 
@@ -66,6 +84,27 @@ async def get_user(user: User = Depends(get_current_user)) -> User:
     return user
 
 
+@router.post("/token/revoke", dependencies=[Security(get_current_user, scopes=["root"])])
+async def revoke_tokens(
+    user: int,
+    dao: TokenRevocationDAO = Depends(),
+    token_cache: TokenCache = Depends(get_token_cache),
+) -> None:
+    """Revoke all issued access tokens of the user.
+
+    Other workers load the revocation on token cache miss, tokens they have already cached stay valid
+    until expiration or eviction from their cache.
+
+    Args:
+        user (int): user id.
+        dao (TokenRevocationDAO): token revocations table data access object.
+        token_cache (TokenCache): verified tokens cache, keeping revocations.
+    """
+    revoked_at = datetime.now(timezone.utc).timestamp()
+    await dao.revoke(user, revoked_at)
+    token_cache.revoke(user, revoked_at)
+
+
 @router.get("/names")
 async def get_names(dao: UserDAO = Depends()) -> dict[int, str]:
     """Get player names (including NPCs).
@@ -8,27 +8,43 @@ router = APIRouter()
 
 
 @router.get("/list")
-async def get_user_balances(user: User = Depends(get_current_user), dao: BalanceDAO = Depends()) -> list[Balance]:
+async def get_user_balances(
+    user: User = Depends(get_current_user),
+    dao: BalanceDAO = Depends(),
+    since_cycle: int | None = None,
+) -> list[Balance]:
     """Get balances history for user.
 
     Args:
         user (User): authenticated user data.
         dao (BalanceDAO): balances table data access object.
+        since_cycle (int, optional): return only records of this & later cycles (earlier are known to client).
 
     Returns:
         list[Balance]: balances history for user.
     """
-    return await dao.select(user=user.id)
+    return await dao.select(user=user.id, since_cycle=since_cycle)
 
 
 @router.get("/list/all", dependencies=[Security(get_current_user, scopes=["root"])])
-async def get_balances(dao: BalanceDAO = Depends()) -> list[Balance]:
+async def get_balances(dao: BalanceDAO = Depends(), since_cycle: int | None = None) -> list[Balance]:
     """Get balances history for all users.
 
     Args:
         dao (BalanceDAO): balances table data access object.
+        since_cycle (int, optional): return only records of this & later cycles (earlier are known to client).
 
     Returns:
         list[Balance]: balances history for all users.
     """
-    return await dao.select()
+    return await dao.select(since_cycle=since_cycle)
+
+
+@router.post("/rebuild", dependencies=[Security(get_current_user, scopes=["root"])])
+async def rebuild_balances(dao: BalanceDAO = Depends()) -> None:
+    """Rebuild balances from the transactions ledger.
+
+    Args:
+        dao (BalanceDAO): balances table data access object.
+    """
+    await dao.rebuild()
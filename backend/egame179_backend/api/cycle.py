@@ -1,9 +1,15 @@
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Request, Security
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from egame179_backend import db
 from egame179_backend.api.auth.dependencies import get_current_user
+from egame179_backend.bid_queue import BidQueue, get_bid_queue
+from egame179_backend.db.archive import archive_closed_cycles
 from egame179_backend.db.cycle import Cycle, CycleDAO
+from egame179_backend.db.session import dao_provider, get_db_session, single_transaction
 from egame179_backend.engine.mechanics import finish_cycle, prepare_new_cycle
+from egame179_backend.engine.snapshot import CycleSnapshot
+from egame179_backend.events import EventBus, EventType, GameEvent, get_event_bus
 
 router = APIRouter()
 
@@ -22,24 +28,31 @@ async def get_current(dao: CycleDAO = Depends()) -> Cycle:
 
 
 @router.get("/start", dependencies=[Security(get_current_user, scopes=["root"])])
-async def start(dao: CycleDAO = Depends(), sync_dao: db.SyncStatusDAO = Depends()) -> None:
+async def start(
+    dao: CycleDAO = Depends(),
+    sync_dao: db.SyncStatusDAO = Depends(),
+    bus: EventBus = Depends(get_event_bus),
+) -> None:
     """Start current cycle.
 
     Args:
         dao (CycleDAO): cycles table data access object.
         sync_dao (SyncStatusDAO): sync status table data access object.
+        bus (EventBus): application event bus.
     """
     await dao.start()
     await sync_dao.desync_all()
+    cycle = await dao.get_current()
+    bus.publish(GameEvent(type=EventType.cycle_start, cycle=cycle.id))
 
 
 @router.get("/finish", dependencies=[Security(get_current_user, scopes=["root"])])
 async def finish(  # noqa: WPS211
+    request: Request,
+    session: AsyncSession = Depends(get_db_session),
     dao: CycleDAO = Depends(),
     balance_dao: db.BalanceDAO = Depends(),
     market_dao: db.MarketDAO = Depends(),
-    mod_dao: db.FeeModificatorDAO = Depends(),
-    production_dao: db.ProductionDAO = Depends(),
     price_dao: db.MarketPriceDAO = Depends(),
     stock_dao: db.StockDAO = Depends(),
     supply_dao: db.SupplyDAO = Depends(),
@@ -47,48 +60,54 @@ async def finish(  # noqa: WPS211
     theta_dao: db.ThetaDAO = Depends(),
     transaction_dao: db.TransactionDAO = Depends(),
     wh_dao: db.WarehouseDAO = Depends(),
-    wd_dao: db.WorldDemandDAO = Depends(),
+    bus: EventBus = Depends(get_event_bus),
+    queue: BidQueue = Depends(get_bid_queue),
 ) -> None:
     """Finish current cycle.
 
+    Whole pipeline runs in a single database transaction: any failed stage rolls back everything.
+    Bid admission is closed till the commit (see `BidQueue.paused`), so the snapshot has all accepted bids
+    and no bid is written to the finished cycle.
+    Engine inputs are loaded once, concurrently, into the cycle snapshot.
+    Logs of closed cycles are moved to archive tables at the end.
+
     Args:
+        request (Request): current request.
+        session (AsyncSession): database session shared by all DAOs.
         dao (CycleDAO): cycles table data access object.
         balance_dao (BalanceDAO): balances table data access object.
         market_dao (MarketDAO): markets table data access object.
-        mod_dao (FeeModificatorDAO): fee_modificators table data access object.
-        production_dao (ProductionDAO): productions table data access object.
         price_dao (MarketPriceDAO): market_prices table data access object.
         stock_dao (StockDAO): stocks table data access object.
         supply_dao (SupplyDAO): supplies table data access object.
         sync_dao (SyncStatusDAO): sync status table data access object.
         theta_dao (ThetaDAO): thetas table data access object.
         transaction_dao (TransactionDAO): transactions table data access object.
-        wh_dao (WarehouseDAO): warehouses table data access object.
-        wd_dao (WorldDemandDAO): world_demands table data access object.
+        wh_dao (WarehouseDAO): inventory table data access object.
+        bus (EventBus): application event bus.
+        queue (BidQueue): production & supply bids queue.
     """
-    finished_cycle = await dao.finish()
-    await finish_cycle(
-        cycle=finished_cycle,
-        balance_dao=balance_dao,
-        market_dao=market_dao,
-        mod_dao=mod_dao,
-        price_dao=price_dao,
-        supply_dao=supply_dao,
-        transaction_dao=transaction_dao,
-        wd_dao=wd_dao,
-        wh_dao=wh_dao,
-    )
-    await prepare_new_cycle(
-        cycle=finished_cycle,
-        balance_dao=balance_dao,
-        market_dao=market_dao,
-        price_dao=price_dao,
-        production_dao=production_dao,
-        supply_dao=supply_dao,
-        stock_dao=stock_dao,
-        theta_dao=theta_dao,
-        transaction_dao=transaction_dao,
-        wh_dao=wh_dao,
-        wd_dao=wd_dao,
-    )
-    await sync_dao.desync_all()
+    async with queue.paused(), single_transaction(session):
+        finished_cycle = await dao.finish()
+        snapshot = await CycleSnapshot.load(
+            cycle=finished_cycle,
+            provide=dao_provider(request.app.state.db_session_factory),
+        )
+        await finish_cycle(
+            snapshot=snapshot,
+            market_dao=market_dao,
+            supply_dao=supply_dao,
+            transaction_dao=transaction_dao,
+        )
+        await prepare_new_cycle(
+            snapshot=snapshot,
+            balance_dao=balance_dao,
+            market_dao=market_dao,
+            price_dao=price_dao,
+            stock_dao=stock_dao,
+            theta_dao=theta_dao,
+            wh_dao=wh_dao,
+        )
+        await sync_dao.desync_all()
+        await archive_closed_cycles(session, finished_cycle=finished_cycle.id)
+    bus.publish(GameEvent(type=EventType.cycle_finish, cycle=finished_cycle.id))
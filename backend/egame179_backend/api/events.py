@@ -0,0 +1,57 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from egame179_backend.api.auth.dependencies import get_current_user
+from egame179_backend.db.session import get_db_session
+from egame179_backend.db.user import User
+from egame179_backend.events import EventBus, EventType, GameEvent, get_event_bus
+
+KEEPALIVE_SECONDS = 15
+
+router = APIRouter()
+
+
+@router.get("/events", response_class=StreamingResponse)
+async def get_events(
+    user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db_session),
+    bus: EventBus = Depends(get_event_bus),
+) -> StreamingResponse:
+    """Stream game state changes visible to the user as server-sent events.
+
+    The first event is `reset`: client should reload game state, changed before subscription.
+
+    Args:
+        user (User): authenticated user data.
+        session (AsyncSession): database session of authentication.
+        bus (EventBus): application event bus.
+
+    Returns:
+        StreamingResponse: `text/event-stream` response.
+    """
+    await session.close()  # don't hold database connection for the stream lifetime
+    return StreamingResponse(
+        _stream(bus, user),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _stream(bus: EventBus, user: User) -> AsyncIterator[str]:
+    async with bus.subscribe(user) as queue:
+        yield _format(GameEvent(type=EventType.reset))  # events before subscription are unknown to the client
+        while True:  # noqa: WPS457
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            yield _format(event)
+
+
+def _format(event: GameEvent) -> str:
+    return f"id: {event.id}\nevent: {event.type.value}\ndata: {event.json()}\n\n"
@@ -6,13 +6,14 @@ router = APIRouter()
 
 
 @router.get("/market/prices")
-async def get_market_prices(dao: MarketPriceDAO = Depends()) -> list[MarketPrice]:
+async def get_market_prices(dao: MarketPriceDAO = Depends(), since_cycle: int | None = None) -> list[MarketPrice]:
     """Get all markets prices.
 
     Args:
         dao (MarketPriceDAO): prices table data access object.
+        since_cycle (int, optional): return only records of this & later cycles (earlier are known to client).
 
     Returns:
         list[MarketPrices]: list of market prices.
     """
-    return await dao.select()
+    return await dao.select(since_cycle=since_cycle)
@@ -1,8 +1,12 @@
-from fastapi import APIRouter, Depends, Security
+from typing import Any
+
+from fastapi import APIRouter, Depends, Request, Security
 
 from egame179_backend.api.auth.dependencies import get_current_user
 from egame179_backend.db import SyncStatusDAO
+from egame179_backend.db.engine import pool_stats
 from egame179_backend.db.user import User
+from egame179_backend.events import EventBus, EventType, GameEvent, get_event_bus
 
 router = APIRouter()
 
@@ -30,11 +34,87 @@ async def get_sync_status(dao: SyncStatusDAO = Depends()) -> dict[int, bool]:
 
 
 @router.get("/sync")
-async def sync(user: User = Depends(get_current_user), dao: SyncStatusDAO = Depends()) -> None:
+async def sync(
+    user: User = Depends(get_current_user),
+    dao: SyncStatusDAO = Depends(),
+    bus: EventBus = Depends(get_event_bus),
+) -> None:
     """Sync user.
 
     Args:
         user (User): authenticated user data.
         dao (SyncStatusDAO): sync status table DAO.
+        bus (EventBus): application event bus.
     """
     await dao.sync(user.id)
+    bus.publish(GameEvent(type=EventType.sync, user=user.id))
+
+
+@router.get("/cache/topology", dependencies=[Security(get_current_user, scopes=["root"])])
+async def get_topology_cache_stats(request: Request) -> dict[str, Any]:
+    """Get static game topology cache statistics.
+
+    Args:
+        request (Request): current request.
+
+    Returns:
+        dict[str, Any]: entries count, hits, misses, ttl & load timestamp.
+    """
+    return request.app.state.topology_cache.stats()
+
+
+@router.get("/cache/tokens", dependencies=[Security(get_current_user, scopes=["root"])])
+async def get_token_cache_stats(request: Request) -> dict[str, Any]:
+    """Get verified access tokens cache statistics.
+
+    Args:
+        request (Request): current request.
+
+    Returns:
+        dict[str, Any]: entries count, max size, hits & misses.
+    """
+    return request.app.state.token_cache.stats()
+
+
+@router.post("/cache/topology/invalidate", dependencies=[Security(get_current_user, scopes=["root"])])
+async def invalidate_topology_cache(request: Request) -> dict[str, Any]:
+    """Reload static game topology cache of the worker, e.g. after manual changes of markets or users.
+
+    Verified tokens cache is dropped too, as it keeps users.
+
+    Args:
+        request (Request): current request.
+
+    Returns:
+        dict[str, Any]: cache statistics after reload.
+    """
+    request.app.state.token_cache.invalidate()
+    cache = request.app.state.topology_cache
+    await cache.load(request.app.state.db_session_factory)
+    return cache.stats()
+
+
+@router.get("/monitoring/db", dependencies=[Security(get_current_user, scopes=["root"])])
+async def get_db_pool_stats(request: Request) -> dict[str, Any]:
+    """Get database connection pool statistics of the worker.
+
+    Args:
+        request (Request): current request.
+
+    Returns:
+        dict[str, Any]: pool size & overflow, checked out connections, checkouts, timeouts & wait times (seconds).
+    """
+    return pool_stats(request.app.state.db_engine)
+
+
+@router.get("/monitoring/bids", dependencies=[Security(get_current_user, scopes=["root"])])
+async def get_bid_queue_stats(request: Request) -> dict[str, Any]:
+    """Get bid queue statistics of the worker.
+
+    Args:
+        request (Request): current request.
+
+    Returns:
+        dict[str, Any]: written batches & bids, average & max batch size, queued bids & batching settings.
+    """
+    return request.app.state.bid_queue.stats()
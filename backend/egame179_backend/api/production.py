@@ -2,12 +2,13 @@ from fastapi import APIRouter, Depends, HTTPException, Security
 from pydantic import BaseModel
 
 from egame179_backend.api.auth.dependencies import get_current_user
-from egame179_backend.db import BalanceDAO, CycleDAO, MarketDAO, MarketPriceDAO, TransactionDAO
+from egame179_backend.api.schema import BatchResult, BidBatch
+from egame179_backend.bid_queue import BidQueue, get_bid_queue
 from egame179_backend.db.production import Production, ProductionDAO
 from egame179_backend.db.theta import Theta, ThetaDAO
 from egame179_backend.db.user import User
-from egame179_backend.engine.math import production_cost
-from egame179_backend.engine.utility import check_balance, get_market_names
+from egame179_backend.engine.bids import BidError, BidKind, UserBid
+from egame179_backend.events import EventBus, EventType, GameEvent, get_event_bus
 
 router = APIRouter()
 
@@ -23,104 +24,130 @@ class ProductionBid(BaseModel):
 async def get_user_production(
     user: User = Depends(get_current_user),
     dao: ProductionDAO = Depends(),
+    since_id: int | None = None,
 ) -> list[Production]:
     """Get production history for user.
 
     Args:
         user (User): authenticated user data.
         dao (ProductionDAO): production table data access object.
+        since_id (int, optional): return only records after this id (already known to client),
+            records of its cycle are returned again as they may be committed out of id order.
 
     Returns:
         list[Production]: production history for user.
     """
-    return await dao.select(user=user.id)
+    return await dao.select(user=user.id, since_id=since_id, with_archive=True)
 
 
 @router.get("/thetas")
 async def get_user_thetas(
     user: User = Depends(get_current_user),
     dao: ThetaDAO = Depends(),
+    since_cycle: int | None = None,
 ) -> list[Theta]:
     """Get thetas for user.
 
     Args:
         user (User): authenticated user data.
         dao (ThetaDAO): thetas table data access object.
+        since_cycle (int, optional): return only records of this & later cycles (earlier are known to client).
 
     Returns:
         list[Theta]: thetas history for user.
     """
-    return await dao.select(user=user.id)
+    return await dao.select(user=user.id, since_cycle=since_cycle)
 
 
 @router.get("/list/all", dependencies=[Security(get_current_user, scopes=["root"])])
-async def get_production(dao: ProductionDAO = Depends()) -> list[Production]:
+async def get_production(dao: ProductionDAO = Depends(), since_id: int | None = None) -> list[Production]:
     """Get production history for all users.
 
     Args:
         dao (ProductionDAO): production table data access object.
+        since_id (int, optional): return only records after this id (already known to client),
+            records of its cycle are returned again as they may be committed out of id order.
 
     Returns:
         list[Production]: production history for all users.
     """
-    return await dao.select()
+    return await dao.select(since_id=since_id, with_archive=True)
 
 
 @router.get("/thetas/all", dependencies=[Security(get_current_user, scopes=["root"])])
-async def get_thetas(dao: ThetaDAO = Depends()) -> list[Theta]:
+async def get_thetas(dao: ThetaDAO = Depends(), since_cycle: int | None = None) -> list[Theta]:
     """Get thetas for all users.
 
     Args:
         dao (ThetaDAO): thetas table data access object.
+        since_cycle (int, optional): return only records of this & later cycles (earlier are known to client).
 
     Returns:
         list[Thetas]: thetas history for all users.
     """
-    return await dao.select()
+    return await dao.select(since_cycle=since_cycle)
 
 
 @router.post("/new")
-async def new_production(  # noqa: WPS217
+async def new_production(
     bid: ProductionBid,
     user: User = Depends(get_current_user),
-    dao: ProductionDAO = Depends(),
-    cycle_dao: CycleDAO = Depends(),
-    market_dao: MarketDAO = Depends(),
-    price_dao: MarketPriceDAO = Depends(),
-    balance_dao: BalanceDAO = Depends(),
-    theta_dao: ThetaDAO = Depends(),
-    transaction_dao: TransactionDAO = Depends(),
+    queue: BidQueue = Depends(get_bid_queue),
+    bus: EventBus = Depends(get_event_bus),
 ) -> None:
     """Buy products route.
 
+    The bid is written together with concurrent bids of other users (see `BidQueue`).
+
     Args:
         bid (ProductionBid): buy bid.
         user (User): auth user.
-        dao (ProductionDAO): production table data access object.
-        cycle_dao (CycleDAO): cycle table data access object.
-        market_dao (MarketDAO): markets table DAO.
-        price_dao (MarketPriceDAO): market prices table DAO.
-        balance_dao (BalanceDAO): balances table DAO.
-        theta_dao (ThetaDAO): thetas table DAO.
-        transaction_dao (TransactionDAO): transactions table DAO.
+        queue (BidQueue): application bid queue.
+        bus (EventBus): application event bus.
 
     Raises:
-        HTTPException: quantity <= 0.
-        HTTPException: insufficient balance for transaction.
+        HTTPException: quantity <= 0 or insufficient balance for transaction.
+    """
+    try:
+        receipt = await queue.submit(
+            UserBid(kind=BidKind.production, user=user.id, market=bid.market, quantity=bid.quantity),
+        )
+    except BidError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    bus.publish(GameEvent(type=EventType.balance, cycle=receipt.cycle, user=user.id, data={"delta": receipt.delta}))
+
+
+@router.post("/batch")
+async def new_production_batch(
+    batch: BidBatch,
+    user: User = Depends(get_current_user),
+    queue: BidQueue = Depends(get_bid_queue),
+    bus: EventBus = Depends(get_event_bus),
+) -> BatchResult:
+    """Buy products on several markets route.
+
+    Orders are checked in order against one balance read & written in one transaction.
+
+    Args:
+        batch (BidBatch): buy orders.
+        user (User): auth user.
+        queue (BidQueue): application bid queue.
+        bus (EventBus): application event bus.
+
+    Raises:
+        HTTPException: atomic batch has rejected orders (detail is batch result).
+
+    Returns:
+        BatchResult: result of each order.
     """
-    if bid.quantity <= 0:
-        raise HTTPException(status_code=400, detail=f"Incorrect {bid.quantity = }")
-    cycle = await cycle_dao.get_current()
-    market_names = await get_market_names(market_dao)
-    price = await price_dao.get(cycle=cycle.id, market=bid.market)
-    theta = await theta_dao.get(user=user.id, cycle=cycle.id, market=bid.market)
-    cost = production_cost(theta=theta, price=price.buy, quantity=bid.quantity)
-    if not await check_balance(cycle=cycle.id, user=user.id, amount=cost, balance_dao=balance_dao):
-        raise HTTPException(status_code=400, detail="Not enough money for production")
-    await transaction_dao.create(
-        cycle=cycle.id,
-        user=user.id,
-        amount=-cost,
-        description=f"Production cost of {bid.quantity} items of {market_names[bid.market]}",
-    )
-    await dao.create(cycle=cycle.id, user=user.id, market=bid.market, quantity=bid.quantity)
+    bids = [
+        UserBid(kind=BidKind.production, user=user.id, market=order.market, quantity=order.quantity)
+        for order in batch.orders
+    ]
+    batch_result = BatchResult.from_receipt(batch, await queue.submit_many(bids, atomic=batch.atomic))
+    if not batch_result.committed:
+        raise HTTPException(status_code=400, detail=batch_result.dict())
+    if any(order.accepted for order in batch_result.orders):
+        delta = {"delta": batch_result.delta}
+        bus.publish(GameEvent(type=EventType.balance, cycle=batch_result.cycle, user=user.id, data=delta))
+    return batch_result
@@ -0,0 +1,68 @@
+from pydantic import BaseModel
+
+from egame179_backend.bid_queue import BatchReceipt
+from egame179_backend.engine.bids import BidError
+
+
+class BidOrder(BaseModel):
+    """Bid order for one market."""
+
+    market: int
+    quantity: int
+
+
+class BidBatch(BaseModel):
+    """Bid orders for several markets.
+
+    Atomic batch is written only if all orders are accepted, otherwise accepted orders are written (best effort).
+    """
+
+    orders: list[BidOrder]
+    atomic: bool = True
+
+
+class OrderResult(BaseModel):
+    """Bid order result."""
+
+    market: int
+    quantity: int
+    accepted: bool
+    delta: float = 0  # user balance change
+    error: str | None = None
+
+
+class BatchResult(BaseModel):
+    """Bid orders batch result."""
+
+    cycle: int
+    committed: bool
+    orders: list[OrderResult]
+
+    @classmethod
+    def from_receipt(cls, batch: BidBatch, receipt: BatchReceipt) -> "BatchResult":
+        """Make result of processed batch.
+
+        Args:
+            batch (BidBatch): bid orders.
+            receipt (BatchReceipt): bid queue receipt.
+
+        Returns:
+            BatchResult: orders results, orders of rejected atomic batch are not accepted.
+        """
+        orders = []
+        for order, bid_result in zip(batch.orders, receipt.results):
+            if isinstance(bid_result, BidError):
+                orders.append(OrderResult(**order.dict(), accepted=False, error=str(bid_result)))
+            else:
+                delta = bid_result if receipt.committed else 0
+                orders.append(OrderResult(**order.dict(), accepted=receipt.committed, delta=delta))
+        return cls(cycle=receipt.cycle, committed=receipt.committed, orders=orders)
+
+    @property
+    def delta(self) -> float:
+        """User balance change by accepted orders.
+
+        Returns:
+            float: sum of accepted orders balance changes.
+        """
+        return sum(order.delta for order in self.orders if order.accepted)
@@ -0,0 +1,184 @@
+import asyncio
+import hashlib
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request, Security
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, parse_obj_as
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from egame179_backend import db
+from egame179_backend.api import (
+    balance,
+    market,
+    market_price,
+    modificators,
+    monitoring,
+    production,
+    stocks,
+    supply,
+    transaction,
+    warehouse,
+)
+from egame179_backend.api.auth import views as auth_views
+from egame179_backend.api.auth.dependencies import get_current_user
+from egame179_backend.db.user import User
+
+MAX_CONCURRENT_SECTIONS = 4  # sections are read in own sessions, i.e. take pool connections
+
+router = APIRouter()
+
+Section = Callable[[AsyncSession], Awaitable[Any]]
+
+
+class GameState(BaseModel):
+    """Game state sections, requested by client."""
+
+    versions: dict[str, str]  # {section: content hash} of all requested sections
+    sections: dict[str, Any]  # requested sections, except ones with versions known to client
+
+
+@router.get("/player/state", response_model=GameState)
+async def get_player_state(
+    request: Request,
+    user: User = Security(get_current_user, scopes=["player"]),
+    sections: list[str] | None = Query(None),
+    known: list[str] = Query([]),
+) -> ORJSONResponse:
+    """Get player game state in one response: the same data as separate player endpoints.
+
+    Args:
+        request (Request): current request.
+        user (User): authenticated user data.
+        sections (list[str], optional): requested sections, all if not set.
+        known (list[str]): `section:version` of sections cached by client, they are not sent if unchanged.
+
+    Returns:
+        ORJSONResponse: game state sections (`GameState` schema).
+    """
+    return await _get_state(request, _player_sections(user), sections, known)
+
+
+@router.get("/root/state", response_model=GameState, dependencies=[Security(get_current_user, scopes=["root"])])
+async def get_root_state(
+    request: Request,
+    sections: list[str] | None = Query(None),
+    known: list[str] = Query([]),
+) -> ORJSONResponse:
+    """Get root game state in one response: the same data as separate root endpoints.
+
+    Args:
+        request (Request): current request.
+        sections (list[str], optional): requested sections, all if not set.
+        known (list[str]): `section:version` of sections cached by client, they are not sent if unchanged.
+
+    Returns:
+        ORJSONResponse: game state sections (`GameState` schema).
+    """
+    return await _get_state(request, _root_sections(), sections, known)
+
+
+def _common_sections() -> dict[str, Section]:
+    return {
+        "cycle": lambda session: db.CycleDAO(session).get_current(),
+        "names": lambda session: auth_views.get_names(dao=db.UserDAO(session)),
+        "players": lambda session: auth_views.get_players(dao=db.UserDAO(session)),
+        "markets": lambda session: market.get_market_nodes(dao=db.MarketDAO(session)),
+        "edges": lambda session: market.get_market_edges(dao=db.MarketDAO(session)),
+        "prices": lambda session: market_price.get_market_prices(dao=db.MarketPriceDAO(session)),
+        "demand_factors": lambda session: market.get_demand_factors(
+            dao=db.WorldDemandDAO(session),
+            cycle_dao=db.CycleDAO(session),
+            market_dao=db.MarketDAO(session),
+        ),
+        "stocks": _stocks,
+    }
+
+
+def _player_sections(user: User) -> dict[str, Section]:  # noqa: WPS210
+    def with_user(route: Callable[..., Awaitable[Any]], **daos: type) -> Section:  # noqa: WPS430
+        return lambda session: route(user=user, **{arg: dao(session) for arg, dao in daos.items()})
+
+    return {
+        **_common_sections(),
+        "modificators": with_user(modificators.get_user_modificators, dao=db.FeeModificatorDAO, cycle_dao=db.CycleDAO),
+        "balances": with_user(balance.get_user_balances, dao=db.BalanceDAO),
+        "transactions": with_user(transaction.get_user_transactions, dao=db.TransactionDAO),
+        "unlocked_markets": with_user(market.get_user_unlocked_markets, dao=db.MarketDAO, cycle_dao=db.CycleDAO),
+        "production": with_user(production.get_user_production, dao=db.ProductionDAO),
+        "thetas": with_user(production.get_user_thetas, dao=db.ThetaDAO),
+        "storage": with_user(warehouse.get_user_warehouses, dao=db.WarehouseDAO, cycle_dao=db.CycleDAO),
+        "shares": with_user(market.get_user_market_shares, dao=db.MarketDAO, cycle_dao=db.CycleDAO),
+        "supplies": with_user(
+            supply.get_user_supply_projections,
+            dao=db.SupplyDAO,
+            cycle_dao=db.CycleDAO,
+            market_dao=db.MarketDAO,
+            wd_dao=db.WorldDemandDAO,
+        ),
+    }
+
+
+def _root_sections() -> dict[str, Section]:
+    return {
+        **_common_sections(),
+        "sync_status": lambda session: monitoring.get_sync_status(dao=db.SyncStatusDAO(session)),
+        "modificators": lambda session: modificators.get_modificators(
+            dao=db.FeeModificatorDAO(session),
+            cycle_dao=db.CycleDAO(session),
+        ),
+        "balances": lambda session: balance.get_balances(dao=db.BalanceDAO(session)),
+        "transactions": lambda session: transaction.get_transactions(dao=db.TransactionDAO(session)),
+        "production": lambda session: production.get_production(dao=db.ProductionDAO(session)),
+        "thetas": lambda session: production.get_thetas(dao=db.ThetaDAO(session)),
+        "storage": lambda session: warehouse.get_warehouses(dao=db.WarehouseDAO(session)),
+        "shares": _root_shares,
+        "supplies": lambda session: supply.get_supply_projections(
+            dao=db.SupplyDAO(session),
+            cycle_dao=db.CycleDAO(session),
+            market_dao=db.MarketDAO(session),
+            wd_dao=db.WorldDemandDAO(session),
+        ),
+    }
+
+
+async def _stocks(session: AsyncSession) -> list[stocks.StockPrice]:
+    return parse_obj_as(list[stocks.StockPrice], await stocks.get_stocks(dao=db.StockDAO(session)))
+
+
+async def _root_shares(session: AsyncSession) -> list[market.MarketSharePlayer]:
+    shares = await market.get_market_shares(dao=db.MarketDAO(session), cycle_dao=db.CycleDAO(session))
+    return parse_obj_as(list[market.MarketSharePlayer], shares)
+
+
+async def _get_state(
+    request: Request,
+    all_sections: dict[str, Section],
+    sections: list[str] | None,
+    known: list[str],
+) -> ORJSONResponse:
+    # sections are already encoded, so the response is serialized by orjson without pydantic validation
+    unknown = set(sections or ()) - all_sections.keys()
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown state sections: {sorted(unknown)}")
+    requested = all_sections if sections is None else {name: all_sections[name] for name in sections}
+    known_versions = dict(version.split(":", 1) for version in known if ":" in version)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SECTIONS)
+    session_factory = request.app.state.db_session_factory
+
+    async def read(section: Section) -> Any:  # noqa: WPS430
+        async with semaphore, session_factory() as session:
+            return jsonable_encoder(await section(session))
+
+    contents = await asyncio.gather(*[read(section) for section in requested.values()])
+    versions: dict[str, str] = {}
+    state_sections: dict[str, Any] = {}
+    for name, content in zip(requested, contents):
+        serialized = orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS)
+        versions[name] = hashlib.sha1(serialized).hexdigest()[:16]  # noqa: S303, S324, WPS432
+        if known_versions.get(name) != versions[name]:
+            state_sections[name] = content
+    return ORJSONResponse({"versions": versions, "sections": state_sections})
@@ -15,13 +15,14 @@ class StockPrice(BaseModel):
 
 
 @router.get("/list", response_model=list[StockPrice])
-async def get_stocks(dao: StockDAO = Depends()) -> list[Stock]:
+async def get_stocks(dao: StockDAO = Depends(), since_cycle: int | None = None) -> list[Stock]:
     """Get stocks.
 
     Args:
         dao (StockDAO): stocks table data access object.
+        since_cycle (int, optional): return only records of this & later cycles (earlier are known to client).
 
     Returns:
         list[Stock]: stocks history.
     """
-    return await dao.select()
+    return await dao.select(since_cycle=since_cycle)
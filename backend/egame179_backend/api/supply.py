@@ -4,20 +4,15 @@ from fastapi import APIRouter, Depends, HTTPException, Security
 from pydantic import BaseModel
 
 from egame179_backend.api.auth.dependencies import get_current_user
-from egame179_backend.db import (
-    BulletinDAO,
-    CycleDAO,
-    FeeModificatorDAO,
-    MarketDAO,
-    TransactionDAO,
-    UserDAO,
-    WarehouseDAO,
-    WorldDemandDAO,
-)
+from egame179_backend.api.schema import BatchResult, BidBatch
+from egame179_backend.bid_queue import BidQueue, get_bid_queue
+from egame179_backend.db import CycleDAO, MarketDAO, WorldDemandDAO
 from egame179_backend.db.supply import Supply, SupplyDAO
 from egame179_backend.db.user import User
-from egame179_backend.engine.math import bulletin_quantity, delivered_items
-from egame179_backend.engine.utility import check_storage, get_fee_mods, get_market_names, get_supply_velocities
+from egame179_backend.engine.bids import BidError, BidKind, UserBid
+from egame179_backend.engine.math import delivered_items, full_delivery_ts
+from egame179_backend.engine.utility import get_supply_velocities
+from egame179_backend.events import EventBus, EventType, GameEvent, get_event_bus
 
 router = APIRouter()
 
@@ -29,6 +24,25 @@ class SupplyBid(BaseModel):
     quantity: int
 
 
+class SupplyProjection(BaseModel):
+    """Supply with delivery parameters.
+
+    Until supply is finished, `delivered = min(quantity, floor(velocity * seconds since ts_start))`.
+    """
+
+    id: int
+    ts_start: datetime
+    ts_finish: datetime | None
+    cycle: int
+    user: int
+    market: int
+    quantity: int
+    delivered: int
+    sold: int
+    velocity: float  # items per second
+    ts_full_delivery: datetime | None  # None for zero velocity
+
+
 @router.get("/list")
 async def get_user_supplies(
     user: User = Depends(get_current_user),
@@ -101,55 +115,141 @@ async def get_all_supplies(
     return supplies
 
 
-@router.post("/new")
-async def make_supply(  # noqa: WPS217
-    bid: SupplyBid,
+@router.get("/projection")
+async def get_user_supply_projections(
     user: User = Depends(get_current_user),
     dao: SupplyDAO = Depends(),
-    bulletin_dao: BulletinDAO = Depends(),
     cycle_dao: CycleDAO = Depends(),
     market_dao: MarketDAO = Depends(),
-    mod_dao: FeeModificatorDAO = Depends(),
-    transaction_dao: TransactionDAO = Depends(),
-    user_dao: UserDAO = Depends(),
-    wh_dao: WarehouseDAO = Depends(),
+    wd_dao: WorldDemandDAO = Depends(),
+) -> list[SupplyProjection]:
+    """Get current supplies for user with delivery parameters, to compute delivered items on client.
+
+    Args:
+        user (User): authenticated user data.
+        dao (SupplyDAO): supplies table data access object.
+        cycle_dao (CycleDAO): cycle table data access object.
+        market_dao (MarketDAO): market table data access object.
+        wd_dao (WorldDemandDAO): world_demand table DAO.
+
+    Returns:
+        list[SupplyProjection]: current supplies for user.
+    """
+    return await _get_projections(user.id, dao, cycle_dao, market_dao, wd_dao)
+
+
+@router.get("/projection/all", dependencies=[Security(get_current_user, scopes=["root"])])
+async def get_supply_projections(
+    dao: SupplyDAO = Depends(),
+    cycle_dao: CycleDAO = Depends(),
+    market_dao: MarketDAO = Depends(),
+    wd_dao: WorldDemandDAO = Depends(),
+) -> list[SupplyProjection]:
+    """Get current supplies for all users with delivery parameters, to compute delivered items on client.
+
+    Args:
+        dao (SupplyDAO): supplies table data access object.
+        cycle_dao (CycleDAO): cycle table data access object.
+        market_dao (MarketDAO): market table data access object.
+        wd_dao (WorldDemandDAO): world_demand table DAO.
+
+    Returns:
+        list[SupplyProjection]: current supplies for all users.
+    """
+    return await _get_projections(None, dao, cycle_dao, market_dao, wd_dao)
+
+
+@router.post("/new")
+async def new_supply(
+    bid: SupplyBid,
+    user: User = Depends(get_current_user),
+    queue: BidQueue = Depends(get_bid_queue),
+    bus: EventBus = Depends(get_event_bus),
 ) -> None:
     """Make supply route.
 
+    The bid is written together with concurrent bids of other users (see `BidQueue`).
+
     Args:
         bid (SupplyBid): supply bid.
         user (User): auth user.
-        dao (SupplyDAO): supplies table data access object.
-        bulletin_dao (BulletinDAO): bulletins table DAO.
-        cycle_dao (CycleDAO): cycle table data access object.
-        market_dao (MarketDAO): markets table DAO.
-        mod_dao (FeeModificatorDAO): fee_modificators table DAO.
-        transaction_dao (TransactionDAO): transactions table DAO.
-        user_dao (UserDAO): users table DAO.
-        wh_dao (WarehouseDAO): warehouses table DAO.
+        queue (BidQueue): application bid queue.
+        bus (EventBus): application event bus.
+
+    Raises:
+        HTTPException: quantity <= 0 or warehouse < quantity.
+    """
+    try:
+        receipt = await queue.submit(
+            UserBid(kind=BidKind.supply, user=user.id, market=bid.market, quantity=bid.quantity),
+        )
+    except BidError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    supply = {"market": bid.market, "quantity": bid.quantity}
+    bus.publish(GameEvent(type=EventType.supply, cycle=receipt.cycle, user=user.id, data=supply))
+    bus.publish(GameEvent(type=EventType.balance, cycle=receipt.cycle, user=user.id, data={"delta": receipt.delta}))
+    bus.publish(GameEvent(type=EventType.bulletin, cycle=receipt.cycle))
+
+
+@router.post("/batch")
+async def new_supply_batch(
+    batch: BidBatch,
+    user: User = Depends(get_current_user),
+    queue: BidQueue = Depends(get_bid_queue),
+    bus: EventBus = Depends(get_event_bus),
+) -> BatchResult:
+    """Make supplies on several markets route.
+
+    Orders are checked in order against one warehouses read & written in one transaction.
+
+    Args:
+        batch (BidBatch): supply orders.
+        user (User): auth user.
+        queue (BidQueue): application bid queue.
+        bus (EventBus): application event bus.
 
     Raises:
-        HTTPException: quantity <= 0.
-        HTTPException: warehouse < quantity.
+        HTTPException: atomic batch has rejected orders (detail is batch result).
+
+    Returns:
+        BatchResult: result of each order.
     """
-    if bid.quantity <= 0:
-        raise HTTPException(status_code=400, detail=f"Incorrect {bid.quantity = }")
+    bids = [
+        UserBid(kind=BidKind.supply, user=user.id, market=order.market, quantity=order.quantity)
+        for order in batch.orders
+    ]
+    batch_result = BatchResult.from_receipt(batch, await queue.submit_many(bids, atomic=batch.atomic))
+    if not batch_result.committed:
+        raise HTTPException(status_code=400, detail=batch_result.dict())
+    accepted = [order for order in batch_result.orders if order.accepted]
+    if not accepted:
+        return batch_result
+    cycle = batch_result.cycle
+    for order in accepted:
+        supply = {"market": order.market, "quantity": order.quantity}
+        bus.publish(GameEvent(type=EventType.supply, cycle=cycle, user=user.id, data=supply))
+    bus.publish(GameEvent(type=EventType.balance, cycle=cycle, user=user.id, data={"delta": batch_result.delta}))
+    bus.publish(GameEvent(type=EventType.bulletin, cycle=cycle))
+    return batch_result
+
+
+async def _get_projections(
+    user: int | None,
+    dao: SupplyDAO,
+    cycle_dao: CycleDAO,
+    market_dao: MarketDAO,
+    wd_dao: WorldDemandDAO,
+) -> list[SupplyProjection]:
     cycle = await cycle_dao.get_current()
-    market_names = await get_market_names(market_dao)
-    user_names = await user_dao.get_names()
-    fee_mods = await get_fee_mods(cycle=cycle.id, fee="beta", mod_dao=mod_dao)
-    if not await check_storage(cycle=cycle.id, user=user.id, market=bid.market, quantity=bid.quantity, wh_dao=wh_dao):
-        raise HTTPException(status_code=400, detail="Not enough items in warehouse for supply")
-    await transaction_dao.create(
-        cycle=cycle.id,
-        user=user.id,
-        amount=-cycle.beta * fee_mods.get(user.id, 1),
-        description=f"Fee for supply operations ({cycle.beta} x {fee_mods.get(user.id, 1)})",
-    )
-    await dao.create(cycle=cycle.id, user=user.id, market=bid.market, quantity=bid.quantity)
-    await bulletin_dao.create(
-        cycle=cycle.id,
-        user=user_names[user.id],
-        market=market_names[bid.market],
-        quantity=bulletin_quantity(bid.quantity),
-    )
+    # If cycle is not started yet, get supplies from previous cycle
+    target_cycle = cycle.id if cycle.ts_start is not None else cycle.id - 1
+    supplies = await dao.select(cycle=target_cycle, user=user)
+    velocities = await get_supply_velocities(market_dao=market_dao, wd_dao=wd_dao, cycle=cycle.id, tau_s=cycle.tau_s)
+    return [
+        SupplyProjection(
+            **supply.dict(),
+            velocity=velocities[supply.market],
+            ts_full_delivery=full_delivery_ts(supply.ts_start, velocities[supply.market], supply.quantity),
+        )
+        for supply in supplies
+    ]
@@ -11,27 +11,32 @@ router = APIRouter()
 async def get_user_transactions(
     user: User = Depends(get_current_user),
     dao: TransactionDAO = Depends(),
+    since_id: int | None = None,
 ) -> list[Transaction]:
     """Get transactions history for user.
 
     Args:
         user (User): authenticated user data.
         dao (TransactionDAO): transactions table data access object.
+        since_id (int, optional): return only records after this id (already known to client),
+            records of its cycle are returned again as they may be committed out of id order.
 
     Returns:
         list[Transaction]: transactions history for user.
     """
-    return await dao.select(user.id)
+    return await dao.select(user.id, since_id=since_id, with_archive=True)
 
 
 @router.get("/list/all", dependencies=[Security(get_current_user, scopes=["root"])])
-async def get_transactions(dao: TransactionDAO = Depends()) -> list[Transaction]:
+async def get_transactions(dao: TransactionDAO = Depends(), since_id: int | None = None) -> list[Transaction]:
     """Get transactions history.
 
     Args:
         dao (TransactionDAO): transactions table data access object.
+        since_id (int, optional): return only records after this id (already known to client),
+            records of its cycle are returned again as they may be committed out of id order.
 
     Returns:
         list[Transaction]: transactions history.
     """
-    return await dao.select()
+    return await dao.select(since_id=since_id, with_archive=True)
@@ -3,7 +3,7 @@ from fastapi import APIRouter, Depends, Security
 from egame179_backend.api.auth.dependencies import get_current_user
 from egame179_backend.db import CycleDAO
 from egame179_backend.db.user import User
-from egame179_backend.db.warehouse import Warehouse, WarehouseDAO
+from egame179_backend.db.warehouse import Inventory, InventoryDiff, WarehouseDAO
 
 router = APIRouter()
 
@@ -13,7 +13,7 @@ async def get_user_warehouses(
     user: User = Depends(get_current_user),
     dao: WarehouseDAO = Depends(),
     cycle_dao: CycleDAO = Depends(),
-) -> list[Warehouse]:
+) -> list[Inventory]:
     """Get warehouses for user.
 
     Args:
@@ -22,20 +22,43 @@ async def get_user_warehouses(
         cycle_dao (CycleDAO): cycles table data access object.
 
     Returns:
-        list[Warehouse]: warehouses status for user.
+        list[Inventory]: warehouses status for user.
     """
     cycle = await cycle_dao.get_current()
     return await dao.select(cycle=cycle.id, user=user.id)
 
 
 @router.get("/list/all", dependencies=[Security(get_current_user, scopes=["root"])])
-async def get_warehouses(dao: WarehouseDAO = Depends()) -> list[Warehouse]:
+async def get_warehouses(dao: WarehouseDAO = Depends()) -> list[Inventory]:
     """Get warehouse history for all users.
 
     Args:
         dao (WarehouseDAO): warehouses table data access object.
 
     Returns:
-        list[Warehouse]: warehouses history for all users.
+        list[Inventory]: warehouses history for all users.
     """
     return await dao.select()
+
+
+@router.get("/verify", dependencies=[Security(get_current_user, scopes=["root"])])
+async def verify_warehouses(dao: WarehouseDAO = Depends()) -> list[InventoryDiff]:
+    """Compare inventory table with warehouses calculated from production & supplies logs.
+
+    Args:
+        dao (WarehouseDAO): warehouses table data access object.
+
+    Returns:
+        list[InventoryDiff]: mismatched records (empty if inventory is consistent).
+    """
+    return await dao.verify()
+
+
+@router.post("/rebuild", dependencies=[Security(get_current_user, scopes=["root"])])
+async def rebuild_warehouses(dao: WarehouseDAO = Depends()) -> None:
+    """Rebuild inventory table from production & supplies logs.
+
+    Args:
+        dao (WarehouseDAO): warehouses table data access object.
+    """
+    await dao.rebuild()
@@ -4,7 +4,12 @@ from fastapi import FastAPI
 from fastapi.responses import ORJSONResponse
 
 from egame179_backend.api import api_router
+from egame179_backend.api.auth.token_cache import TokenCache
+from egame179_backend.bid_queue import BidQueue
+from egame179_backend.events import EventBus
 from egame179_backend.lifetime import shutdown, startup
+from egame179_backend.response_cache import ResponseCacheMiddleware
+from egame179_backend.settings import settings
 
 
 def get_app() -> FastAPI:
@@ -23,7 +28,18 @@ def get_app() -> FastAPI:
         openapi_url="/api/openapi.json",
         default_response_class=ORJSONResponse,
     )
+    app.state.event_bus = EventBus()
+    app.state.token_cache = TokenCache(maxsize=settings.token_cache_size)
+    app.state.bid_queue = BidQueue(
+        session_factory=lambda: app.state.db_session_factory(),  # the factory is created on startup
+        window=settings.bid_batch_window,
+        max_batch=settings.bid_batch_size,
+        writers=settings.bid_writers,
+        lock_stripes=settings.bid_lock_stripes,
+    )
     app.on_event("startup")(startup(app))
     app.on_event("shutdown")(shutdown(app))
     app.include_router(api_router, prefix="/api")
+    if settings.response_cache_size and settings.workers_count == 1:  # game state version is process-local
+        app.add_middleware(ResponseCacheMiddleware, maxsize=settings.response_cache_size)
     return app
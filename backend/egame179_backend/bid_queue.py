@@ -0,0 +1,334 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.requests import Request
+
+from egame179_backend import db
+from egame179_backend.db.cycle import Cycle
+from egame179_backend.db.session import single_transaction
+from egame179_backend.engine.bids import BidError, UserBid, make_bids
+
+
+@dataclass(frozen=True)
+class BidReceipt:
+    """Accepted bid."""
+
+    cycle: int
+    delta: float  # user balance change
+
+
+@dataclass(frozen=True)
+class BatchReceipt:
+    """Processed bids batch."""
+
+    cycle: int
+    results: list[float | BidError]  # user balance change for accepted bid or rejection reason, for each bid
+    committed: bool  # False if atomic batch is rejected
+
+
+@dataclass
+class _Submission:
+    bids: list[UserBid]
+    atomic: bool
+    future: asyncio.Future[BatchReceipt]
+
+
+class UserLocks:
+    """Striped per-user async locks: bids of the same user are serialized, bids of other users are not blocked.
+
+    Users share a lock, if their ids fall into the same stripe. Locks are process-local.
+    """
+
+    def __init__(self, stripes: int = 64):
+        """Create unlocked stripes.
+
+        Args:
+            stripes (int): number of locks.
+        """
+        self.waits = 0  # acquisitions, blocked by other holders
+        self._locks = [asyncio.Lock() for _ in range(stripes)]
+
+    @asynccontextmanager
+    async def hold(self, users: Iterable[int]) -> AsyncIterator[None]:
+        """Hold locks of all users, acquired in stripes order to avoid deadlocks.
+
+        Args:
+            users (Iterable[int]): user ids.
+
+        Yields:
+            None: block, where balances & warehouses of the users are changed only by the holder.
+        """
+        async with AsyncExitStack() as stack:
+            for stripe in sorted({user % len(self._locks) for user in users}):
+                lock = self._locks[stripe]
+                if lock.locked():
+                    self.waits += 1
+                await stack.enter_async_context(lock)
+            yield
+
+
+class BidQueue:
+    """Group commit of concurrent bids.
+
+    Bids are collected for `window` seconds after the first one (and while all writers are busy),
+    checked against a consistent balances & warehouses view and written in a single transaction (see `make_bids`).
+    Up to `writers` batches are written concurrently: a batch holds locks of its users (see `UserLocks`),
+    so balances & warehouses it checked can't be changed before its commit, while batches of other users proceed.
+    Each caller gets its own receipt or `BidError`. The queue is process-local, as other application state.
+    """
+
+    def __init__(  # noqa: WPS211
+        self,
+        session_factory: Callable[[], AsyncSession],
+        window: float = 0.005,
+        max_batch: int = 100,
+        writers: int = 4,
+        lock_stripes: int = 64,
+    ):
+        """Create idle queue, its worker is started by the first bid.
+
+        Args:
+            session_factory (Callable[[], AsyncSession]): database sessions factory.
+            window (float): seconds to wait for other bids after the first one, 0 - don't wait.
+            max_batch (int): max number of submissions written together.
+            writers (int): max number of batches written concurrently.
+            lock_stripes (int): number of user locks.
+        """
+        self.session_factory = session_factory
+        self.window = window
+        self.max_batch = max_batch
+        self.writers = writers
+        self.lock_stripes = lock_stripes
+        self.batches = 0
+        self.bids = 0
+        self.max_batch_seen = 0
+        self._queue: asyncio.Queue[_Submission] | None = None
+        self._worker: asyncio.Task[None] | None = None
+        self._locks = UserLocks(stripes=lock_stripes)
+        self._writes: set[asyncio.Task[None]] = set()
+
+    async def submit(self, bid: UserBid) -> BidReceipt:
+        """Queue bid & wait until its batch is written.
+
+        Args:
+            bid (UserBid): user bid.
+
+        Returns:
+            BidReceipt: cycle & user balance change of accepted bid.
+
+        Raises:
+            BidError: bid is rejected (incorrect quantity, not enough money or items).
+        """
+        receipt = await self.submit_many([bid])
+        bid_result = receipt.results[0]
+        if isinstance(bid_result, BidError):
+            raise bid_result
+        return BidReceipt(cycle=receipt.cycle, delta=bid_result)
+
+    async def submit_many(self, bids: list[UserBid], atomic: bool = False) -> BatchReceipt:
+        """Queue several bids & wait until they are written.
+
+        Bids are checked in order, so later bids see changes by earlier accepted ones.
+
+        Args:
+            bids (list[UserBid]): user bids.
+            atomic (bool): if True, bids are written only if all of them are accepted.
+
+        Returns:
+            BatchReceipt: cycle & result of each bid.
+        """
+        queue = self._start()
+        future: asyncio.Future[BatchReceipt] = asyncio.get_running_loop().create_future()
+        queue.put_nowait(_Submission(bids=bids, atomic=atomic, future=future))
+        return await future
+
+    @asynccontextmanager
+    async def paused(self) -> AsyncIterator[None]:
+        """Close bid admission: batches being written are committed first, other batches wait until the block exits.
+
+        Bids are still queued, they are written after the block with the cycle current at that time.
+
+        Yields:
+            None: block, where no bid is written.
+        """
+        self._start()
+        async with self._locks.hold(range(self.lock_stripes)):
+            yield
+
+    async def close(self) -> None:
+        """Stop worker, bids of unfinished batch are rejected with cancellation."""
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+        self._queue = None
+        self._worker = None
+
+    def stats(self) -> dict[str, Any]:
+        """Get queue statistics.
+
+        Returns:
+            dict[str, Any]: written batches & bids count, max batch size, current queue length & settings.
+        """
+        return {
+            "batches": self.batches,
+            "bids": self.bids,
+            "avg_batch": self.bids / self.batches if self.batches else 0,
+            "max_batch": self.max_batch_seen,
+            "queued": 0 if self._queue is None else self._queue.qsize(),
+            "writing": len(self._writes),
+            "lock_waits": self._locks.waits,
+            "window": self.window,
+            "batch_limit": self.max_batch,
+            "writers": self.writers,
+        }
+
+    def _start(self) -> asyncio.Queue[_Submission]:
+        if self._queue is None or self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._locks = UserLocks(stripes=self.lock_stripes)  # asyncio primitives are bound to the running loop
+            self._worker = asyncio.create_task(self._run(self._queue))
+        return self._queue
+
+    async def _run(self, queue: asyncio.Queue[_Submission]) -> None:
+        slots = asyncio.Semaphore(self.writers)
+        first: _Submission | None = None
+        try:
+            while True:  # noqa: WPS457
+                first = await queue.get()
+                await slots.acquire()
+                batch = await self._collect(queue, first)
+                first = None
+                write = asyncio.create_task(self._write_locked(batch, slots))
+                self._writes.add(write)
+                write.add_done_callback(self._writes.discard)
+        except asyncio.CancelledError:
+            if first is not None:
+                first.future.cancel()
+            for write_task in self._writes:
+                write_task.cancel()
+            await asyncio.gather(*self._writes, return_exceptions=True)
+            raise
+
+    async def _collect(self, queue: asyncio.Queue[_Submission], first: _Submission) -> list[_Submission]:
+        # the first submission, submissions queued while writers were busy & within the window, up to the limit
+        deadline = asyncio.get_running_loop().time() + self.window
+        batch = [first]
+        try:
+            while len(batch) < self.max_batch:
+                batch.append(await _get_before(queue, deadline))
+        except asyncio.TimeoutError:
+            return batch
+        except asyncio.CancelledError:
+            _cancel(batch[1:])  # the first one is cancelled by the caller
+            raise
+        return batch
+
+    async def _write_locked(self, batch: list[_Submission], slots: asyncio.Semaphore) -> None:
+        batch = [submission for submission in batch if not submission.future.done()]
+        try:
+            async with self._locks.hold(bid.user for submission in batch for bid in submission.bids):
+                await self._write(batch)
+        except asyncio.CancelledError:
+            _cancel(batch)
+            raise
+        finally:
+            slots.release()
+
+    async def _write(self, batch: list[_Submission]) -> None:
+        if not batch:
+            return
+        # best-effort bids of all submissions are checked & written together, atomic groups one by one after them
+        batch = sorted(batch, key=lambda submission: submission.atomic)
+        try:
+            async with self.session_factory() as session:
+                async with single_transaction(session):
+                    cycle = await db.CycleDAO(session).get_current()
+                    batch_results = await self._make_batch_bids(session, cycle, batch)
+        except Exception as exc:  # the whole batch is rolled back, callers get the error
+            for failed in batch:
+                if not failed.future.done():
+                    failed.future.set_exception(exc)
+            return
+        self._resolve(batch, batch_results, cycle)
+
+    async def _make_batch_bids(
+        self,
+        session: AsyncSession,
+        cycle: Cycle,
+        batch: list[_Submission],
+    ) -> list[list[float | BidError]]:
+        shared = [submission for submission in batch if not submission.atomic]
+        shared_results = await self._make_bids(session, cycle, shared, atomic=False)
+        batch_results = []
+        for submission in shared:
+            batch_results.append(shared_results[: len(submission.bids)])
+            shared_results = shared_results[len(submission.bids) :]
+        for group in batch[len(shared) :]:
+            batch_results.append(await self._make_bids(session, cycle, [group], atomic=True))  # noqa: WPS476
+        return batch_results
+
+    def _resolve(self, batch: list[_Submission], batch_results: list[list[float | BidError]], cycle: Cycle) -> None:
+        self.batches += 1
+        self.bids += sum(len(submission.bids) for submission in batch)
+        self.max_batch_seen = max(self.max_batch_seen, len(batch))
+        for written, bid_results in zip(batch, batch_results):
+            if not written.future.done():
+                committed = not written.atomic or not any(isinstance(res, BidError) for res in bid_results)
+                written.future.set_result(BatchReceipt(cycle=cycle.id, results=bid_results, committed=committed))
+
+    async def _make_bids(
+        self,
+        session: AsyncSession,
+        cycle: Cycle,
+        submissions: list[_Submission],
+        atomic: bool,
+    ) -> list[float | BidError]:
+        bids = [bid for submission in submissions for bid in submission.bids]
+        if not bids:
+            return []
+        return await make_bids(
+            cycle=cycle,
+            bids=bids,
+            balance_dao=db.BalanceDAO(session),
+            bulletin_dao=db.BulletinDAO(session),
+            market_dao=db.MarketDAO(session),
+            mod_dao=db.FeeModificatorDAO(session),
+            price_dao=db.MarketPriceDAO(session),
+            production_dao=db.ProductionDAO(session),
+            supply_dao=db.SupplyDAO(session),
+            theta_dao=db.ThetaDAO(session),
+            transaction_dao=db.TransactionDAO(session),
+            user_dao=db.UserDAO(session),
+            wh_dao=db.WarehouseDAO(session),
+            atomic=atomic,
+        )
+
+
+async def _get_before(queue: asyncio.Queue[_Submission], deadline: float) -> _Submission:
+    if not queue.empty():
+        return queue.get_nowait()
+    timeout = deadline - asyncio.get_running_loop().time()
+    if timeout <= 0:
+        raise asyncio.TimeoutError
+    return await asyncio.wait_for(queue.get(), timeout)
+
+
+def _cancel(batch: list[_Submission]) -> None:
+    for submission in batch:
+        submission.future.cancel()
+
+
+def get_bid_queue(request: Request) -> BidQueue:
+    """Get application bid queue.
+
+    Args:
+        request (Request): current request.
+
+    Returns:
+        BidQueue: bid queue.
+    """
+    return request.app.state.bid_queue
@@ -10,6 +10,7 @@ from egame179_backend.db.stocks import StockDAO
 from egame179_backend.db.supply import SupplyDAO
 from egame179_backend.db.sync_status import SyncStatusDAO
 from egame179_backend.db.theta import ThetaDAO
+from egame179_backend.db.token_revocation import TokenRevocationDAO
 from egame179_backend.db.transaction import TransactionDAO
 from egame179_backend.db.user import UserDAO
 from egame179_backend.db.warehouse import WarehouseDAO
@@ -27,6 +28,7 @@ __all__ = [
     "SupplyDAO",
     "SyncStatusDAO",
     "ThetaDAO",
+    "TokenRevocationDAO",
     "TransactionDAO",
     "UserDAO",
     "WarehouseDAO",
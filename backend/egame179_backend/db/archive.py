@@ -0,0 +1,32 @@
+from sqlalchemy import column, delete, insert, select, table
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from egame179_backend.db.bulletin import Bulletin
+from egame179_backend.db.production import Production
+from egame179_backend.db.supply import Supply
+from egame179_backend.db.transaction import Transaction
+
+ARCHIVED_MODELS: tuple[type[SQLModel], ...] = (Transaction, Production, Supply, Bulletin)  # per-cycle logs
+LIVE_CYCLES = 2  # finished cycles kept in live tables: cycle snapshot reads production of 2 previous cycles
+
+
+async def archive_closed_cycles(session: AsyncSession, finished_cycle: int) -> None:
+    """Move log records of closed cycles from live tables to `<table>_archive` tables.
+
+    Live tables keep the last finished cycles & the current one only, so their reads & writes
+    don't depend on the game length. Closed cycles state is kept by balances & inventory tables
+    (running totals on every cycle), archived records are read only for the whole history.
+    Changes are not committed.
+
+    Args:
+        session (AsyncSession): database session.
+        finished_cycle (int): the last finished cycle.
+    """
+    for model in ARCHIVED_MODELS:
+        live = model.__table__  # type: ignore
+        columns = live.columns.keys()
+        archive = table(f"{live.name}_archive", *[column(name) for name in columns])
+        closed = live.c.cycle <= finished_cycle - LIVE_CYCLES
+        await session.execute(insert(archive).from_select(columns, select(live).where(closed)))
+        await session.execute(delete(live).where(closed))
@@ -1,8 +1,35 @@
 from fastapi import Depends
+from sqlalchemy import delete, text
 from sqlmodel import Field, SQLModel, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from egame179_backend.db.session import get_db_session
+from egame179_backend.db.running import add_running_deltas, carry_forward_running
+from egame179_backend.db.session import commit, get_db_session
+
+# transactions ledger, including archived cycles
+LEDGER_SQL = """(
+    SELECT cycle, user, amount FROM transactions UNION ALL SELECT cycle, user, amount FROM transactions_archive
+)"""
+# running totals of the ledger, used for reconciliation;
+# balances are carried over to the next cycle of every finished cycle by cycles calendar
+LEDGER_BALANCES_SQL = f"""
+    SELECT
+        ts.cycle,
+        ts.user,
+        SUM(ts.delta) OVER (PARTITION BY ts.user ORDER BY ts.cycle) AS balance
+    FROM (
+        SELECT t.cycle, t.user, SUM(t.amount) AS delta
+        FROM (
+            SELECT l.cycle, l.user, l.amount FROM {LEDGER_SQL} AS l
+            UNION ALL
+            SELECT c.id + 1 AS cycle, u.user, 0 AS amount
+            FROM cycles c
+            JOIN (SELECT l.user, MIN(l.cycle) AS cycle FROM {LEDGER_SQL} AS l GROUP BY l.user) AS u ON u.cycle <= c.id
+            WHERE c.ts_finish IS NOT NULL
+        ) AS t
+        GROUP BY t.cycle, t.user
+    ) AS ts
+"""
 
 
 class Balance(SQLModel, table=True):
@@ -31,24 +58,61 @@ class BalanceDAO:
         Returns:
             float: target balance.
         """
-        query = select(Balance).where(Balance.cycle == cycle, Balance.user == user)
+        query = select(Balance.balance).where(Balance.cycle == cycle, Balance.user == user)
         raw_balance = await self.session.exec(query)  # type: ignore
-        return raw_balance.one().balance
+        return raw_balance.one()
 
-    async def select(self, cycle: int | None = None, user: int | None = None) -> list[Balance]:
+    async def select(
+        self,
+        cycle: int | None = None,
+        user: int | None = None,
+        since_cycle: int | None = None,
+    ) -> list[Balance]:
         """Get user balances.
 
         Args:
             cycle (int): target cycle. If None, all cycles return.
             user (int, optional): target user id. If None, all user balances return.
+            since_cycle (int, optional): return only balances of this & later cycles. If None, all cycles return.
 
         Returns:
             list[Balance]: users balances.
         """
-        query = select(Balance)
+        # balances are changed by bulk updates, so identity map objects can be stale
+        query = select(Balance).execution_options(populate_existing=True)
         if cycle is not None:
             query = query.where(Balance.cycle == cycle)
         if user is not None:
             query = query.where(Balance.user == user)
+        if since_cycle is not None:
+            query = query.where(Balance.cycle >= since_cycle)
         raw_balances = await self.session.exec(query)  # type: ignore
         return raw_balances.all()
+
+    async def add(self, deltas: dict[tuple[int, int], float]) -> None:
+        """Add transaction amounts to running balances.
+
+        Changes are not committed: caller commits them together with the transactions.
+
+        Args:
+            deltas (dict[tuple[int, int], float]): {(cycle, user): amount}.
+        """
+        await add_running_deltas(self.session, Balance, partition=("user",), value="balance", deltas=deltas)
+
+    async def carry_forward(self, cycle: int, users: list[int]) -> None:
+        """Carry user balances over to the next cycle.
+
+        Changes are not committed.
+
+        Args:
+            cycle (int): finished cycle.
+            users (list[int]): list of user ids.
+        """
+        keys = [(user,) for user in users]
+        await carry_forward_running(self.session, Balance, partition=("user",), value="balance", cycle=cycle, keys=keys)
+
+    async def rebuild(self) -> None:
+        """Rebuild balances from the transactions ledger."""
+        await self.session.execute(delete(Balance))
+        await self.session.execute(text(f"INSERT INTO balances (cycle, user, balance) {LEDGER_BALANCES_SQL}"))
+        await commit(self.session)
@@ -0,0 +1,46 @@
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import bindparam, insert, update
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+async def bulk_insert(session: AsyncSession, model: type[SQLModel], rows: list[dict[str, Any]]) -> None:
+    """Insert rows with a single multi-row INSERT ... VALUES statement.
+
+    Args:
+        session (AsyncSession): database session.
+        model (type[SQLModel]): target table model.
+        rows (list[dict[str, Any]]): rows to insert, all with the same columns.
+    """
+    if rows:
+        await session.execute(insert(model).values(rows))
+
+
+async def bulk_update(
+    session: AsyncSession,
+    records: Sequence[SQLModel],
+    keys: tuple[str, ...],
+    fields: tuple[str, ...],
+) -> None:
+    """Update records with a single executemany UPDATE statement.
+
+    Records are expunged from session afterwards, so they are not flushed again on commit.
+
+    Args:
+        session (AsyncSession): database session.
+        records (Sequence[SQLModel]): updated records of the same model.
+        keys (tuple[str, ...]): primary key columns names.
+        fields (tuple[str, ...]): updated columns names.
+    """
+    if not records:
+        return
+    table = type(records[0]).__table__  # type: ignore
+    query = update(table).where(*[table.c[key] == bindparam(f"b_{key}") for key in keys])
+    query = query.values({field: bindparam(f"b_{field}") for field in fields})
+    params = [{f"b_{name}": getattr(record, name) for name in keys + fields} for record in records]
+    await session.execute(query, params)
+    for record in records:
+        if record in session:
+            session.expunge(record)
@@ -5,7 +5,8 @@ from fastapi import Depends
 from sqlmodel import Field, SQLModel, col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from egame179_backend.db.session import get_db_session
+from egame179_backend.db.bulk import bulk_insert
+from egame179_backend.db.session import commit, get_db_session
 
 BULLETIN_TEMPLATES = (
     "Новая сделка на рынке <b>{market}</b>: корпорация <b>{user}</b> заключила контракт на продажу <b>{quantity}</b> товаров.",
@@ -23,6 +24,21 @@ BULLETIN_TEMPLATES = (
 )
 
 
+def bulletin_text(user: str, market: str, quantity: int) -> str:
+    """Format bulletin text with a random template.
+
+    Args:
+        user (str): bulletin user name.
+        market (str): bulletin market.
+        quantity (int): bulletin quantity (noised).
+
+    Returns:
+        str: bulletin text.
+    """
+    template = np.random.choice(BULLETIN_TEMPLATES)  # noqa: S311
+    return template.format(market=market, user=user, quantity=quantity)
+
+
 class Bulletin(SQLModel, table=True):
     """Bulletins table."""
 
@@ -62,7 +78,14 @@ class BulletinDAO:
             market (str): bulletin market.
             quantity (int): bulletin quantity (noised).
         """
-        template = np.random.choice(BULLETIN_TEMPLATES)  # noqa: S311
-        text = template.format(market=market, user=user, quantity=quantity)
-        self.session.add(Bulletin(ts=datetime.now(), cycle=cycle, text=text))
-        await self.session.commit()
+        self.session.add(Bulletin(ts=datetime.now(), cycle=cycle, text=bulletin_text(user, market, quantity)))
+        await commit(self.session)
+
+    async def add(self, bulletins: list[Bulletin]) -> None:
+        """Add information bulletins with a single multi-row INSERT.
+
+        Args:
+            bulletins (list[Bulletin]): new bulletins.
+        """
+        await bulk_insert(self.session, Bulletin, [bulletin.dict(exclude={"id"}) for bulletin in bulletins])
+        await commit(self.session)
@@ -0,0 +1,27 @@
+from typing import Any
+
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+async def since_id_filter(session: AsyncSession, model: type[SQLModel], since_id: int) -> Any:
+    """Get filter of log records after `since_id` cursor.
+
+    Log ids are allocated before commit, so concurrent writers may commit them out of order.
+    Records of the cursor's cycle are selected again (cycles are finished with bids closed,
+    so later ids are in the same or later cycles), clients merge them by id.
+    Cursor missing in the table is older than all its records (e.g. archived), then records after it are selected.
+
+    Args:
+        session (AsyncSession): database session.
+        model (type[SQLModel]): log table model with `id` & `cycle` columns.
+        since_id (int): the last record id known to client.
+
+    Returns:
+        Any: query where clause.
+    """
+    raw_cycle = await session.exec(select(model.cycle).where(model.id == since_id))  # type: ignore
+    cursor_cycle = raw_cycle.first()
+    if cursor_cycle is None:
+        return model.id > since_id  # type: ignore
+    return model.cycle >= cursor_cycle  # type: ignore
@@ -4,7 +4,7 @@ from fastapi import Depends
 from sqlmodel import Field, SQLModel, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from egame179_backend.db.session import get_db_session
+from egame179_backend.db.session import commit, get_db_session, invalidate, request_cached
 
 
 class Cycle(SQLModel, table=True):
@@ -31,6 +31,7 @@ class CycleDAO:
     def __init__(self, session: AsyncSession = Depends(get_db_session)):
         self.session = session
 
+    @request_cached("cycles")
     async def get_current(self) -> Cycle:
         """Get current cycle.
 
@@ -42,12 +43,26 @@ class CycleDAO:
         raw_cycle = await self.session.exec(query)  # type: ignore
         return raw_cycle.one()
 
+    async def count(self, first: int, last: int) -> int:
+        """Count existing cycles in the range.
+
+        Args:
+            first (int): first cycle id.
+            last (int): last cycle id (inclusive).
+
+        Returns:
+            int: number of cycles.
+        """
+        query = select(Cycle.id).where(Cycle.id >= first, Cycle.id <= last)
+        raw_ids = await self.session.exec(query)  # type: ignore
+        return len(raw_ids.all())
+
     async def start(self) -> None:
         """Start current cycle."""
         cycle = await self.get_current()
         cycle.ts_start = datetime.now()
         self.session.add(cycle)
-        await self.session.commit()
+        await commit(self.session)
 
     async def finish(self) -> Cycle:
         """Finish current cycle.
@@ -58,5 +73,6 @@ class CycleDAO:
         cycle = await self.get_current()
         cycle.ts_finish = datetime.now()
         self.session.add(cycle)
-        await self.session.commit()
+        invalidate(self.session, "cycles")
+        await commit(self.session)
         return cycle
@@ -0,0 +1,130 @@
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# WAL lets readers work alongside the single writer, busy timeout makes writers wait for the lock instead of failing
+SQLITE_PRAGMAS = {"journal_mode": "WAL", "synchronous": "NORMAL", "busy_timeout": 5000}
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Connections queue pool, collecting checkout statistics (see `stats`)."""
+
+    def __init__(self, creator: Any, max_overflow: int = 10, **kwargs: Any) -> None:
+        super().__init__(creator, max_overflow=max_overflow, **kwargs)
+        self.max_overflow = max_overflow  # configured value, `overflow()` is the current one
+        self.checkouts = 0
+        self.timeouts = 0
+        self.max_checked_out = 0
+        self.wait_total = 0.0  # seconds, including new connections
+        self.wait_max = 0.0
+
+    def stats(self) -> dict[str, Any]:
+        """Get pool statistics.
+
+        Returns:
+            dict[str, Any]: pool settings, current connections, checkouts count, timeouts & wait times.
+        """
+        return {
+            "size": self.size(),
+            "max_overflow": self.max_overflow,
+            "timeout": self.timeout(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": max(self.overflow(), 0),
+            "max_checked_out": self.max_checked_out,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_total": self.wait_total,
+            "wait_avg": self.wait_total / self.checkouts if self.checkouts else 0,
+            "wait_max": self.wait_max,
+        }
+
+    def connect(self) -> Any:
+        """Check out connection, counting wait time & timeouts.
+
+        Returns:
+            Any: proxied DBAPI connection.
+
+        Raises:
+            TimeoutError: no free connection in the pool timeout.
+        """
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except sa_exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            wait = time.perf_counter() - start
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+        self.checkouts += 1
+        self.max_checked_out = max(self.max_checked_out, self.checkedout())
+        return connection
+
+
+def create_db_engine(
+    url: str,
+    pool_options: dict[str, Any] | None = None,
+    statement_timeout: float = 0,
+    **kwargs: Any,
+) -> AsyncEngine:
+    """Create async database engine for MariaDB (`mysql+aiomysql://...`) or SQLite (`sqlite+aiosqlite:///...`).
+
+    File databases use `InstrumentedPool`. SQLite connections are switched to WAL mode on connect,
+    MariaDB connections get statement timeout (`max_statement_time`).
+
+    Args:
+        url (str): async database URL.
+        pool_options (dict[str, Any], optional): pool options (`pool_size`, `max_overflow`, `pool_recycle`, ...).
+        statement_timeout (float): MariaDB statement timeout in seconds, 0 - unlimited.
+        kwargs (Any): other engine options.
+
+    Returns:
+        AsyncEngine: database engine.
+    """
+    parsed_url = make_url(url)
+    is_sqlite = parsed_url.get_backend_name() == "sqlite"
+    if not is_sqlite or parsed_url.database not in {None, "", ":memory:"}:
+        kwargs = {"poolclass": InstrumentedPool, **(pool_options or {}), **kwargs}
+    engine = create_async_engine(url, **kwargs)
+    if is_sqlite:
+        event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+    elif statement_timeout:
+        event.listen(engine.sync_engine, "connect", _statement_timeout_setter(statement_timeout))
+    return engine
+
+
+def pool_stats(engine: AsyncEngine) -> dict[str, Any]:
+    """Get engine connection pool statistics.
+
+    Args:
+        engine (AsyncEngine): database engine.
+
+    Returns:
+        dict[str, Any]: pool class & its statistics, if the pool is instrumented.
+    """
+    pool = engine.sync_engine.pool
+    stats = pool.stats() if isinstance(pool, InstrumentedPool) else {}
+    return {"pool": type(pool).__name__, **stats}
+
+
+def _set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    for pragma, pragma_value in SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {pragma} = {pragma_value}")
+    cursor.close()
+
+
+def _statement_timeout_setter(timeout: float) -> Any:
+    def set_statement_timeout(dbapi_connection: Any, connection_record: Any) -> None:  # noqa: WPS430
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"SET SESSION max_statement_time = {float(timeout)}")
+        cursor.close()
+
+    return set_statement_timeout
@@ -3,7 +3,8 @@ from fastapi import Depends
 from sqlmodel import Field, SQLModel, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from egame179_backend.db.session import get_db_session
+from egame179_backend.db.bulk import bulk_insert, bulk_update
+from egame179_backend.db.session import commit, get_db_session, request_cached, topology_cached
 
 
 class Market(SQLModel, table=True):
@@ -54,6 +55,8 @@ class MarketDAO:  # noqa: WPS214
     def __init__(self, session: AsyncSession = Depends(get_db_session)):
         self.session = session
 
+    @topology_cached
+    @request_cached("markets")
     async def select_markets(self) -> list[Market]:
         """Get markets.
 
@@ -64,6 +67,8 @@ class MarketDAO:  # noqa: WPS214
         raw_markets = await self.session.exec(query)  # type: ignore
         return raw_markets.all()
 
+    @topology_cached
+    @request_cached("markets")
     async def select_connections(self) -> list[tuple[int, int]]:
         """Get market graph edges.
 
@@ -74,6 +79,7 @@ class MarketDAO:  # noqa: WPS214
         raw_connections = await self.session.exec(query)  # type: ignore
         return [(edge.source, edge.target) for edge in raw_connections.all()]
 
+    @topology_cached
     async def get_graph(self) -> nx.Graph:
         """Get market graph.
 
@@ -85,6 +91,7 @@ class MarketDAO:  # noqa: WPS214
         graph.add_edges_from(edges)
         return graph
 
+    @topology_cached
     async def get_market_npcs(self) -> dict[int, int]:
         """Get market to npc mapping.
 
@@ -92,10 +99,20 @@ class MarketDAO:  # noqa: WPS214
             dict[int, int]: {market: npc user}
         """
         markets = await self.select_markets()
+        ring2npc = await self.select_npcs()
+        return {market.id: ring2npc[market.ring] for market in markets}
+
+    @topology_cached
+    @request_cached("markets")
+    async def select_npcs(self) -> dict[int, int]:
+        """Get ring to npc mapping.
+
+        Returns:
+            dict[int, int]: {ring: npc user}
+        """
         query = select(Npc)
         raw_npcs = await self.session.exec(query)  # type: ignore
-        ring2npc = {npc.ring: npc.user for npc in raw_npcs.all()}
-        return {market.id: ring2npc[market.ring] for market in markets}
+        return {npc.ring: npc.user for npc in raw_npcs.all()}
 
     async def select_shares(
         self,
@@ -130,16 +147,12 @@ class MarketDAO:  # noqa: WPS214
             cycle (int): target cycle.
             new_unlocks (dict[tuple[int, int], bool]): dict of unlocked markets (user id, market_id).
         """
-        markets = await self.select_markets()
-        for market in markets:
-            if market.home_user is not None:
-                new_unlocks[(market.home_user, market.id)] = True
         shares = [
-            MarketShare(cycle=cycle, user=user, market=mrkt, unlocked=status)
+            {"cycle": cycle, "user": user, "market": mrkt, "share": 0, "position": 0, "unlocked": status}
             for (user, mrkt), status in new_unlocks.items()
         ]
-        self.session.add_all(shares)
-        await self.session.commit()
+        await bulk_insert(self.session, MarketShare, shares)
+        await commit(self.session)
 
     async def update_shares(self, shares: list[MarketShare]) -> None:
         """Update share records.
@@ -147,8 +160,8 @@ class MarketDAO:  # noqa: WPS214
         Args:
             shares (list[MarketShare]): updated share records.
         """
-        self.session.add_all(shares)
-        await self.session.commit()
+        await bulk_update(self.session, shares, keys=("cycle", "user", "market"), fields=("share", "position"))
+        await commit(self.session)
 
     async def unlock_market(self, cycle: int, user: int, market: int) -> None:
         """Unlock market for user.
@@ -167,4 +180,4 @@ class MarketDAO:  # noqa: WPS214
         share = raw_share.one()
         share.unlocked = True
         self.session.add(share)
-        await self.session.commit()
+        await commit(self.session)
@@ -2,7 +2,8 @@ from fastapi import Depends
 from sqlmodel import Field, SQLModel, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from egame179_backend.db.session import get_db_session
+from egame179_backend.db.bulk import bulk_insert
+from egame179_backend.db.session import commit, get_db_session
 
 
 class MarketPrice(SQLModel, table=True):
@@ -36,11 +37,12 @@ class MarketPriceDAO:
         raw_price = await self.session.exec(query)  # type: ignore
         return raw_price.one()
 
-    async def select(self, cycle: int | None = None) -> list[MarketPrice]:
+    async def select(self, cycle: int | None = None, since_cycle: int | None = None) -> list[MarketPrice]:
         """Get prices for all markets.
 
         Args:
             cycle (int, optional): target cycle. If None, prices for all cycles return.
+            since_cycle (int, optional): return only prices of this & later cycles. If None, all cycles return.
 
         Returns:
             list[Price]: market prices.
@@ -48,6 +50,8 @@ class MarketPriceDAO:
         query = select(MarketPrice).order_by(MarketPrice.cycle)
         if cycle is not None:
             query = query.where(MarketPrice.cycle == cycle)
+        if since_cycle is not None:
+            query = query.where(MarketPrice.cycle >= since_cycle)
         raw_prices = await self.session.exec(query)  # type: ignore
         return raw_prices.all()
 
@@ -59,8 +63,8 @@ class MarketPriceDAO:
             new_prices (dict[int, tuple[float, float]]): {market id: (buy price, sell price)}
         """
         prices = [
-            MarketPrice(cycle=cycle, market=market, buy=buy, sell=sell)
+            {"cycle": cycle, "market": market, "buy": buy, "sell": sell}
             for market, (buy, sell) in new_prices.items()
         ]
-        self.session.add_all(prices)
-        await self.session.commit()
+        await bulk_insert(self.session, MarketPrice, prices)
+        await commit(self.session)
@@ -2,7 +2,7 @@ from fastapi import Depends
 from sqlmodel import Field, SQLModel, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from egame179_backend.db.session import get_db_session
+from egame179_backend.db.session import commit, get_db_session, invalidate, request_cached
 
 
 class FeeModificator(SQLModel, table=True):
@@ -22,6 +22,7 @@ class FeeModificatorDAO:
     def __init__(self, session: AsyncSession = Depends(get_db_session)):
         self.session = session
 
+    @request_cached("fee_modificators")
     async def select(
         self,
         cycle: int,
@@ -62,4 +63,5 @@ class FeeModificatorDAO:
             coeff (float): modificator value.
         """
         self.session.add(FeeModificator(cycle=cycle, user=user, fee=fee, coeff=coeff))
-        await self.session.commit()
+        invalidate(self.session, "fee_modificators")
+        await commit(self.session)
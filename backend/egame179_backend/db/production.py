@@ -1,17 +1,18 @@
-import itertools
+from collections import defaultdict
 from datetime import datetime
 
 from fastapi import Depends
 from sqlmodel import Field, SQLModel, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from egame179_backend.db.session import get_db_session
+from egame179_backend.db.bulk import bulk_insert
+from egame179_backend.db.cursor import since_id_filter
+from egame179_backend.db.session import commit, get_db_session
+from egame179_backend.db.warehouse import WarehouseDAO
 
 
-class Production(SQLModel, table=True):
-    """Production table."""
-
-    __tablename__ = "production"  # type: ignore
+class ProductionBase(SQLModel):
+    """Production log record fields."""
 
     id: int = Field(default=None, primary_key=True)
     ts: datetime
@@ -21,29 +22,58 @@ class Production(SQLModel, table=True):
     quantity: int
 
 
+class Production(ProductionBase, table=True):
+    """Production table."""
+
+    __tablename__ = "production"  # type: ignore
+
+
+class ProductionArchive(ProductionBase, table=True):
+    """Production log of closed cycles (see `db.archive`)."""
+
+    __tablename__ = "production_archive"  # type: ignore
+
+
 class ProductionDAO:
     """Class for accessing production table."""
 
     def __init__(self, session: AsyncSession = Depends(get_db_session)):
         self.session = session
 
-    async def select(self, cycle: int | None = None, user: int | None = None) -> list[Production]:
+    async def select(
+        self,
+        cycle: int | None = None,
+        user: int | None = None,
+        since_id: int | None = None,
+        with_archive: bool = False,
+    ) -> list[Production]:
         """Get production log.
 
         Args:
             cycle (int, optional): production cycle. If None, all log records return.
             user (int, optional): target user id. If None, all log records return.
+            since_id (int, optional): return only log records after this id
+                (and the rest of its cycle, see `since_id_filter`). If None, all log records return.
+            with_archive (bool): if True, log records of archived cycles return too.
 
         Returns:
-            list[Production]: production log (excluding axuiliary zeros).
+            list[Production]: production log.
         """
-        query = select(Production).where(Production.quantity > 0).order_by(Production.id)
-        if cycle is not None:
-            query = query.where(Production.cycle == cycle)
-        if user is not None:
-            query = query.where(Production.user == user)
-        raw_production = await self.session.exec(query)  # type: ignore
-        return raw_production.all()
+        production: list[Production] = []
+        for model in (ProductionArchive, Production) if with_archive else (Production,):  # archived cycles go first
+            query = select(model).order_by(model.id)
+            if cycle is not None:
+                query = query.where(model.cycle == cycle)
+            if user is not None:
+                query = query.where(model.user == user)
+            if since_id is not None:
+                query = query.where(await since_id_filter(self.session, model, since_id))
+            raw_production = await self.session.exec(query)  # type: ignore
+            if model is ProductionArchive:
+                production.extend(Production.from_orm(prod) for prod in raw_production)
+            else:
+                production.extend(raw_production)
+        return production
 
     async def create(self, cycle: int, user: int, market: int, quantity: int) -> None:
         """Create new production log record.
@@ -55,19 +85,18 @@ class ProductionDAO:
             quantity (int): number of items.
         """
         self.session.add(Production(ts=datetime.now(), cycle=cycle, user=user, market=market, quantity=quantity))
-        await self.session.commit()
+        await WarehouseDAO(self.session).add({(cycle, user, market): quantity})
+        await commit(self.session)
 
-    async def create_auxiliary(self, cycle: int, users: list[int], markets: list[int]) -> None:
-        """Create auxiliary production log records.
+    async def add(self, production: list[Production]) -> None:
+        """Add production log records with a single multi-row INSERT.
 
         Args:
-            cycle (int): production cycle.
-            users (list[int]): list of user ids.
-            markets (list[int]): list of market ids.
+            production (list[Production]): new production log records.
         """
-        auxilary_production = [
-            Production(ts=datetime.now(), cycle=cycle, user=user, market=market, quantity=0)
-            for user, market in itertools.product(users, markets)
-        ]
-        self.session.add_all(auxilary_production)
-        await self.session.commit()
+        deltas: dict[tuple[int, int, int], int] = defaultdict(int)
+        for record in production:
+            deltas[(record.cycle, record.user, record.market)] += record.quantity
+        await bulk_insert(self.session, Production, [record.dict(exclude={"id"}) for record in production])
+        await WarehouseDAO(self.session).add(deltas)
+        await commit(self.session)
@@ -0,0 +1,131 @@
+from collections.abc import Mapping, Sequence
+from typing import TypeVar
+
+from sqlalchemy import Table, bindparam, insert, tuple_, update
+from sqlmodel import SQLModel, col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+Key = TypeVar("Key", bound=tuple[int, ...])  # (cycle, *partition values)
+
+
+async def add_running_deltas(
+    session: AsyncSession,
+    model: type[SQLModel],
+    partition: tuple[str, ...],
+    value: str,
+    deltas: Mapping[Key, float],
+) -> None:
+    """Add deltas to running totals table (cycle, *partition) -> value.
+
+    Each delta changes the target cycle record and all records of later cycles, the same way
+    as `SUM(delta) OVER (PARTITION BY partition ORDER BY cycle)` does. Missing record is created
+    from the latest previous cycle record. Writes are bulk: one SELECT of existing records, one executemany UPDATE
+    and one multi-row INSERT of missing records. Changes are not committed.
+
+    Args:
+        session (AsyncSession): database session.
+        model (type[SQLModel]): running totals table model.
+        partition (tuple[str, ...]): partition columns names.
+        value (str): running total column name.
+        deltas (Mapping[Key, float]): {(cycle, *partition values): delta}.
+    """
+    if not deltas:
+        return
+    table: Table = model.__table__  # type: ignore
+    key_columns = [table.c.cycle, *[table.c[name] for name in partition]]
+    raw_existing = await session.execute(table.select().where(tuple_(*key_columns).in_(list(deltas))))
+    existing = {tuple(row[column.name] for column in key_columns) for row in raw_existing.mappings()}
+    missing = [key for key in deltas if key not in existing]
+    previous = await _previous_values(session, table, partition, value, missing)
+    await session.execute(
+        update(table)
+        .where(
+            table.c.cycle >= bindparam("delta_cycle"),
+            *[table.c[name] == bindparam(f"delta_{name}") for name in partition],
+        )
+        .values({value: table.c[value] + bindparam("delta")}),
+        [_update_params(partition, key, delta) for key, delta in deltas.items()],
+    )
+    if missing:
+        records = [
+            {
+                "cycle": key[0],
+                **dict(zip(partition, key[1:])),
+                value: previous.get(key, 0) + _sum_until(deltas, key),
+            }
+            for key in missing
+        ]
+        await session.execute(insert(table).values(records))
+
+
+async def carry_forward_running(
+    session: AsyncSession,
+    model: type[SQLModel],
+    partition: tuple[str, ...],
+    value: str,
+    cycle: int,
+    keys: Sequence[tuple[int, ...]],
+) -> None:
+    """Create next cycle records of running totals table (cycle, *partition) -> value.
+
+    New records keep the target cycle values (zero for missing records), existing ones are not changed.
+    It is the same as adding zero deltas to the next cycle, but with one SELECT & one multi-row INSERT.
+    Changes are not committed.
+
+    Args:
+        session (AsyncSession): database session.
+        model (type[SQLModel]): running totals table model.
+        partition (tuple[str, ...]): partition columns names.
+        value (str): running total column name.
+        cycle (int): target cycle, values are carried over to the next one.
+        keys (Sequence[tuple[int, ...]]): partition values of the next cycle records.
+    """
+    query = select(model).where(col(model.cycle).in_([cycle, cycle + 1]))  # type: ignore
+    raw_totals = await session.exec(query)  # type: ignore
+    totals = {
+        (record.cycle, *[getattr(record, name) for name in partition]): getattr(record, value)
+        for record in raw_totals.all()
+    }
+    records = [
+        {"cycle": cycle + 1, **dict(zip(partition, key)), value: totals.get((cycle, *key), 0)}
+        for key in keys
+        if (cycle + 1, *key) not in totals
+    ]
+    if records:
+        await session.execute(insert(model).values(records))
+
+
+async def _previous_values(
+    session: AsyncSession,
+    table: Table,
+    partition: tuple[str, ...],
+    value: str,
+    keys: Sequence[tuple[int, ...]],
+) -> dict[tuple[int, ...], float]:
+    # {(cycle, *partition values): value of the latest previous cycle record of the partition}, read before updates
+    if not keys:
+        return {}
+    query = table.select().where(
+        tuple_(*[table.c[name] for name in partition]).in_({key[1:] for key in keys}),
+        table.c.cycle < max(key[0] for key in keys),
+    )
+    raw_previous = await session.execute(query)
+    previous = {}
+    for row in sorted(raw_previous.mappings(), key=lambda record: record["cycle"]):  # later cycles overwrite earlier
+        row_key = (row["cycle"], *[row[name] for name in partition])
+        partition_keys = [key for key in keys if key[1:] == row_key[1:]]
+        previous.update({key: row[value] for key in partition_keys if row_key < key})
+    return previous
+
+
+def _update_params(partition: tuple[str, ...], key: tuple[int, ...], delta: float) -> dict[str, float]:
+    params = {f"delta_{name}": partition_key for name, partition_key in zip(partition, key[1:])}
+    return {"delta_cycle": key[0], "delta": delta, **params}
+
+
+def _sum_until(deltas: Mapping[Key, float], key: tuple[int, ...]) -> float:
+    # sum of the partition deltas up to the key cycle, as added to the record by one-by-one updates
+    cycle, partition_keys = key[0], key[1:]
+    return sum(
+        delta for delta_key, delta in deltas.items() if delta_key[1:] == partition_keys and delta_key[0] <= cycle
+    )
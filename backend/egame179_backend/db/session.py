@@ -1,8 +1,35 @@
-from collections.abc import AsyncGenerator
+import functools
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import Any, TypeVar
 
 from sqlmodel.ext.asyncio.session import AsyncSession
 from starlette.requests import Request
 
+SINGLE_TRANSACTION = "single_transaction"
+REQUEST_CACHE = "request_cache"
+TOPOLOGY_CACHE = "topology_cache"
+GAME_STATE_VERSION = "game_state_version"
+PENDING_WRITES = "pending_writes"
+
+DAO = TypeVar("DAO")
+DAOProvider = Callable[[type[DAO]], AbstractAsyncContextManager[DAO]]
+ReadMethod = TypeVar("ReadMethod", bound=Callable[..., Awaitable[Any]])
+
+
+class GameStateVersion:
+    """Counter of committed game state changes in the process (e.g. for response cache validation).
+
+    Sessions bump it on every commit with writes, see `commit`. The counter is process-local.
+    """
+
+    def __init__(self) -> None:
+        self.value = 0
+
+    def bump(self) -> None:
+        """Increment version."""
+        self.value += 1
+
 
 async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """Create and get database session.
@@ -16,3 +43,132 @@ async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]
     session: AsyncSession = request.app.state.db_session_factory()
     async with session:
         yield session
+
+
+async def commit(session: AsyncSession) -> None:
+    """Commit session changes. Inside `single_transaction` block changes are only flushed.
+
+    Committed writes bump game state version, passed to the session by session factory (`info` argument).
+
+    Args:
+        session (AsyncSession): database session.
+    """
+    if session.info.get(SINGLE_TRANSACTION):
+        await session.flush()
+        session.info[PENDING_WRITES] = True
+    else:
+        await session.commit()
+        _bump_version(session)
+
+
+@asynccontextmanager
+async def single_transaction(session: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """Run all DAO writes in the block as one transaction with a single commit.
+
+    Any exception inside the block rolls back all changes.
+
+    Args:
+        session (AsyncSession): database session shared by DAOs.
+
+    Yields:
+        AsyncSession: the same database session.
+    """
+    session.info[SINGLE_TRANSACTION] = True
+    try:
+        yield session
+    except BaseException:
+        await session.rollback()
+        session.info.pop(REQUEST_CACHE, None)
+        raise
+    else:
+        await session.commit()
+        if session.info.get(PENDING_WRITES):
+            _bump_version(session)
+    finally:
+        session.info.pop(SINGLE_TRANSACTION, None)
+        session.info.pop(PENDING_WRITES, None)
+
+
+def _bump_version(session: AsyncSession) -> None:
+    version: GameStateVersion | None = session.info.get(GAME_STATE_VERSION)
+    if version is not None:
+        version.bump()
+
+
+def dao_provider(session_factory: Callable[[], Any]) -> DAOProvider:
+    """Make provider of DAOs, each working in its own session (e.g. for concurrent reads).
+
+    Args:
+        session_factory (Callable[[], Any]): AsyncSession factory.
+
+    Returns:
+        DAOProvider: async context manager factory, yielding DAO of requested class.
+    """
+
+    @asynccontextmanager
+    async def provide(dao_class: type[DAO]) -> AsyncIterator[DAO]:  # noqa: WPS430
+        async with session_factory() as session:
+            yield dao_class(session)  # type: ignore
+
+    return provide
+
+
+def request_cached(table: str) -> Callable[[ReadMethod], ReadMethod]:
+    """Memoize DAO read method for the lifetime of DAO session, i.e. for one request (see `get_db_session`).
+
+    Only immutable or cycle-stable data should be cached, DAO writes to it must call `invalidate`.
+
+    Args:
+        table (str): cached table name.
+
+    Returns:
+        Callable[[ReadMethod], ReadMethod]: DAO method decorator.
+    """
+
+    def decorator(method: ReadMethod) -> ReadMethod:  # noqa: WPS430
+        @functools.wraps(method)
+        async def wrapper(dao: Any, *args: Any, **kwargs: Any) -> Any:  # noqa: WPS430
+            key = (table, method.__name__, args, tuple(sorted(kwargs.items())))
+            cache = dao.session.info.setdefault(REQUEST_CACHE, {})
+            if key not in cache:
+                cache[key] = await method(dao, *args, **kwargs)
+            return cache[key]
+
+        return wrapper  # type: ignore
+
+    return decorator
+
+
+def invalidate(session: AsyncSession, table: str) -> None:
+    """Drop cached reads of the table from session request cache.
+
+    Args:
+        session (AsyncSession): database session.
+        table (str): changed table name.
+    """
+    cache = session.info.get(REQUEST_CACHE, {})
+    for key in [key for key in cache if key[0] == table]:
+        cache.pop(key)
+
+
+def topology_cached(method: ReadMethod) -> ReadMethod:
+    """Serve DAO read method of static game topology from process-wide cache (see `db.topology.TopologyCache`).
+
+    The cache is passed to sessions by session factory (`info` argument). Sessions without it read the database.
+
+    Args:
+        method (ReadMethod): DAO read method of markets, market connections, NPCs, user names or players.
+
+    Returns:
+        ReadMethod: decorated method.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(dao: Any, *args: Any, **kwargs: Any) -> Any:  # noqa: WPS430
+        cache = dao.session.info.get(TOPOLOGY_CACHE)
+        if cache is None:
+            return await method(dao, *args, **kwargs)
+        key = (method.__qualname__, args, tuple(sorted(kwargs.items())))
+        return await cache.get_or_load(key, lambda: method(dao, *args, **kwargs))
+
+    return wrapper  # type: ignore
@@ -2,7 +2,8 @@ from fastapi import Depends
 from sqlmodel import Field, SQLModel, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from egame179_backend.db.session import get_db_session
+from egame179_backend.db.bulk import bulk_insert
+from egame179_backend.db.session import commit, get_db_session
 
 
 class Stock(SQLModel, table=True):
@@ -21,11 +22,12 @@ class StockDAO:
     def __init__(self, session: AsyncSession = Depends(get_db_session)):
         self.session = session
 
-    async def select(self, cycle: int | None = None) -> list[Stock]:
+    async def select(self, cycle: int | None = None, since_cycle: int | None = None) -> list[Stock]:
         """Get stock prices history for all players & NPCs.
 
         Args:
             cycle (int, optional): target cycle. Defaults to None.
+            since_cycle (int, optional): return only prices of this & later cycles. Defaults to None.
 
         Returns:
             list[Stock]: stocks history.
@@ -33,6 +35,8 @@ class StockDAO:
         query = select(Stock)
         if cycle is not None:
             query = query.where(Stock.cycle == cycle)
+        if since_cycle is not None:
+            query = query.where(Stock.cycle >= since_cycle)
         raw_stocks = await self.session.exec(query)  # type: ignore
         return raw_stocks.all()
 
@@ -43,6 +47,6 @@ class StockDAO:
             cycle (int): target cycle.
             new_stocks (dict[int, float]): {user: price}.
         """
-        stocks = [Stock(cycle=cycle, user=user, price=price) for user, price in new_stocks.items()]
-        self.session.add_all(stocks)
-        await self.session.commit()
+        stocks = [{"cycle": cycle, "user": user, "price": price} for user, price in new_stocks.items()]
+        await bulk_insert(self.session, Stock, stocks)
+        await commit(self.session)
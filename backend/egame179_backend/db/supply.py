@@ -1,10 +1,13 @@
+from collections import defaultdict
 from datetime import datetime
 
 from fastapi import Depends
-from sqlmodel import Field, SQLModel, select
+from sqlmodel import Field, SQLModel, col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from egame179_backend.db.session import get_db_session
+from egame179_backend.db.bulk import bulk_insert, bulk_update
+from egame179_backend.db.session import commit, get_db_session
+from egame179_backend.db.warehouse import WarehouseDAO
 
 
 class Supply(SQLModel, table=True):
@@ -58,13 +61,42 @@ class SupplyDAO:
             quantity (int): number of items in supply.
         """
         self.session.add(Supply(ts_start=datetime.now(), cycle=cycle, user=user, market=market, quantity=quantity))
-        await self.session.commit()
+        await WarehouseDAO(self.session).add({(cycle, user, market): -quantity})
+        await commit(self.session)
 
-    async def update(self, supplies: list[Supply]) -> None:
+    async def add(self, supplies: list[Supply]) -> None:
+        """Add new supplies with a single multi-row INSERT.
+
+        Args:
+            supplies (list[Supply]): new supplies.
+        """
+        deltas: dict[tuple[int, int, int], int] = defaultdict(int)
+        for supply in supplies:
+            deltas[(supply.cycle, supply.user, supply.market)] -= supply.quantity
+        await bulk_insert(self.session, Supply, [supply.dict(exclude={"id"}) for supply in supplies])
+        await WarehouseDAO(self.session).add(deltas)
+        await commit(self.session)
+
+    async def update(self, supplies: list[Supply]) -> dict[tuple[int, int, int], int]:
         """Update supplies.
 
         Args:
             supplies (list[Supply]): supplies to update.
+
+        Returns:
+            dict[tuple[int, int, int], int]: applied inventory changes {(cycle, user, market): delta}.
         """
-        self.session.add_all(supplies)
-        await self.session.commit()
+        # supply takes all items from warehouse until it's sold, then unsold items are returned
+        query = select(Supply.id, Supply.sold).where(col(Supply.id).in_([supply.id for supply in supplies]))
+        with self.session.no_autoflush:
+            raw_sold = await self.session.exec(query)  # type: ignore
+        prev_sold = dict(raw_sold.all())
+        deltas: dict[tuple[int, int, int], int] = defaultdict(int)
+        for supply in supplies:
+            prev_taken = prev_sold[supply.id] or supply.quantity
+            deltas[(supply.cycle, supply.user, supply.market)] += prev_taken - (supply.sold or supply.quantity)
+        await bulk_update(self.session, supplies, keys=("id",), fields=("ts_finish", "delivered", "sold"))
+        inventory_deltas = {key: delta for key, delta in deltas.items() if delta != 0}
+        await WarehouseDAO(self.session).add(inventory_deltas)
+        await commit(self.session)
+        return inventory_deltas
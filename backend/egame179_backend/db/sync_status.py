@@ -1,8 +1,9 @@
 from fastapi import Depends
+from sqlalchemy import update
 from sqlmodel import Field, SQLModel, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from egame179_backend.db.session import get_db_session
+from egame179_backend.db.session import commit, get_db_session
 
 
 class SyncStatus(SQLModel, table=True):
@@ -41,12 +42,10 @@ class SyncStatusDAO:
         status = raw_status.one()
         status.synced = True
         self.session.add(status)
-        await self.session.commit()
+        await commit(self.session)
 
     async def desync_all(self) -> None:
         """Change all player statuses to desync."""
-        statuses = await self.select()
-        for status in statuses:
-            status.synced = False
-        self.session.add_all(statuses)
-        await self.session.commit()
+        query = update(SyncStatus).values(synced=False).execution_options(synchronize_session=False)
+        await self.session.execute(query)
+        await commit(self.session)
@@ -2,7 +2,8 @@ from fastapi import Depends
 from sqlmodel import Field, SQLModel, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from egame179_backend.db.session import get_db_session
+from egame179_backend.db.bulk import bulk_insert
+from egame179_backend.db.session import commit, get_db_session
 
 
 class Theta(SQLModel, table=True):
@@ -37,12 +38,18 @@ class ThetaDAO:
         raw_theta = await self.session.exec(query)  # type: ignore
         return raw_theta.one().theta
 
-    async def select(self, cycle: int | None = None, user: int | None = None) -> list[Theta]:
+    async def select(
+        self,
+        cycle: int | None = None,
+        user: int | None = None,
+        since_cycle: int | None = None,
+    ) -> list[Theta]:
         """Get all thetas.
 
         Args:
             cycle (int, optional): target cycle. If None, return thetas for all cycles.
             user (int, optional): target user id. If None, return thetas for all users.
+            since_cycle (int, optional): return thetas of this & later cycles only. If None, return all cycles.
 
         Returns:
             list[Theta]: theta records.
@@ -52,6 +59,8 @@ class ThetaDAO:
             query = query.where(Theta.cycle == cycle)
         if user is not None:
             query = query.where(Theta.user == user).order_by(Theta.cycle)
+        if since_cycle is not None:
+            query = query.where(Theta.cycle >= since_cycle)
         raw_thetas = await self.session.exec(query)  # type: ignore
         return raw_thetas.all()
 
@@ -63,8 +72,8 @@ class ThetaDAO:
             new_thetas (dict[tuple[int, int], float]): {(user, market): theta}
         """
         thetas = [
-            Theta(cycle=cycle, user=user, market=market, theta=theta)
+            {"cycle": cycle, "user": user, "market": market, "theta": theta}
             for (user, market), theta in new_thetas.items()
         ]
-        self.session.add_all(thetas)
-        await self.session.commit()
+        await bulk_insert(self.session, Theta, thetas)
+        await commit(self.session)
@@ -0,0 +1,49 @@
+from fastapi import Depends
+from sqlmodel import Field, SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from egame179_backend.db.session import commit, get_db_session
+
+
+class TokenRevocation(SQLModel, table=True):
+    """Access tokens revocations table."""
+
+    __tablename__ = "token_revocations"  # type: ignore
+
+    user: int = Field(primary_key=True)
+    revoked_at: float  # timestamp, tokens of the user issued till then are rejected
+
+
+class TokenRevocationDAO:
+    """Class for accessing access tokens revocations table."""
+
+    def __init__(self, session: AsyncSession = Depends(get_db_session)):
+        self.session = session
+
+    async def get(self, user: int) -> float | None:
+        """Get the latest revocation of the user tokens.
+
+        Args:
+            user (int): user id.
+
+        Returns:
+            float | None: revocation timestamp or None if tokens of the user were never revoked.
+        """
+        query = select(TokenRevocation).where(TokenRevocation.user == user)
+        raw_revocation = await self.session.exec(query)  # type: ignore
+        revocation: TokenRevocation | None = raw_revocation.one_or_none()
+        return None if revocation is None else revocation.revoked_at
+
+    async def revoke(self, user: int, revoked_at: float) -> None:
+        """Save revocation of the user tokens, replacing the previous one.
+
+        Args:
+            user (int): user id.
+            revoked_at (float): revocation timestamp.
+        """
+        revocation = await self.session.get(TokenRevocation, user)
+        if revocation is None:
+            revocation = TokenRevocation(user=user, revoked_at=revoked_at)
+        revocation.revoked_at = revoked_at
+        self.session.add(revocation)
+        await commit(self.session)
@@ -0,0 +1,83 @@
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from egame179_backend.db.market import MarketDAO
+from egame179_backend.db.user import UserDAO
+
+
+class TopologyCache:
+    """Process-wide cache of static game topology: markets, market graph, NPCs, user names & players.
+
+    Topology is written by migrations only, so it's loaded once per worker process (see `load`) and shared
+    by all requests. Cached objects must not be mutated by callers. `invalidate` applies to the current
+    worker only, other workers reload topology after `ttl` expiration.
+    """
+
+    def __init__(self, ttl: float = 0):
+        """Create empty cache.
+
+        Args:
+            ttl (float): entries lifetime in seconds, 0 - until invalidation.
+        """
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.loaded_at: float | None = None
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+
+    async def get_or_load(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> Any:
+        """Get cached value or load & cache it.
+
+        Args:
+            key (Hashable): cache key.
+            load (Callable[[], Awaitable[Any]]): value loader, e.g. DAO read.
+
+        Returns:
+            Any: cached value.
+        """
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is not None and (not self.ttl or now - entry[0] < self.ttl):
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        value = await load()
+        self._entries[key] = (now, value)
+        return value
+
+    async def load(self, session_factory: Callable[[], Any]) -> None:
+        """(Re)load topology, e.g. on application startup.
+
+        Args:
+            session_factory (Callable[[], Any]): AsyncSession factory, passing this cache to sessions.
+        """
+        self.invalidate()
+        async with session_factory() as session:
+            market_dao = MarketDAO(session)
+            user_dao = UserDAO(session)
+            await market_dao.select_markets()
+            await market_dao.get_graph()
+            await market_dao.get_market_npcs()
+            await user_dao.get_names()
+            await user_dao.get_players()
+        self.loaded_at = time.time()
+
+    def invalidate(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+        self.loaded_at = None
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            dict[str, Any]: entries count, hits, misses, ttl & load timestamp.
+        """
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "ttl": self.ttl,
+            "loaded_at": self.loaded_at,
+        }
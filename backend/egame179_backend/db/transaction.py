@@ -1,16 +1,18 @@
+from collections import defaultdict
 from datetime import datetime
 
 from fastapi import Depends
 from sqlmodel import Field, SQLModel, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from egame179_backend.db.session import get_db_session
+from egame179_backend.db.balance import BalanceDAO
+from egame179_backend.db.bulk import bulk_insert
+from egame179_backend.db.cursor import since_id_filter
+from egame179_backend.db.session import commit, get_db_session
 
 
-class Transaction(SQLModel, table=True):
-    """Transactions table."""
-
-    __tablename__ = "transactions"  # type: ignore
+class TransactionBase(SQLModel):
+    """Transaction fields."""
 
     id: int = Field(default=None, primary_key=True)
     ts: datetime
@@ -20,26 +22,54 @@ class Transaction(SQLModel, table=True):
     description: str
 
 
+class Transaction(TransactionBase, table=True):
+    """Transactions table."""
+
+    __tablename__ = "transactions"  # type: ignore
+
+
+class TransactionArchive(TransactionBase, table=True):
+    """Transactions of closed cycles (see `db.archive`)."""
+
+    __tablename__ = "transactions_archive"  # type: ignore
+
+
 class TransactionDAO:
     """Class for accessing transactions table."""
 
     def __init__(self, session: AsyncSession = Depends(get_db_session)):
         self.session = session
 
-    async def select(self, user: int | None = None) -> list[Transaction]:
+    async def select(
+        self,
+        user: int | None = None,
+        since_id: int | None = None,
+        with_archive: bool = False,
+    ) -> list[Transaction]:
         """Get game transactions.
 
         Args:
             user (int, optional): target user id. If None, all transactions return.
+            since_id (int, optional): return only transactions after this id
+                (and the rest of its cycle, see `since_id_filter`). If None, all transactions return.
+            with_archive (bool): if True, transactions of archived cycles return too.
 
         Returns:
             list[Transaction]: game transactions.
         """
-        query = select(Transaction).where(Transaction.amount != 0).order_by(Transaction.cycle, Transaction.ts)
-        if user is not None:
-            query = query.where(Transaction.user == user)
-        raw_transactions = await self.session.exec(query)  # type: ignore
-        return raw_transactions.all()
+        transactions: list[Transaction] = []
+        for model in (TransactionArchive, Transaction) if with_archive else (Transaction,):  # archived cycles go first
+            query = select(model).order_by(model.cycle, model.ts)
+            if user is not None:
+                query = query.where(model.user == user)
+            if since_id is not None:
+                query = query.where(await since_id_filter(self.session, model, since_id))
+            raw_transactions = await self.session.exec(query)  # type: ignore
+            if model is TransactionArchive:
+                transactions.extend(Transaction.from_orm(tr) for tr in raw_transactions)
+            else:
+                transactions.extend(raw_transactions)
+        return transactions
 
     async def create(self, cycle: int, user: int, amount: float, description: str) -> None:
         """Create new transaction.
@@ -51,7 +81,8 @@ class TransactionDAO:
             description (str): trasnaction description.
         """
         self.session.add(Transaction(ts=datetime.now(), cycle=cycle, user=user, amount=amount, description=description))
-        await self.session.commit()
+        await BalanceDAO(self.session).add({(cycle, user): amount})
+        await commit(self.session)
 
     async def add(self, transactions: list[Transaction]) -> None:
         """Add transactions.
@@ -59,8 +90,12 @@ class TransactionDAO:
         Args:
             transactions (list[Transaction]): transactions to update.
         """
-        self.session.add_all(transactions)
-        await self.session.commit()
+        deltas: dict[tuple[int, int], float] = defaultdict(float)
+        for transaction in transactions:
+            deltas[(transaction.cycle, transaction.user)] += transaction.amount
+        await bulk_insert(self.session, Transaction, [transaction.dict(exclude={"id"}) for transaction in transactions])
+        await BalanceDAO(self.session).add(deltas)
+        await commit(self.session)
 
     async def get_init_balance(self) -> float:
         """Get initial balance.
@@ -68,6 +103,11 @@ class TransactionDAO:
         Returns:
             float: amount of first transaction.
         """
+        archived_query = select(TransactionArchive).order_by(TransactionArchive.id).limit(1)
+        raw_archived = await self.session.exec(archived_query)  # type: ignore
+        archived = raw_archived.first()  # first cycle is archived after a few cycles
+        if archived is not None:
+            return archived.amount
         query = select(Transaction).order_by(Transaction.id).limit(1)
         raw_transaction = await self.session.exec(query)  # type: ignore
         return raw_transaction.one().amount
@@ -1,9 +1,13 @@
+import asyncio
+
 from fastapi import Depends
 from passlib.context import CryptContext
 from sqlmodel import Field, SQLModel, or_, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from egame179_backend.db.session import get_db_session
+from egame179_backend.db.session import get_db_session, request_cached, topology_cached
+
+PWD_CONTEXT = CryptContext(schemes=["bcrypt"], deprecated="auto")  # built once, it is costly
 
 
 class User(SQLModel, table=True):
@@ -23,11 +27,12 @@ class UserDAO:
 
     def __init__(self, session: AsyncSession = Depends(get_db_session)):
         self.session = session
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
     async def check_credentials(self, login: str, password: str) -> User | None:
         """Find user in database by login and password.
 
+        Password is verified in a worker thread: bcrypt takes ~200 ms and would block the event loop.
+
         Args:
             login (str): user login.
             password (str): user password.
@@ -39,13 +44,16 @@ class UserDAO:
         raw_user = await self.session.exec(query)  # type: ignore
         user: User | None = raw_user.one_or_none()
         if user is not None:
-            if self.pwd_context.verify(password, user.password):
+            if await asyncio.to_thread(PWD_CONTEXT.verify, password, user.password):
                 return user
         return None
 
+    @request_cached("users")
     async def get_by_name(self, name: str) -> User | None:
         """Get user info by name.
 
+        Authentication lookup isn't topology cached: user rows carry credentials & may be changed.
+
         Args:
             name (str): user name.
 
@@ -56,6 +64,8 @@ class UserDAO:
         raw_user = await self.session.exec(query)  # type: ignore
         return raw_user.one_or_none()
 
+    @topology_cached
+    @request_cached("users")
     async def get_names(self) -> dict[int, str]:
         """Get players & NPCs name mapping.
 
@@ -66,6 +76,8 @@ class UserDAO:
         raw_users = await self.session.exec(query)  # type: ignore
         return {user.id: user.name for user in raw_users.all()}
 
+    @topology_cached
+    @request_cached("users")
     async def get_players(self) -> list[int]:
         """Get player user ids.
 
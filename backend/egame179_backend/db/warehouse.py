@@ -1,12 +1,21 @@
+import itertools
+
 from fastapi import Depends
+from sqlalchemy import delete, text
 from sqlmodel import Field, SQLModel, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from egame179_backend.db.session import get_db_session
+from egame179_backend.db.running import add_running_deltas, carry_forward_running
+from egame179_backend.db.session import commit, get_db_session
+
+INVENTORY_FROM_WAREHOUSES_SQL = """
+    INSERT INTO inventory (cycle, user, market, quantity)
+    SELECT w.cycle, w.user, w.market, w.quantity FROM warehouses w
+"""
 
 
 class Warehouse(SQLModel, table=True):
-    """Warehouses table."""
+    """Warehouses view (calculated from production & supplies logs)."""
 
     __tablename__ = "warehouses"  # type: ignore
 
@@ -16,8 +25,29 @@ class Warehouse(SQLModel, table=True):
     quantity: int
 
 
+class Inventory(SQLModel, table=True):
+    """Inventory table (maintained warehouses state)."""
+
+    __tablename__ = "inventory"  # type: ignore
+
+    cycle: int = Field(primary_key=True)
+    user: int = Field(primary_key=True)
+    market: int = Field(primary_key=True)
+    quantity: int
+
+
+class InventoryDiff(SQLModel):
+    """Mismatch between inventory table and warehouses view."""
+
+    cycle: int
+    user: int
+    market: int
+    inventory: int | None
+    warehouse: int | None
+
+
 class WarehouseDAO:
-    """Class for accessing warehouses table."""
+    """Class for accessing inventory table & warehouses view."""
 
     def __init__(self, session: AsyncSession = Depends(get_db_session)):
         self.session = session
@@ -33,17 +63,16 @@ class WarehouseDAO:
         Returns:
             int: amount of items.
         """
-        query = select(Warehouse).where(
-            Warehouse.cycle == cycle,
-            Warehouse.user == user,
-            Warehouse.market == market,
+        query = select(Inventory.quantity).where(
+            Inventory.cycle == cycle,
+            Inventory.user == user,
+            Inventory.market == market,
         )
-        raw_warehouse = await self.session.exec(query)  # type: ignore
-        warehouse = raw_warehouse.one_or_none()
-        # quantity is Decimal I don't know why
-        return 0 if warehouse is None else int(warehouse.quantity)
+        raw_quantity = await self.session.exec(query)  # type: ignore
+        quantity = raw_quantity.one_or_none()
+        return 0 if quantity is None else int(quantity)
 
-    async def select(self, cycle: int | None = None, user: int | None = None) -> list[Warehouse]:
+    async def select(self, cycle: int | None = None, user: int | None = None) -> list[Inventory]:
         """Get user storages.
 
         Args:
@@ -51,16 +80,71 @@ class WarehouseDAO:
             user (int, optional): target user id. If None, all user storages return.
 
         Returns:
-            list[Warehouse]: list of non-zero warehouse records.
+            list[Inventory]: list of warehouse records.
         """
-        query = select(Warehouse).order_by(Warehouse.cycle)
+        # inventory is changed by bulk updates, so identity map objects can be stale
+        query = select(Inventory).order_by(Inventory.cycle).execution_options(populate_existing=True)
         if user is not None:
-            query = query.where(Warehouse.user == user)
+            query = query.where(Inventory.user == user)
         if cycle is not None:
-            query = query.where(Warehouse.cycle == cycle)
-        raw_warehouses = await self.session.exec(query)  # type: ignore
-        warehouses = raw_warehouses.all()
-        for warehouse in warehouses:
-            # quantity is Decimal I don't know why
-            warehouse.quantity = int(warehouse.quantity)
-        return warehouses
+            query = query.where(Inventory.cycle == cycle)
+        raw_inventory = await self.session.exec(query)  # type: ignore
+        return raw_inventory.all()
+
+    async def add(self, deltas: dict[tuple[int, int, int], int]) -> None:
+        """Add items to user warehouses.
+
+        Changes are not committed: caller commits them together with production & supplies records.
+
+        Args:
+            deltas (dict[tuple[int, int, int], int]): {(cycle, user, market): quantity}.
+        """
+        await add_running_deltas(self.session, Inventory, partition=("user", "market"), value="quantity", deltas=deltas)
+
+    async def carry_forward(self, cycle: int, users: list[int], markets: list[int]) -> None:
+        """Carry user warehouses over to the next cycle.
+
+        Changes are not committed.
+
+        Args:
+            cycle (int): finished cycle.
+            users (list[int]): list of user ids.
+            markets (list[int]): list of market ids.
+        """
+        await carry_forward_running(
+            self.session,
+            Inventory,
+            partition=("user", "market"),
+            value="quantity",
+            cycle=cycle,
+            keys=list(itertools.product(users, markets)),
+        )
+
+    async def verify(self) -> list[InventoryDiff]:
+        """Compare inventory table with warehouses view.
+
+        Returns:
+            list[InventoryDiff]: mismatched records.
+        """
+        raw_inventory = await self.session.exec(select(Inventory))  # type: ignore
+        inventory = {(inv.cycle, inv.user, inv.market): int(inv.quantity) for inv in raw_inventory.all()}
+        raw_warehouses = await self.session.exec(select(Warehouse))  # type: ignore
+        # quantity is Decimal I don't know why
+        warehouses = {(wh.cycle, wh.user, wh.market): int(wh.quantity) for wh in raw_warehouses.all()}
+        return [
+            InventoryDiff(
+                cycle=cycle,
+                user=user,
+                market=market,
+                inventory=inventory.get((cycle, user, market)),
+                warehouse=warehouses.get((cycle, user, market)),
+            )
+            for cycle, user, market in sorted(inventory.keys() | warehouses.keys())
+            if inventory.get((cycle, user, market)) != warehouses.get((cycle, user, market))
+        ]
+
+    async def rebuild(self) -> None:
+        """Rebuild inventory from warehouses view."""
+        await self.session.execute(delete(Inventory))
+        await self.session.execute(text(INVENTORY_FROM_WAREHOUSES_SQL))
+        await commit(self.session)
@@ -2,7 +2,7 @@ from fastapi import Depends
 from sqlmodel import Field, SQLModel, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from egame179_backend.db.session import get_db_session
+from egame179_backend.db.session import get_db_session, request_cached
 
 
 class WorldDemand(SQLModel, table=True):
@@ -21,6 +21,7 @@ class WorldDemandDAO:
     def __init__(self, session: AsyncSession = Depends(get_db_session)):
         self.session = session
 
+    @request_cached("world_demand")
     async def select(self, cycle: int) -> dict[int, int]:
         """Get world demand on particular cycle.
 
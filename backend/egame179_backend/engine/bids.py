@@ -0,0 +1,418 @@
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+
+from egame179_backend import db
+from egame179_backend.db.bulletin import Bulletin, bulletin_text
+from egame179_backend.db.cycle import Cycle
+from egame179_backend.db.production import Production
+from egame179_backend.db.supply import Supply
+from egame179_backend.db.transaction import Transaction
+from egame179_backend.engine.math import bulletin_quantity, production_cost
+from egame179_backend.engine.utility import check_balance, check_storage, get_fee_mods, get_market_names
+
+
+class BidError(ValueError):
+    """Bid can't be accepted (incorrect quantity, not enough money or items)."""
+
+
+class BidKind(str, Enum):
+    """Bid type."""
+
+    production = "production"
+    supply = "supply"
+
+
+@dataclass(frozen=True)
+class UserBid:
+    """Bid of the user: production or supply of items on the market."""
+
+    kind: BidKind
+    user: int
+    market: int
+    quantity: int
+
+
+class BatchView:
+    """Game state of the cycle for bids of a batch: balances & warehouses include changes by already accepted bids.
+
+    Each table is read once per batch (prices) or once per bidding user (balances, thetas, warehouses).
+    """
+
+    def __init__(  # noqa: WPS211
+        self,
+        cycle: int,
+        balance_dao: db.BalanceDAO,
+        price_dao: db.MarketPriceDAO,
+        theta_dao: db.ThetaDAO,
+        wh_dao: db.WarehouseDAO,
+    ):
+        """Create view without loaded values.
+
+        Args:
+            cycle (int): current cycle.
+            balance_dao (db.BalanceDAO): balances table DAO.
+            price_dao (db.MarketPriceDAO): market prices table DAO.
+            theta_dao (db.ThetaDAO): thetas table DAO.
+            wh_dao (db.WarehouseDAO): warehouses table DAO.
+        """
+        self.cycle = cycle
+        self.balance_dao = balance_dao
+        self.price_dao = price_dao
+        self.theta_dao = theta_dao
+        self.wh_dao = wh_dao
+        self.balance_deltas: dict[int, float] = defaultdict(float)
+        self.storage_deltas: dict[tuple[int, int], int] = defaultdict(int)
+        self._balances: dict[int, float] = {}
+        self._storages: dict[int, dict[int, int]] = {}  # {user: {market: quantity}}
+        self._prices: dict[int, float] | None = None  # {market: buy price}
+        self._thetas: dict[int, dict[int, float]] = {}  # {user: {market: theta}}
+
+    async def balance(self, user: int) -> float:
+        """Get user balance.
+
+        Args:
+            user (int): user id.
+
+        Returns:
+            float: stored balance with changes by accepted bids.
+        """
+        if user not in self._balances:
+            self._balances[user] = await self.balance_dao.get(cycle=self.cycle, user=user)
+        return self._balances[user] + self.balance_deltas[user]
+
+    async def storage(self, user: int, market: int) -> int:
+        """Get number of items in user warehouse.
+
+        Args:
+            user (int): user id.
+            market (int): market id.
+
+        Returns:
+            int: stored quantity with changes by accepted bids.
+        """
+        if user not in self._storages:
+            inventory = await self.wh_dao.select(cycle=self.cycle, user=user)
+            self._storages[user] = {wh.market: wh.quantity for wh in inventory}
+        return self._storages[user].get(market, 0) + self.storage_deltas[(user, market)]
+
+    async def production_cost(self, user: int, market: int, quantity: int) -> float:
+        """Get production cost with user theta discount.
+
+        Args:
+            user (int): user id.
+            market (int): market id.
+            quantity (int): number of items.
+
+        Raises:
+            BidError: the market has no price or user has no theta for it.
+
+        Returns:
+            float: production cost.
+        """
+        if self._prices is None:
+            self._prices = {price.market: price.buy for price in await self.price_dao.select(cycle=self.cycle)}
+        if user not in self._thetas:
+            thetas = await self.theta_dao.select(cycle=self.cycle, user=user)
+            self._thetas[user] = {theta.market: theta.theta for theta in thetas}
+        if market not in self._prices or market not in self._thetas[user]:
+            raise BidError(f"Production is not available on {market = }")
+        return production_cost(theta=self._thetas[user][market], price=self._prices[market], quantity=quantity)
+
+
+async def make_production(  # noqa: WPS211
+    cycle: Cycle,
+    user: int,
+    market: int,
+    quantity: int,
+    balance_dao: db.BalanceDAO,
+    market_dao: db.MarketDAO,
+    price_dao: db.MarketPriceDAO,
+    production_dao: db.ProductionDAO,
+    theta_dao: db.ThetaDAO,
+    transaction_dao: db.TransactionDAO,
+) -> float:
+    """Buy products: pay production cost & put items to the warehouse.
+
+    Args:
+        cycle (Cycle): current cycle.
+        user (int): bidding user id.
+        market (int): production market id.
+        quantity (int): number of items.
+        balance_dao (db.BalanceDAO): balances table DAO.
+        market_dao (db.MarketDAO): markets table DAO.
+        price_dao (db.MarketPriceDAO): market prices table DAO.
+        production_dao (db.ProductionDAO): production table DAO.
+        theta_dao (db.ThetaDAO): thetas table DAO.
+        transaction_dao (db.TransactionDAO): transactions table DAO.
+
+    Raises:
+        BidError: quantity <= 0 or insufficient balance for transaction.
+
+    Returns:
+        float: user balance change.
+    """
+    if quantity <= 0:
+        raise BidError(f"Incorrect {quantity = }")
+    price = await price_dao.get(cycle=cycle.id, market=market)
+    theta = await theta_dao.get(user=user, cycle=cycle.id, market=market)
+    cost = production_cost(theta=theta, price=price.buy, quantity=quantity)
+    if not await check_balance(cycle=cycle.id, user=user, amount=cost, balance_dao=balance_dao):
+        raise BidError("Not enough money for production")
+    market_names = await get_market_names(market_dao)
+    await transaction_dao.create(
+        cycle=cycle.id,
+        user=user,
+        amount=-cost,
+        description=f"Production cost of {quantity} items of {market_names[market]}",
+    )
+    await production_dao.create(cycle=cycle.id, user=user, market=market, quantity=quantity)
+    return -cost
+
+
+async def make_supply(  # noqa: WPS211
+    cycle: Cycle,
+    user: int,
+    market: int,
+    quantity: int,
+    bulletin_dao: db.BulletinDAO,
+    market_dao: db.MarketDAO,
+    mod_dao: db.FeeModificatorDAO,
+    supply_dao: db.SupplyDAO,
+    transaction_dao: db.TransactionDAO,
+    user_dao: db.UserDAO,
+    wh_dao: db.WarehouseDAO,
+) -> float:
+    """Make supply: pay supply fee, take items from the warehouse & publish bulletin.
+
+    Args:
+        cycle (Cycle): current cycle.
+        user (int): bidding user id.
+        market (int): supply market id.
+        quantity (int): number of items.
+        bulletin_dao (db.BulletinDAO): bulletins table DAO.
+        market_dao (db.MarketDAO): markets table DAO.
+        mod_dao (db.FeeModificatorDAO): fee_modificators table DAO.
+        supply_dao (db.SupplyDAO): supplies table DAO.
+        transaction_dao (db.TransactionDAO): transactions table DAO.
+        user_dao (db.UserDAO): users table DAO.
+        wh_dao (db.WarehouseDAO): warehouses table DAO.
+
+    Raises:
+        BidError: quantity <= 0 or warehouse < quantity.
+
+    Returns:
+        float: user balance change.
+    """
+    if quantity <= 0:
+        raise BidError(f"Incorrect {quantity = }")
+    # rejection is checked first: lookups below are only needed for accepted bids
+    if not await check_storage(cycle=cycle.id, user=user, market=market, quantity=quantity, wh_dao=wh_dao):
+        raise BidError("Not enough items in warehouse for supply")
+    market_names = await get_market_names(market_dao)
+    user_names = await user_dao.get_names()
+    fee_mods = await get_fee_mods(cycle=cycle.id, fee="beta", mod_dao=mod_dao)
+    fee = cycle.beta * fee_mods.get(user, 1)
+    await transaction_dao.create(
+        cycle=cycle.id,
+        user=user,
+        amount=-fee,
+        description=f"Fee for supply operations ({cycle.beta} x {fee_mods.get(user, 1)})",
+    )
+    await supply_dao.create(cycle=cycle.id, user=user, market=market, quantity=quantity)
+    await bulletin_dao.create(
+        cycle=cycle.id,
+        user=user_names[user],
+        market=market_names[market],
+        quantity=bulletin_quantity(quantity),
+    )
+    return -fee
+
+
+async def make_bids(  # noqa: WPS211
+    cycle: Cycle,
+    bids: list[UserBid],
+    balance_dao: db.BalanceDAO,
+    bulletin_dao: db.BulletinDAO,
+    market_dao: db.MarketDAO,
+    mod_dao: db.FeeModificatorDAO,
+    price_dao: db.MarketPriceDAO,
+    production_dao: db.ProductionDAO,
+    supply_dao: db.SupplyDAO,
+    theta_dao: db.ThetaDAO,
+    transaction_dao: db.TransactionDAO,
+    user_dao: db.UserDAO,
+    wh_dao: db.WarehouseDAO,
+    atomic: bool = False,
+) -> list[float | BidError]:
+    """Make bids in order with the checks of `make_production` & `make_supply`, writing accepted bids together.
+
+    Each bid is checked against balances & warehouses with changes by preceding accepted bids of the batch.
+    Records of accepted bids are written with one multi-row INSERT per table, so inside `single_transaction`
+    the whole batch is committed once. Atomic batch is written only if all bids are accepted.
+
+    Args:
+        cycle (Cycle): current cycle.
+        bids (list[UserBid]): bids in arrival order.
+        balance_dao (db.BalanceDAO): balances table DAO.
+        bulletin_dao (db.BulletinDAO): bulletins table DAO.
+        market_dao (db.MarketDAO): markets table DAO.
+        mod_dao (db.FeeModificatorDAO): fee_modificators table DAO.
+        price_dao (db.MarketPriceDAO): market prices table DAO.
+        production_dao (db.ProductionDAO): production table DAO.
+        supply_dao (db.SupplyDAO): supplies table DAO.
+        theta_dao (db.ThetaDAO): thetas table DAO.
+        transaction_dao (db.TransactionDAO): transactions table DAO.
+        user_dao (db.UserDAO): users table DAO.
+        wh_dao (db.WarehouseDAO): warehouses table DAO.
+        atomic (bool): if True, nothing is written when any bid is rejected.
+
+    Returns:
+        list[float | BidError]: user balance change for accepted bid or rejection reason, for each bid.
+    """
+    view = BatchView(cycle=cycle.id, balance_dao=balance_dao, price_dao=price_dao, theta_dao=theta_dao, wh_dao=wh_dao)
+    batch = await _Batch.load(cycle=cycle, view=view, market_dao=market_dao, mod_dao=mod_dao, user_dao=user_dao)
+    bid_results = [await _make_bid(batch, bid) for bid in bids]  # noqa: WPS476 (bids see preceding ones)
+    if atomic and any(isinstance(bid_result, BidError) for bid_result in bid_results):
+        return bid_results
+    await batch.write(
+        bulletin_dao=bulletin_dao,
+        production_dao=production_dao,
+        supply_dao=supply_dao,
+        transaction_dao=transaction_dao,
+    )
+    return bid_results
+
+
+async def _make_bid(batch: "_Batch", bid: UserBid) -> float | BidError:
+    # balance change of accepted bid, its records are added to the batch, or rejection reason
+    try:
+        amount = await batch.price(bid)
+    except BidError as exc:
+        return exc
+    batch.accept(bid, amount)
+    return -amount
+
+
+@dataclass
+class _Batch:
+    """Shared inputs of `make_bids` & records of accepted bids."""
+
+    cycle: Cycle
+    view: BatchView
+    market_names: dict[int, str]
+    user_names: dict[int, str]
+    fee_mods: dict[int, float]
+    ts: datetime = field(default_factory=datetime.now)
+    transactions: list[Transaction] = field(default_factory=list)
+    production: list[Production] = field(default_factory=list)
+    supplies: list[Supply] = field(default_factory=list)
+    bulletins: list[Bulletin] = field(default_factory=list)
+
+    @classmethod
+    async def load(
+        cls,
+        cycle: Cycle,
+        view: BatchView,
+        market_dao: db.MarketDAO,
+        mod_dao: db.FeeModificatorDAO,
+        user_dao: db.UserDAO,
+    ) -> "_Batch":
+        """Load inputs shared by bids of the batch.
+
+        Args:
+            cycle (Cycle): current cycle.
+            view (BatchView): balances & warehouses view of the batch.
+            market_dao (db.MarketDAO): markets table DAO.
+            mod_dao (db.FeeModificatorDAO): fee_modificators table DAO.
+            user_dao (db.UserDAO): users table DAO.
+
+        Returns:
+            _Batch: batch without accepted bids.
+        """
+        return cls(
+            cycle=cycle,
+            view=view,
+            market_names=await get_market_names(market_dao),
+            user_names=await user_dao.get_names(),
+            fee_mods=await get_fee_mods(cycle=cycle.id, fee="beta", mod_dao=mod_dao),
+        )
+
+    async def price(self, bid: UserBid) -> float:
+        """Check bid against the batch view.
+
+        Args:
+            bid (UserBid): user bid.
+
+        Raises:
+            BidError: not enough money for production or items for supply.
+
+        Returns:
+            float: production cost or supply fee.
+        """
+        self._check_order(bid)
+        if bid.kind == BidKind.production:
+            cost = await self.view.production_cost(user=bid.user, market=bid.market, quantity=bid.quantity)
+            if cost > await self.view.balance(bid.user):
+                raise BidError("Not enough money for production")
+            return cost
+        if bid.quantity > await self.view.storage(bid.user, bid.market):
+            raise BidError("Not enough items in warehouse for supply")
+        return self.cycle.beta * self.fee_mods.get(bid.user, 1)
+
+    def accept(self, bid: UserBid, amount: float) -> None:
+        """Add records of accepted bid & its changes to the batch view.
+
+        Args:
+            bid (UserBid): accepted bid.
+            amount (float): production cost or supply fee.
+        """
+        user, market, quantity = bid.user, bid.market, bid.quantity
+        if bid.kind == BidKind.production:
+            description = f"Production cost of {quantity} items of {self.market_names[market]}"
+            self.production.append(
+                Production(ts=self.ts, cycle=self.cycle.id, user=user, market=market, quantity=quantity)
+            )
+            self.view.storage_deltas[(user, market)] += quantity
+        else:
+            description = f"Fee for supply operations ({self.cycle.beta} x {self.fee_mods.get(user, 1)})"
+            self.supplies.append(
+                Supply(ts_start=self.ts, cycle=self.cycle.id, user=user, market=market, quantity=quantity)
+            )
+            text = bulletin_text(self.user_names[user], self.market_names[market], bulletin_quantity(quantity))
+            self.bulletins.append(Bulletin(ts=self.ts, cycle=self.cycle.id, text=text))
+            self.view.storage_deltas[(user, market)] -= quantity
+        self.transactions.append(
+            Transaction(ts=self.ts, cycle=self.cycle.id, user=user, amount=-amount, description=description),
+        )
+        self.view.balance_deltas[user] -= amount
+
+    async def write(
+        self,
+        bulletin_dao: db.BulletinDAO,
+        production_dao: db.ProductionDAO,
+        supply_dao: db.SupplyDAO,
+        transaction_dao: db.TransactionDAO,
+    ) -> None:
+        """Write records of accepted bids with one multi-row INSERT per table.
+
+        Args:
+            bulletin_dao (db.BulletinDAO): bulletins table DAO.
+            production_dao (db.ProductionDAO): production table DAO.
+            supply_dao (db.SupplyDAO): supplies table DAO.
+            transaction_dao (db.TransactionDAO): transactions table DAO.
+        """
+        if self.transactions:
+            await transaction_dao.add(self.transactions)
+        if self.production:
+            await production_dao.add(self.production)
+        if self.supplies:
+            await supply_dao.add(self.supplies)
+            await bulletin_dao.add(self.bulletins)
+
+    def _check_order(self, bid: UserBid) -> None:
+        if bid.quantity <= 0:
+            raise BidError(f"Incorrect quantity = {bid.quantity}")
+        if bid.market not in self.market_names:
+            raise BidError(f"Unknown market = {bid.market}")
@@ -1,17 +1,68 @@
 from collections import defaultdict
 from datetime import datetime
+from typing import Any
 
 import numpy as np
-import pandas as pd
+import numpy.typing as npt
 from icecream import ic
 
 from egame179_backend.db.cycle import Cycle
 from egame179_backend.db.market import MarketShare
 from egame179_backend.db.market_price import MarketPrice
+from egame179_backend.db.production import Production
 from egame179_backend.db.stocks import Stock
 from egame179_backend.db.supply import Supply
 from egame179_backend.db.theta import Theta
-from egame179_backend.engine.math import buy_price_next, delivered_items, sell_price_next, stocks_price, theta_next
+from egame179_backend.engine import vmath
+
+
+def columns(records: list[Any], *fields: str) -> list[np.ndarray]:
+    """Get columnar (numpy) representation of records.
+
+    Args:
+        records (list[Any]): records (ORM objects).
+        fields (str): fields names.
+
+    Returns:
+        list[np.ndarray]: array of values for each field.
+    """
+    return [np.array([getattr(record, field) for record in records]) for field in fields]
+
+
+def group_sum(keys: np.ndarray, values: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Sum values grouped by keys and align the sums with target keys.
+
+    Args:
+        keys (np.ndarray): group keys (non-negative integers).
+        values (np.ndarray): values to sum.
+        targets (np.ndarray): target keys (non-negative integers).
+
+    Returns:
+        np.ndarray: sums for target keys (zero for keys without values).
+    """
+    size = int(max(keys.max(initial=0), targets.max(initial=0))) + 1
+    sums = np.bincount(keys.astype(np.int64), weights=values, minlength=size)
+    return sums[targets.astype(np.int64)]
+
+
+def lookup(keys: np.ndarray, values: np.ndarray, targets: np.ndarray, default: float) -> np.ndarray:
+    """Find values for target keys.
+
+    Args:
+        keys (np.ndarray): unique keys.
+        values (np.ndarray): values of keys.
+        targets (np.ndarray): target keys.
+        default (float): value for missing keys.
+
+    Returns:
+        np.ndarray: values for target keys.
+    """
+    if not len(keys):
+        return np.full(len(targets), default, dtype=np.float64)
+    order = np.argsort(keys)
+    keys, values = keys[order], values[order]
+    pos = np.minimum(np.searchsorted(keys, targets), len(keys) - 1)
+    return np.where(keys[pos] == targets, values[pos], default)
 
 
 def calculate_delivered(
@@ -29,19 +80,48 @@ def calculate_delivered(
     Returns:
         tuple[list[Supply], dict[int, int]]: (updated supplies, total delivered).
     """
+    if not supplies:
+        return supplies, {}
+    markets, quantities = columns(supplies, "market", "quantity")
+    ts_start: npt.NDArray[np.datetime64] = np.array([supply.ts_start for supply in supplies], dtype="datetime64[us]")
+    delivery_time: npt.NDArray[np.float64] = (np.datetime64(ts_finish, "us") - ts_start) / np.timedelta64(1, "s")
+    delivered = vmath.delivered_items(
+        delivery_time=delivery_time,
+        velocity=np.array([velocities[market] for market in markets.tolist()]),
+        quantity=quantities,
+    )
     total_delivered: dict[int, int] = defaultdict(int)
-    for supply in supplies:
+    for supply, supply_delivered in zip(supplies, delivered.tolist()):
         supply.ts_finish = ts_finish
-        supply.delivered = delivered_items(
-            ts_start=supply.ts_start,
-            ts_finish=ts_finish,
-            velocity=velocities[supply.market],
-            quantity=supply.quantity,
-        )
-        total_delivered[supply.market] += supply.delivered
+        supply.delivered = supply_delivered
+        total_delivered[supply.market] += supply_delivered
     return supplies, total_delivered
 
 
+def calculate_sold(supplies: list[Supply], demand: dict[int, int], total_delivered: dict[int, int]) -> list[Supply]:
+    """Calculate sold items for all supplies (in case of market overflow).
+
+    Args:
+        supplies (list[Supply]): list of supplies with delivered items.
+        demand (dict[int, int]): {market: demand}.
+        total_delivered (dict[int, int]): {market: total delivered items}.
+
+    Returns:
+        list[Supply]: updated supplies.
+    """
+    if not supplies:
+        return supplies
+    markets, delivered = columns(supplies, "market", "delivered")
+    sold = vmath.sold_items(
+        delivered=delivered,
+        demand=np.array([demand[market] for market in markets.tolist()]),
+        total=np.array([total_delivered[market] for market in markets.tolist()]),
+    )
+    for supply, supply_sold in zip(supplies, sold.tolist()):
+        supply.sold = supply_sold
+    return supplies
+
+
 def calculate_shares(
     shares: list[MarketShare],
     sold_per_market: dict[int, int],
@@ -79,8 +159,8 @@ def calculate_shares(
 def calculate_new_prices(
     cycle: Cycle,
     prices: list[MarketPrice],
-    prod_df: pd.DataFrame,
-    supp_df: pd.DataFrame,
+    production: list[Production],
+    supplies: list[Supply],
     demand: dict[int, int],
 ) -> dict[int, tuple[float, float]]:
     """Calculate new prices for all markets.
@@ -88,73 +168,64 @@ def calculate_new_prices(
     Args:
         cycle (Cycle): finished cycle.
         prices (list[MarketPrice]): previous prices.
-        prod_df (pd.DataFrame): production dataframe.
-        supp_df (pd.DataFrame): supplies dataframe.
+        production (list[Production]): production log.
+        supplies (list[Supply]): finished cycle supplies.
         demand (dict[int, int]): demand for all markets.
 
     Returns:
         dict[int, tuple[float, float]]: new prices.
     """
-    if prod_df.empty:
-        market_production = {}
-    else:
-        market_production = prod_df.groupby(["cycle", "market"])["quantity"].sum().to_dict()
-
-    if supp_df.empty:
-        market_delivered = {}
-    else:
-        market_delivered = supp_df.groupby("market")["delivered"].sum().to_dict()
-
-    new_prices: dict[int, tuple[float, float]] = {}
-    for price in prices:
-        buy_price = buy_price_next(
-            n_mt=market_production.get((cycle.id, price.market), 0),
-            n_mt1=market_production.get((cycle.id - 1, price.market), 0),
-            coeff_h=cycle.coeff_h,
-            p_mt=price.buy,
-        )
-        sell_price = sell_price_next(
-            n_mt=market_delivered.get(price.market, 0),
-            d_mt=demand[price.market],
-            coeff_l=cycle.coeff_l,
-            s_mt=price.sell,
-        )
-        new_prices[price.market] = (buy_price, sell_price)
-    return new_prices
-
-
-def calculate_new_thetas(cycle: Cycle, thetas: list[Theta], prod_df: pd.DataFrame) -> dict[tuple[int, int], float]:
+    markets, buy, sell = columns(prices, "market", "buy", "sell")
+    prod_cycles, prod_markets, prod_quantities = columns(production, "cycle", "market", "quantity")
+    supp_markets, supp_delivered = columns(supplies, "market", "delivered")
+    buy_prices = vmath.buy_price_next(
+        n_mt=group_sum(prod_markets, prod_quantities * (prod_cycles == cycle.id), markets),
+        n_mt1=group_sum(prod_markets, prod_quantities * (prod_cycles == cycle.id - 1), markets),
+        coeff_h=cycle.coeff_h,
+        p_mt=buy,
+    )
+    sell_prices = vmath.sell_price_next(
+        n_mt=group_sum(supp_markets, supp_delivered, markets),
+        d_mt=np.array([demand[market] for market in markets.tolist()]),
+        coeff_l=cycle.coeff_l,
+        s_mt=sell,
+    )
+    return dict(zip(markets.tolist(), zip(buy_prices.tolist(), sell_prices.tolist())))
+
+
+def calculate_new_thetas(
+    cycle: Cycle,
+    thetas: list[Theta],
+    production: list[Production],
+    n_cycles: int,
+) -> dict[tuple[int, int], float]:
     """Calculate new thetas for all users.
 
     Args:
         cycle (Cycle): finished cycle.
         thetas (list[Theta]): list of previous thetas.
-        prod_df (pd.DataFrame): production dataframe.
+        production (list[Production]): production log for the last cycles.
+        n_cycles (int): number of cycles in the production log window (cycles without production included).
 
     Returns:
-        dict[tuple[int, int], float]: _description_
+        dict[tuple[int, int], float]: {(user, market): new theta}.
     """
-    if prod_df.empty:
-        user_mean_production = {}
-    else:
-        user_production = prod_df.groupby(["user", "market", "cycle"])["quantity"].sum().reset_index()
-        user_mean_production = user_production.groupby(["user", "market"])["quantity"].mean().to_dict()
-
-    new_thetas: dict[tuple[int, int], float] = {}
-    for theta in thetas:
-        new_thetas[(theta.user, theta.market)] = theta_next(
-            n_mean=user_mean_production.get((theta.user, theta.market), 0),
-            coeff_k=cycle.coeff_k,
-        )
-    return new_thetas
-
-
-def calculate_new_stocks(
+    users, markets = columns(thetas, "user", "market")
+    prod_users, prod_markets, prod_quantities = columns(production, "user", "market", "quantity")
+    n_markets = int(max(markets.max(initial=0), prod_markets.max(initial=0))) + 1
+    # mean production per (user, market) over all cycles of the window, idle cycles count as zero
+    total = group_sum(prod_users * n_markets + prod_markets, prod_quantities, users * n_markets + markets)
+    n_mean = total / max(n_cycles, 1)
+    new_thetas = vmath.theta_next(n_mean=n_mean, coeff_k=cycle.coeff_k)
+    return dict(zip(zip(users.tolist(), markets.tolist()), new_thetas.tolist()))
+
+
+def calculate_new_stocks(  # noqa: WPS210
     cycle: int,
     stocks: list[Stock],
-    balances_df: pd.DataFrame,
-    storages_df: pd.DataFrame,
-    npc_df: pd.DataFrame,
+    balances: dict[tuple[int, int], float],
+    inventory: dict[tuple[int, int, int], int],
+    npcs: dict[int, int],
     initial_balance: float,
 ) -> dict[int, float]:
     """Calculate new stocks for all users.
@@ -162,46 +233,36 @@ def calculate_new_stocks(
     Args:
         cycle (int): finished cycle.
         stocks (list[Stock]): list of previous stocks.
-        balances_df (pd.DataFrame): balances dataframe.
-        storages_df (pd.DataFrame): storage dataframe.
-        npc_df (pd.DataFrame): npc dataframe.
+        balances (dict[tuple[int, int], float]): {(cycle, user): balance} for finished & previous cycles.
+        inventory (dict[tuple[int, int, int], int]): {(cycle, user, market): quantity} for finished & previous cycles.
+        npcs (dict[int, int]): {market: npc user}.
         initial_balance (float): initial balance.
 
     Returns:
         dict[int, float]: {user: new stock}.
     """
-    # player stocks
-    if balances_df.empty:
-        rel_incomes = {}
-    else:
-        balances_df = balances_df.sort_values(["user", "cycle"])
-        balances_df["prev_balance"] = balances_df.groupby("user")["balance"].shift(1).fillna(initial_balance)
-        # avoid division by zero
-        balances_df["prev_balance"] = balances_df["prev_balance"].replace(0, np.nan).fillna(1)
-        balances_df = balances_df[balances_df["cycle"] == cycle]
-        balances_df["rel_income"] = balances_df["balance"] / balances_df["prev_balance"]
-        balances_df = balances_df.set_index("user")
-        ic(balances_df)
-        rel_incomes = balances_df["rel_income"].to_dict()
-    # NPC stocks
-    if storages_df.empty:
-        rel_storages = {}
-    else:
-        storages_df = storages_df.merge(npc_df, on="market", how="left")
-        storages_df = storages_df.groupby(["npc", "cycle"])["quantity"].sum().reset_index()
-        storages_df = storages_df.sort_values(["npc", "cycle"])
-        storages_df["prev_quantity"] = storages_df.groupby("npc")["quantity"].shift(1).fillna(10)
-        # avoid division by zero
-        storages_df["prev_quantity"] = storages_df["prev_quantity"].replace(0, 1)
-        storages_df = storages_df[storages_df["cycle"] == cycle]
-        storages_df["rel_income"] = storages_df["quantity"] / storages_df["prev_quantity"]
-        storages_df = storages_df.set_index("npc")
-        ic(storages_df)
-        rel_storages = storages_df["rel_income"].to_dict()
+    stock_users, prev_prices = columns(stocks, "user", "price")
+    rel_incomes: npt.NDArray[np.float64] = np.ones(len(stocks))
+    # NPC stocks: relative change of total storage on NPC markets
+    if inventory:
+        wh_cycles, _, wh_markets, wh_quantities = np.array([(*key, qnt) for key, qnt in inventory.items()]).T
+        wh_npcs = np.array([npcs[market] for market in wh_markets.tolist()])
+        has_storage = np.isin(stock_users, wh_npcs[wh_cycles == cycle])
+        quantity = group_sum(wh_npcs, wh_quantities * (wh_cycles == cycle), stock_users)
+        prev_quantity = group_sum(wh_npcs, wh_quantities * (wh_cycles == cycle - 1), stock_users)
+        has_prev = np.isin(stock_users, wh_npcs[wh_cycles == cycle - 1])
+        prev_quantity = np.where(has_prev, prev_quantity, 10)
+        prev_quantity = np.where(prev_quantity == 0, 1, prev_quantity)  # avoid division by zero
+        rel_incomes = np.where(has_storage, quantity / prev_quantity, rel_incomes)
+    # player stocks: relative change of balance
+    if balances:
+        bal_cycles, bal_users, bal_values = np.array([(*key, bal) for key, bal in balances.items()]).T
+        current = bal_cycles == cycle
+        previous = bal_cycles == cycle - 1
+        balance = lookup(bal_users[current], bal_values[current], stock_users, default=np.nan)
+        prev_balance = lookup(bal_users[previous], bal_values[previous], stock_users, default=initial_balance)
+        prev_balance = np.where(prev_balance == 0, 1, prev_balance)  # avoid division by zero
+        rel_incomes = np.where(np.isnan(balance), rel_incomes, balance / prev_balance)
     ic(rel_incomes)
-    ic(rel_storages)
-    new_stocks: dict[int, float] = {}
-    for stock in stocks:
-        rel_income = rel_incomes.get(stock.user, rel_storages.get(stock.user, 1))
-        new_stocks[stock.user] = stocks_price(prev_price=stock.price, rel_income=rel_income)
-    return new_stocks
+    new_stocks = vmath.stocks_price(prev_price=prev_prices, rel_income=rel_incomes)
+    return dict(zip(stock_users.tolist(), new_stocks.tolist()))
@@ -1,5 +1,5 @@
 import math
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import numpy as np
 
@@ -36,6 +36,12 @@ def delivered_items(ts_start: datetime, ts_finish: datetime, velocity: float, qu
     return min(quantity, max_items)
 
 
+def full_delivery_ts(ts_start: datetime, velocity: float, quantity: int) -> datetime | None:  # noqa: D103
+    if velocity <= 0:
+        return None
+    return ts_start + timedelta(seconds=quantity / velocity)
+
+
 def sold_items(delivered: int, demand: int, total: int) -> int:  # noqa: D103
     rel_amount = min(1, demand / total)
     return math.floor(rel_amount * delivered)
@@ -0,0 +1,194 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+import networkx as nx
+
+from egame179_backend import db
+from egame179_backend.db.cycle import Cycle
+from egame179_backend.db.market import Market, MarketShare
+from egame179_backend.db.market_price import MarketPrice
+from egame179_backend.db.modificators import FeeModificator
+from egame179_backend.db.production import Production
+from egame179_backend.db.session import DAOProvider
+from egame179_backend.db.stocks import Stock
+from egame179_backend.db.supply import Supply
+from egame179_backend.db.theta import Theta
+from egame179_backend.db.transaction import Transaction
+
+DAO = TypeVar("DAO")
+Key = TypeVar("Key", bound=tuple)
+
+
+@dataclass
+class CycleSnapshot:  # noqa: WPS230
+    """All cycle engine inputs, loaded once at the start of cycle finalization.
+
+    Stages read data from the snapshot and apply their own writes to it (besides DB writes),
+    so the following stages see the same state as they would see in the database.
+    """
+
+    cycle: Cycle
+    markets: list[Market]
+    graph: nx.Graph
+    npcs: dict[int, int]  # {market: npc user}
+    demand: dict[int, int]  # {market: demand}
+    prices: list[MarketPrice]
+    thetas: list[Theta]
+    shares: list[MarketShare]
+    prev_shares: list[MarketShare]  # nonzero positions on previous cycle
+    balances: dict[tuple[int, int], float]  # {(cycle, user): balance} for current & previous cycles
+    inventory: dict[tuple[int, int, int], int]  # {(cycle, user, market): quantity} for current & previous cycles
+    supplies: list[Supply]
+    production: list[Production]  # production log for the last 3 cycles
+    window_cycles: int  # number of existing cycles among the last 3 cycles
+    fee_mods: list[FeeModificator]
+    stocks: list[Stock]
+    init_balance: float
+
+    @classmethod
+    async def load(cls, cycle: Cycle, provide: DAOProvider) -> "CycleSnapshot":  # noqa: WPS210
+        """Load snapshot, running all queries concurrently.
+
+        Args:
+            cycle (Cycle): finished cycle.
+            provide (DAOProvider): DAO provider, each DAO should work in its own session.
+
+        Returns:
+            CycleSnapshot: loaded snapshot.
+        """
+
+        async def fetch(dao_class: type[DAO], method: Callable[[DAO], Awaitable[Any]]) -> Any:  # noqa: WPS430
+            async with provide(dao_class) as dao:
+                return await method(dao)
+
+        (  # noqa: WPS236
+            markets,
+            graph,
+            ring2npc,
+            ring_demand,
+            prices,
+            thetas,
+            shares,
+            prev_shares,
+            balances,
+            prev_balances,
+            inventory,
+            prev_inventory,
+            supplies,
+            production,
+            window_cycles,
+            fee_mods,
+            stocks,
+            init_balance,
+        ) = await asyncio.gather(
+            fetch(db.MarketDAO, lambda dao: dao.select_markets()),
+            fetch(db.MarketDAO, lambda dao: dao.get_graph()),
+            fetch(db.MarketDAO, lambda dao: dao.select_npcs()),
+            fetch(db.WorldDemandDAO, lambda dao: dao.select(cycle=cycle.id)),
+            fetch(db.MarketPriceDAO, lambda dao: dao.select(cycle=cycle.id)),
+            fetch(db.ThetaDAO, lambda dao: dao.select(cycle=cycle.id)),
+            fetch(db.MarketDAO, lambda dao: dao.select_shares(cycle=cycle.id)),
+            fetch(db.MarketDAO, lambda dao: dao.select_shares(cycle=cycle.id - 1, nonzero=True)),
+            fetch(db.BalanceDAO, lambda dao: dao.select(cycle=cycle.id)),
+            fetch(db.BalanceDAO, lambda dao: dao.select(cycle=cycle.id - 1)),
+            fetch(db.WarehouseDAO, lambda dao: dao.select(cycle=cycle.id)),
+            fetch(db.WarehouseDAO, lambda dao: dao.select(cycle=cycle.id - 1)),
+            fetch(db.SupplyDAO, lambda dao: dao.select(cycle=cycle.id)),
+            fetch(db.ProductionDAO, lambda dao: dao.select()),
+            fetch(db.CycleDAO, lambda dao: dao.count(first=cycle.id - 2, last=cycle.id)),
+            fetch(db.FeeModificatorDAO, lambda dao: dao.select(cycle=cycle.id)),
+            fetch(db.StockDAO, lambda dao: dao.select(cycle=cycle.id)),
+            fetch(db.TransactionDAO, lambda dao: dao.get_init_balance()),
+        )
+        return cls(
+            cycle=cycle,
+            markets=markets,
+            graph=graph,
+            npcs={market.id: ring2npc[market.ring] for market in markets},
+            demand={market.id: ring_demand[market.ring] for market in markets},
+            prices=prices,
+            thetas=thetas,
+            shares=shares,
+            prev_shares=prev_shares,
+            balances={(bal.cycle, bal.user): bal.balance for bal in balances + prev_balances},
+            inventory={(wh.cycle, wh.user, wh.market): wh.quantity for wh in inventory + prev_inventory},
+            supplies=supplies,
+            production=[prod for prod in production if prod.cycle >= cycle.id - 2],
+            window_cycles=window_cycles,
+            fee_mods=fee_mods,
+            stocks=stocks,
+            init_balance=init_balance,
+        )
+
+    @property
+    def market_names(self) -> dict[int, str]:
+        """Market names mapping.
+
+        Returns:
+            dict[int, str]: {market id: name}.
+        """
+        return {market.id: market.name for market in self.markets}
+
+    def get_fee_mods(self, fee: str) -> dict[int, float]:
+        """Get fee modificators for all users.
+
+        Args:
+            fee (str): fee type.
+
+        Returns:
+            dict[int, float]: {user: target fee coeff}.
+        """
+        return {mod.user: mod.coeff for mod in self.fee_mods if mod.fee == fee}
+
+    def get_balances(self, cycle: int) -> dict[int, float]:
+        """Get balances of all users on target cycle.
+
+        Args:
+            cycle (int): target cycle.
+
+        Returns:
+            dict[int, float]: {user: balance}.
+        """
+        return {user: balance for (bal_cycle, user), balance in self.balances.items() if bal_cycle == cycle}
+
+    def add_transactions(self, transactions: list[Transaction]) -> None:
+        """Apply transactions to balances.
+
+        Args:
+            transactions (list[Transaction]): added transactions.
+        """
+        cycles = {cycle for cycle, _ in self.balances}
+        for transaction in transactions:
+            add_running_delta(self.balances, (transaction.cycle, transaction.user), transaction.amount, cycles)
+
+    def add_inventory(self, deltas: dict[tuple[int, int, int], int]) -> None:
+        """Apply inventory changes.
+
+        Args:
+            deltas (dict[tuple[int, int, int], int]): {(cycle, user, market): delta}.
+        """
+        cycles = {cycle for cycle, *_ in self.inventory}
+        for key, delta in deltas.items():
+            add_running_delta(self.inventory, key, delta, cycles)
+
+
+def add_running_delta(totals: dict[Key, Any], key: Key, delta: float, cycles: set[int]) -> None:
+    """Add delta to in-memory running totals {(cycle, *partition): value} (same as db.running).
+
+    Args:
+        totals (dict[Key, Any]): running totals.
+        key (Key): (cycle, *partition values).
+        delta (float): value change.
+        cycles (set[int]): all cycles in running totals, updated if a new cycle record is created.
+    """
+    cycle, *partition = key
+    if key not in totals:
+        previous = [prev for prev in cycles if prev < cycle and (prev, *partition) in totals]
+        totals[key] = totals[(max(previous), *partition)] if previous else 0  # type: ignore
+        cycles.add(cycle)
+    for next_cycle in cycles:
+        next_key = (next_cycle, *partition)
+        if next_cycle >= cycle and next_key in totals:
+            totals[next_key] += delta  # type: ignore
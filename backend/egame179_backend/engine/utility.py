@@ -1,6 +1,7 @@
 import pandas as pd
 
 from egame179_backend.db import BalanceDAO, FeeModificatorDAO, MarketDAO, WarehouseDAO, WorldDemandDAO
+from egame179_backend.db.market import MarketShare
 
 
 async def check_balance(cycle: int, user: int, amount: float, balance_dao: BalanceDAO) -> bool:
@@ -100,17 +101,15 @@ async def get_supply_velocities(
     return {market: demand[ring] / tau_s for market, ring in market2ring.items()}
 
 
-async def get_previous_owners(cycle: int, market_dao: MarketDAO) -> dict[tuple[int, int], int]:
+def get_previous_owners(prev_shares: list[MarketShare]) -> dict[tuple[int, int], int]:
     """Get previous owners for all markets.
 
     Args:
-        cycle (int): current cycle.
-        market_dao (MarketDAO): markets table DAO.
+        prev_shares (list[MarketShare]): previous cycle market shares with nonzero positions.
 
     Returns:
         dict[tuple[int, int], int]: {(market, position): user}.
     """
-    prev_shares = await market_dao.select_shares(cycle=cycle - 1, nonzero=True)
     prev_owners_df = pd.DataFrame([share.dict() for share in prev_shares if share.position <= 2])
     if prev_owners_df.empty:
         return {}
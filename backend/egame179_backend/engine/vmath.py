@@ -0,0 +1,82 @@
+"""Array versions of `engine.math` formulas (same names, elementwise over numpy arrays)."""
+import math
+
+import numpy as np
+
+from egame179_backend.engine.math import BULLETIN_SIGMA, STOCKS_SIGMA
+
+TIE_TOLERANCE = 1e-6
+
+
+def production_cost(theta: np.ndarray, price: np.ndarray, quantity: np.ndarray) -> np.ndarray:  # noqa: D103
+    return (1 - theta) * price * quantity
+
+
+def buy_price_next(n_mt: np.ndarray, n_mt1: np.ndarray, coeff_h: int, p_mt: np.ndarray) -> np.ndarray:  # noqa: D103
+    delta_mt = n_mt - n_mt1
+    sigma = _sigmoid(delta_mt / coeff_h - math.log(2))
+    return _round((1.5 * sigma + 0.5) * p_mt, 2)
+
+
+def sell_price_next(n_mt: np.ndarray, d_mt: np.ndarray, coeff_l: int, s_mt: np.ndarray) -> np.ndarray:  # noqa: D103
+    sigma = _sigmoid((1 - n_mt / d_mt) / coeff_l - math.log(2))
+    return _round((1.5 * sigma + 0.5) * s_mt, 2)
+
+
+def theta_next(n_mean: np.ndarray, coeff_k: int) -> np.ndarray:  # noqa: D103
+    return np.where(n_mean == 0, 0, _round(_sigmoid(2 * n_mean / coeff_k - 3) / 3, 3))
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:  # noqa: WPS111
+    return 1 / (1 + np.exp(-x))
+
+
+def _round(x: np.ndarray, ndigits: int) -> np.ndarray:  # noqa: WPS111
+    # np.round scales by 10 ** ndigits and may round decimal ties differently from builtin round,
+    # so (rare) values close to a tie are rounded by builtin round
+    rounded = np.round(x, ndigits)
+    scaled = np.abs(x) * 10**ndigits
+    ties = np.abs(scaled - np.floor(scaled) - 0.5) < TIE_TOLERANCE
+    if ties.any():
+        rounded[ties] = [round(number, ndigits) for number in x[ties].tolist()]
+    return rounded
+
+
+def delivered_items(delivery_time: np.ndarray, velocity: np.ndarray, quantity: np.ndarray) -> np.ndarray:
+    """Array version of `delivered_items`.
+
+    Args:
+        delivery_time (np.ndarray): delivery durations in seconds (ts_finish - ts_start).
+        velocity (np.ndarray): supply velocities.
+        quantity (np.ndarray): supplies quantities.
+
+    Returns:
+        np.ndarray: delivered items.
+    """
+    max_items = np.floor(velocity * delivery_time)
+    return np.minimum(quantity, max_items).astype(np.int64)
+
+
+def sold_items(delivered: np.ndarray, demand: np.ndarray, total: np.ndarray) -> np.ndarray:
+    """Array version of `sold_items`. Markets without deliveries (total = 0) sell nothing.
+
+    Args:
+        delivered (np.ndarray): delivered items.
+        demand (np.ndarray): market demands.
+        total (np.ndarray): total delivered items on the markets.
+
+    Returns:
+        np.ndarray: sold items.
+    """
+    rel_amount = np.divide(demand, total, out=np.ones(len(total)), where=total > 0)
+    return np.floor(np.minimum(1, rel_amount) * delivered).astype(np.int64)
+
+
+def bulletin_quantity(quantity: np.ndarray) -> np.ndarray:  # noqa: D103
+    noised_quantity = np.floor(quantity * (1 + np.random.normal(scale=BULLETIN_SIGMA, size=len(quantity))))
+    return np.maximum(1, noised_quantity).astype(np.int64)
+
+
+def stocks_price(prev_price: np.ndarray, rel_income: np.ndarray) -> np.ndarray:  # noqa: D103
+    noised_coeff = rel_income * (1 + np.random.normal(scale=STOCKS_SIGMA, size=len(prev_price)))
+    return _round(prev_price * np.maximum(0.1, noised_coeff), 2)
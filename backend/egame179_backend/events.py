@@ -0,0 +1,111 @@
+import asyncio
+import itertools
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel, Field
+from starlette.requests import Request
+
+from egame179_backend.db.user import User
+
+
+class EventType(str, Enum):
+    """Game state change type."""
+
+    cycle_start = "cycle_start"
+    cycle_finish = "cycle_finish"
+    bulletin = "bulletin"
+    supply = "supply"
+    balance = "balance"
+    sync = "sync"
+    reset = "reset"  # events were lost, subscriber should reload the whole state
+
+
+class GameEvent(BaseModel):
+    """Game state change, pushed to subscribed clients."""
+
+    id: int = 0
+    type: EventType
+    cycle: int | None = None
+    user: int | None = None  # the event is visible only to the user & root, if set
+    data: dict[str, Any] = Field(default_factory=dict)
+
+
+class EventBus:
+    """In-process pub/sub of game events.
+
+    Each subscriber gets its own bounded queue. If subscriber can't keep up, its queue is replaced
+    with a single `reset` event. Events are process-local: subscribers get events of writes handled
+    by the same worker.
+    """
+
+    def __init__(self, maxsize: int = 100):
+        """Create bus without subscribers.
+
+        Args:
+            maxsize (int): max number of undelivered events per subscriber.
+        """
+        self.maxsize = maxsize
+        self._ids = itertools.count(1)
+        self._subscribers: dict[asyncio.Queue[GameEvent], User] = {}
+
+    def publish(self, event: GameEvent) -> None:
+        """Send event to all subscribers, who can see it.
+
+        Args:
+            event (GameEvent): game event.
+        """
+        event.id = next(self._ids)
+        for queue, user in self._subscribers.items():
+            if event.user is not None and user.role != "root" and user.id != event.user:
+                continue
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                _drain(queue)
+                queue.put_nowait(GameEvent(id=event.id, type=EventType.reset))
+
+    @asynccontextmanager
+    async def subscribe(self, user: User) -> AsyncIterator[asyncio.Queue[GameEvent]]:
+        """Subscribe to events.
+
+        Args:
+            user (User): subscribed user.
+
+        Yields:
+            asyncio.Queue[GameEvent]: queue of events for the user.
+        """
+        queue: asyncio.Queue[GameEvent] = asyncio.Queue(maxsize=self.maxsize)
+        self._subscribers[queue] = user
+        try:
+            yield queue
+        finally:
+            self._subscribers.pop(queue, None)
+
+    @property
+    def subscribers(self) -> int:
+        """Number of subscribers.
+
+        Returns:
+            int: number of subscribers.
+        """
+        return len(self._subscribers)
+
+
+def get_event_bus(request: Request) -> EventBus:
+    """Get application event bus.
+
+    Args:
+        request (Request): current request.
+
+    Returns:
+        EventBus: event bus.
+    """
+    return request.app.state.event_bus
+
+
+def _drain(queue: asyncio.Queue[GameEvent]) -> None:
+    while not queue.empty():
+        queue.get_nowait()
@@ -1,31 +1,41 @@
 from collections.abc import Awaitable, Callable
 
 from fastapi import FastAPI
-from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.orm import sessionmaker
-from sqlmodel import create_engine
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from egame179_backend.db.engine import create_db_engine
+from egame179_backend.db.session import GAME_STATE_VERSION, TOPOLOGY_CACHE, GameStateVersion
+from egame179_backend.db.topology import TopologyCache
 from egame179_backend.settings import settings
 
 
 def _setup_db(app: FastAPI) -> None:
     """Create connection to the database.
 
-    This function creates SQLAlchemy engine instance, session_factory for creating sessions
+    This function creates SQLAlchemy engine instance, session_factory for creating sessions,
+        game state version & static game topology cache shared by sessions
         and stores them in the application's state property.
 
     Args:
         app (FastAPI): FastAPI application.
     """
-    engine = AsyncEngine(create_engine(str(settings.db_url), echo=settings.db_echo, future=True))
+    engine = create_db_engine(
+        settings.db_url,
+        pool_options=settings.db_pool_options,
+        statement_timeout=settings.db_statement_timeout,
+        echo=settings.db_echo,
+    )
     app.state.db_engine = engine
+    app.state.game_state_version = GameStateVersion()
+    app.state.topology_cache = TopologyCache(ttl=settings.topology_cache_ttl)
     app.state.db_session_factory = sessionmaker(
         engine,
         autocommit=False,
         autoflush=False,
         class_=AsyncSession,
         expire_on_commit=False,
+        info={GAME_STATE_VERSION: app.state.game_state_version, TOPOLOGY_CACHE: app.state.topology_cache},
     )
 
 
@@ -43,6 +53,7 @@ def startup(app: FastAPI) -> Callable[[], Awaitable[None]]:
 
     async def _startup() -> None:  # noqa: WPS430
         _setup_db(app)
+        await app.state.topology_cache.load(app.state.db_session_factory)
 
     return _startup
 
@@ -58,6 +69,7 @@ def shutdown(app: FastAPI) -> Callable[[], Awaitable[None]]:
     """
 
     async def _shutdown() -> None:  # noqa: WPS430
+        await app.state.bid_queue.close()
         await app.state.db_engine.dispose()
 
     return _shutdown
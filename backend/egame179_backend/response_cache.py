@@ -0,0 +1,103 @@
+import hashlib
+from collections import OrderedDict
+
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp
+
+from egame179_backend.api.auth.token_cache import TokenCache
+
+CACHED_PATHS = frozenset(
+    (  # read-mostly endpoints, changed only by bids & cycle changes
+        "/api/balance/list",
+        "/api/balance/list/all",
+        "/api/market/prices",
+        "/api/market/shares",
+        "/api/market/shares/all",
+        "/api/production/list",
+        "/api/production/list/all",
+        "/api/production/thetas",
+        "/api/production/thetas/all",
+        "/api/player/state",
+        "/api/root/state",
+        "/api/stocks/list",
+        "/api/supply/projection",
+        "/api/supply/projection/all",
+        "/api/transaction/list",
+        "/api/transaction/list/all",
+    )
+)
+HTTP_OK = 200
+HTTP_NOT_MODIFIED = 304
+
+CacheKey = tuple[str, str, str]
+
+
+class ResponseCacheMiddleware(BaseHTTPMiddleware):
+    """LRU cache of GET responses, valid until the next game state change (see `db.session.GameStateVersion`).
+
+    Responses are cached per (path, query, authorization) and sent with ETag of game state version,
+    repeated request with the same `If-None-Match` gets 304 Not Modified.
+    Cached response is served only for verified token, that isn't expired or revoked (see `TokenCache`),
+    other requests go to the endpoint and its authorization.
+    Game state version is process-local, so the cache is valid with a single worker only.
+    """
+
+    def __init__(self, app: ASGIApp, paths: frozenset[str] = CACHED_PATHS, maxsize: int = 1024):
+        """Create empty cache.
+
+        Args:
+            app (ASGIApp): wrapped application.
+            paths (frozenset[str]): cached endpoint paths.
+            maxsize (int): max number of cached responses.
+        """
+        super().__init__(app)
+        self.paths = paths
+        self.maxsize = maxsize
+        self._responses: OrderedDict[CacheKey, tuple[str, bytes, str]] = OrderedDict()  # {key: (etag, body, type)}
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        """Serve GET request of cached endpoint from cache, if game state wasn't changed since cached response.
+
+        Args:
+            request (Request): current request.
+            call_next (RequestResponseEndpoint): endpoint.
+
+        Returns:
+            Response: cached or endpoint response with ETag.
+        """
+        if request.method != "GET" or request.url.path not in self.paths:
+            return await call_next(request)
+        key = (request.url.path, request.url.query, request.headers.get("authorization", ""))
+        etag = _etag(key, request.app.state.game_state_version.value)
+        cached = self._responses.get(key)
+        if cached is not None and cached[0] == etag and _is_authorized(request):
+            self._responses.move_to_end(key)
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=HTTP_NOT_MODIFIED, headers={"ETag": etag})
+            return Response(cached[1], headers={"ETag": etag, "Content-Type": cached[2]})
+        response = await call_next(request)
+        if response.status_code != HTTP_OK:
+            return response
+        body = b"".join([chunk async for chunk in response.body_iterator])  # type: ignore
+        content_type = response.headers.get("content-type", "application/json")
+        self._responses[key] = (etag, body, content_type)
+        self._responses.move_to_end(key)
+        if len(self._responses) > self.maxsize:
+            self._responses.popitem(last=False)
+        return Response(body, headers={"ETag": etag, "Content-Type": content_type})
+
+
+def _is_authorized(request: Request) -> bool:
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer":
+        return False
+    token_cache: TokenCache = request.app.state.token_cache
+    verified = token_cache.get(token)  # None for expired tokens & tokens dropped by revocation
+    return verified is not None and not token_cache.is_revoked(verified)
+
+
+def _etag(key: CacheKey, version: int) -> str:
+    digest = hashlib.sha256(repr(key).encode()).hexdigest()[:16]  # noqa: WPS432
+    return f'"{version}-{digest}"'
@@ -1,7 +1,8 @@
 from pathlib import Path
 from tempfile import gettempdir
+from typing import Any
 
-from pydantic import BaseSettings
+from pydantic import BaseSettings, validator
 from yarl import URL
 
 TEMP_DIR = Path(gettempdir())
@@ -20,24 +21,61 @@ class Settings(BaseSettings):
     db_pass: str = ""
     db_base: str = "egame179"
     db_echo: bool = False
+    db_url: str = ""  # e.g. `sqlite+aiosqlite:///egame179.db`, MariaDB URL is assembled from db_* settings if empty
+    db_pool_size: int = 10  # persistent connections per worker
+    db_max_overflow: int = 20  # extra connections on load peaks (e.g. bids before cycle finish)
+    db_pool_timeout: float = 30  # seconds to wait for a free connection
+    db_pool_recycle: int = 3600  # seconds, reconnect older connections (before MariaDB `wait_timeout`), -1 - never
+    db_pool_pre_ping: bool = True  # check connection liveness on checkout
+    db_statement_timeout: float = 0  # seconds, MariaDB `max_statement_time`, 0 - unlimited
+    response_cache_size: int = 1024  # cached GET responses, 0 - disable (disabled with several workers)
+    topology_cache_ttl: int = 600  # seconds, 0 - cache static game topology until invalidation
     jwt_secret: str = ""
+    token_cache_size: int = 1024  # verified access tokens, 0 - disable
+    bid_batch_window: float = 0.005  # seconds to collect concurrent bids for one commit, 0 - don't wait
+    bid_batch_size: int = 100  # max bids written in one commit
+    bid_writers: int = 4  # bid batches written concurrently (of different users)
+    bid_lock_stripes: int = 64  # per-user bid locks
 
-    @property
-    def db_url(self) -> URL:
-        """Assemble database URL from settings.
+    @validator("db_url", always=True)
+    def assemble_db_url(cls, db_url: str, values: dict[str, Any]) -> str:  # noqa: N805
+        """Assemble MariaDB database URL from settings, if database URL is not set.
+
+        Args:
+            db_url (str): database URL setting.
+            values (dict[str, Any]): previous settings.
 
         Returns:
-            URL: database URL.
+            str: database URL.
         """
-        return URL.build(
-            scheme="mysql+aiomysql",
-            host=self.db_host,
-            port=self.db_port,
-            user=self.db_user,
-            password=self.db_pass,
-            path=f"/{self.db_base}",
+        if db_url:
+            return db_url
+        return str(
+            URL.build(
+                scheme="mysql+aiomysql",
+                host=values["db_host"],
+                port=values["db_port"],
+                user=values["db_user"],
+                password=values["db_pass"],
+                path=f"/{values['db_base']}",
+            ),
         )
 
+    @property
+    def db_pool_options(self) -> dict[str, Any]:
+        """Database connection pool options.
+
+        Returns:
+            dict[str, Any]: `create_engine` pool keyword arguments.
+        """
+        return {
+            "pool_size": self.db_pool_size,
+            "max_overflow": self.db_max_overflow,
+            "pool_timeout": self.db_pool_timeout,
+            "pool_recycle": self.db_pool_recycle,
+            "pool_pre_ping": self.db_pool_pre_ping,
+        }
+
     class Config:
         env_file = ".env"
         env_prefix = "EGAME179_BACKEND_"
@@ -0,0 +1,18 @@
+"""Headless game simulator: cycle engine over in-memory DAOs, played by bots."""
+from egame179_backend.sim.bots import Bot, GreedyBot, IdleBot, RandomBot
+from egame179_backend.sim.runner import CycleReport, Simulation
+from egame179_backend.sim.store import GameStore
+from egame179_backend.sim.world import SimConfig, generate_world, initial_data
+
+__all__ = [
+    "Bot",
+    "CycleReport",
+    "GameStore",
+    "GreedyBot",
+    "IdleBot",
+    "RandomBot",
+    "SimConfig",
+    "Simulation",
+    "generate_world",
+    "initial_data",
+]
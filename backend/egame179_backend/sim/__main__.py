@@ -0,0 +1,70 @@
+import argparse
+import asyncio
+import json
+import time
+from dataclasses import asdict
+
+from icecream import ic
+
+from egame179_backend.sim.bots import BOTS
+from egame179_backend.sim.runner import Simulation
+from egame179_backend.sim.world import SimConfig
+
+
+def parse_args() -> argparse.Namespace:  # noqa: D103
+    parser = argparse.ArgumentParser(description="Play game with bots, without database")
+    parser.add_argument("--cycles", type=int, default=SimConfig.cycles)
+    parser.add_argument("--players", type=int, default=SimConfig.players)
+    parser.add_argument("--markets", type=int, default=SimConfig.markets)
+    parser.add_argument("--seed", type=int, default=SimConfig.seed)
+    parser.add_argument("--strategy", choices=sorted(BOTS), default="greedy")
+    parser.add_argument("--coeff-h", type=int, default=SimConfig.coeff_h)
+    parser.add_argument("--coeff-k", type=int, default=SimConfig.coeff_k)
+    parser.add_argument("--coeff-l", type=int, default=SimConfig.coeff_l)
+    parser.add_argument("--alpha", type=float, nargs=2, metavar=("INIT", "MULT"))
+    parser.add_argument("--gamma", type=float, nargs=2, metavar=("INIT", "MULT"))
+    parser.add_argument("--per-cycle", action="store_true", help="print per-cycle reports")
+    parser.add_argument("--verbose", action="store_true", help="print engine debug output")
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Simulator entrypoint, prints JSON summary."""
+    args = parse_args()
+    if not args.verbose:
+        ic.disable()
+    config = SimConfig(
+        players=args.players,
+        markets=args.markets,
+        cycles=args.cycles,
+        seed=args.seed,
+        coeff_h=args.coeff_h,
+        coeff_k=args.coeff_k,
+        coeff_l=args.coeff_l,
+    )
+    for fee in ("alpha", "gamma"):
+        if getattr(args, fee) is not None:
+            config.fees[fee] = tuple(getattr(args, fee))
+    simulation = Simulation(config, strategy=args.strategy)
+    started = time.perf_counter()
+    reports = asyncio.run(simulation.run())
+    elapsed = time.perf_counter() - started
+    last = reports[-1]
+    summary = {
+        "cycles": len(reports),
+        "players": config.players,
+        "markets": config.markets,
+        "seconds": round(elapsed, 3),
+        "bids": sum(report.bids for report in reports),
+        "rejected": sum(report.rejected for report in reports),
+        "mean_finish_seconds": round(sum(report.finish_seconds for report in reports) / len(reports), 4),
+        "final_balances": last.balances,
+        "final_stocks": last.stocks,
+    }
+    if args.per_cycle:
+        summary["per_cycle"] = [asdict(report) for report in reports]
+    print(json.dumps(summary, indent=2))  # noqa: WPS421
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+import numpy as np
+
+from egame179_backend.db.cycle import Cycle
+from egame179_backend.engine.bids import BidKind
+
+
+@dataclass
+class Bid:
+    """Player bid: production or supply of items on the market."""
+
+    kind: BidKind
+    market: int
+    quantity: int
+
+
+@dataclass
+class PlayerView:
+    """Game state visible to the player at the moment of bidding (as in player frontend)."""
+
+    cycle: Cycle
+    balance: float
+    unlocked: list[int]
+    prices: dict[int, tuple[float, float]]  # {market: (buy, sell)}
+    thetas: dict[int, float]  # {market: theta}
+    inventory: dict[int, int]  # {market: quantity}
+    demand: dict[int, int]  # {market: demand}
+
+    def production_price(self, market: int) -> float:
+        """Production price of one item with player's theta discount.
+
+        Args:
+            market (int): market id.
+
+        Returns:
+            float: item price.
+        """
+        return (1 - self.thetas.get(market, 0)) * self.prices[market][0]
+
+
+class Bot(ABC):
+    """Simulated player."""
+
+    def __init__(self, user: int, rng: np.random.Generator):
+        self.user = user
+        self.rng = rng
+
+    @abstractmethod
+    def make_bids(self, view: PlayerView) -> list[Bid]:
+        """Decide bids for the cycle. Bids are processed in order, rejected bids are skipped.
+
+        Args:
+            view (PlayerView): visible game state.
+        """
+
+
+class IdleBot(Bot):
+    """Player that makes no bids (pays fees only)."""
+
+    def make_bids(self, view: PlayerView) -> list[Bid]:  # noqa: D102
+        return []
+
+
+class RandomBot(Bot):
+    """Player that spends a random part of balance on random unlocked markets and supplies random items."""
+
+    def make_bids(self, view: PlayerView) -> list[Bid]:  # noqa: D102
+        bids = [
+            Bid(kind=BidKind.supply, market=market, quantity=int(self.rng.integers(1, quantity + 1)))
+            for market, quantity in view.inventory.items()
+            if quantity > 0 and self.rng.random() < 0.8  # noqa: WPS432
+        ]
+        budget = max(0, view.balance) * self.rng.random()
+        for market in self.rng.permutation(view.unlocked).tolist():
+            quantity = int(budget / len(view.unlocked) // view.production_price(market))
+            if quantity > 0:
+                bids.append(Bid(kind=BidKind.production, market=market, quantity=quantity))
+        return bids
+
+
+class GreedyBot(Bot):
+    """Player that invests into unlocked markets with the best margin and sells everything on the same cycle."""
+
+    def __init__(self, user: int, rng: np.random.Generator, invest_share: float = 0.5, n_markets: int = 2):
+        super().__init__(user, rng)
+        self.invest_share = invest_share
+        self.n_markets = n_markets
+
+    def make_bids(self, view: PlayerView) -> list[Bid]:  # noqa: D102
+        margins = {market: view.prices[market][1] - view.production_price(market) for market in view.unlocked}
+        best = [market for market in sorted(margins, key=margins.__getitem__, reverse=True) if margins[market] > 0]
+        best = best[: self.n_markets]
+        budget = max(0, view.balance) * self.invest_share
+        production = {
+            market: min(view.demand[market], int(budget / len(best) // view.production_price(market)))
+            for market in best
+        }
+        bids = [
+            Bid(kind=BidKind.production, market=market, quantity=quantity)
+            for market, quantity in production.items()
+            if quantity > 0
+        ]
+        for market in set(view.inventory) | set(production):
+            quantity = view.inventory.get(market, 0) + production.get(market, 0)
+            if quantity > 0:
+                bids.append(Bid(kind=BidKind.supply, market=market, quantity=quantity))
+        return bids
+
+
+BOTS: dict[str, type[Bot]] = {
+    "idle": IdleBot,
+    "random": RandomBot,
+    "greedy": GreedyBot,
+}
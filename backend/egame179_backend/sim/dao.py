@@ -0,0 +1,403 @@
+"""In-memory DAOs with the same interface as `egame179_backend.db` DAOs, working with `GameStore`."""
+import itertools
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any, TypeVar
+
+import networkx as nx
+import numpy as np
+
+from egame179_backend import db
+from egame179_backend.db.balance import Balance
+from egame179_backend.db.bulletin import BULLETIN_TEMPLATES, Bulletin
+from egame179_backend.db.cycle import Cycle
+from egame179_backend.db.market import Market, MarketShare
+from egame179_backend.db.market_price import MarketPrice
+from egame179_backend.db.modificators import FeeModificator
+from egame179_backend.db.production import Production
+from egame179_backend.db.session import DAOProvider
+from egame179_backend.db.stocks import Stock
+from egame179_backend.db.supply import Supply
+from egame179_backend.db.theta import Theta
+from egame179_backend.db.transaction import Transaction
+from egame179_backend.db.warehouse import Inventory
+from egame179_backend.engine.snapshot import add_running_delta
+from egame179_backend.sim.store import GameStore, Record, new_record
+
+
+def _copy(record: Record) -> Record:
+    # engine modifies selected supplies before update, which needs previous sold items: supplies are selected as copies
+    # (as from database); other records are returned as stored, in-place changes are the same as updates
+    return new_record(type(record), **record.dict())
+
+
+class MemoryDAO:
+    """Base class for in-memory DAOs."""
+
+    def __init__(self, store: GameStore):
+        self.store = store
+
+    @property
+    def players(self) -> list[int]:
+        """Player user ids.
+
+        Returns:
+            list[int]: player user ids.
+        """
+        return [user.id for user in self.store.users if user.role == "player"]
+
+
+class BalanceDAO(MemoryDAO):
+    """In-memory balances."""
+
+    async def get(self, cycle: int, user: int) -> float:  # noqa: D102
+        return self.store.balances[cycle, user]
+
+    async def select(self, cycle: int | None = None, user: int | None = None) -> list[Balance]:  # noqa: D102
+        balances = self.store.balances
+        cycles = sorted(self.store.balance_cycles) if cycle is None else [cycle]
+        users = self.players if user is None else [user]
+        keys = [(cyc, usr) for cyc, usr in itertools.product(cycles, users) if (cyc, usr) in balances]
+        return [new_record(Balance, cycle=cyc, user=usr, balance=balances[cyc, usr]) for cyc, usr in keys]
+
+    async def add(self, deltas: dict[tuple[int, int], float]) -> None:  # noqa: D102
+        for key, delta in deltas.items():
+            add_running_delta(self.store.balances, key, delta, self.store.balance_cycles)
+
+    async def carry_forward(self, cycle: int, users: list[int]) -> None:  # noqa: D102
+        for user in users:
+            add_running_delta(self.store.balances, (cycle + 1, user), 0, self.store.balance_cycles)
+
+
+class BulletinDAO(MemoryDAO):
+    """In-memory bulletins."""
+
+    async def select(self, cycle: int) -> list[Bulletin]:  # noqa: D102
+        return [bulletin for bulletin in reversed(self.store.bulletins) if bulletin.cycle == cycle]
+
+    async def create(self, cycle: int, user: str, market: str, quantity: int) -> None:  # noqa: D102
+        template = np.random.choice(BULLETIN_TEMPLATES)  # noqa: S311
+        text = template.format(market=market, user=user, quantity=quantity)
+        bulletin = new_record(Bulletin, id=self.store.next_id("bulletins"), ts=self.store.clock, cycle=cycle, text=text)
+        self.store.bulletins.append(bulletin)
+
+
+class CycleDAO(MemoryDAO):
+    """In-memory cycles."""
+
+    async def get_current(self) -> Cycle:  # noqa: D102
+        return next(cycle for cycle in self.store.cycles if cycle.ts_finish is None)
+
+    async def count(self, first: int, last: int) -> int:  # noqa: D102
+        return sum(first <= cycle.id <= last for cycle in self.store.cycles)
+
+    async def start(self) -> None:  # noqa: D102
+        cycle = await self.get_current()
+        cycle.ts_start = self.store.clock
+
+    async def finish(self) -> Cycle:  # noqa: D102
+        cycle = await self.get_current()
+        cycle.ts_finish = self.store.clock
+        return cycle
+
+
+class FeeModificatorDAO(MemoryDAO):
+    """In-memory fee modificators."""
+
+    async def select(  # noqa: D102
+        self,
+        cycle: int,
+        user: int | None = None,
+        fee: str | None = None,
+        future: bool = False,
+    ) -> list[FeeModificator]:
+        if future:
+            mods = [mod for mod in self.store.fee_mods if mod.cycle >= cycle]
+        else:
+            mods = [mod for mod in self.store.fee_mods if mod.cycle == cycle]
+        if user is not None:
+            mods = [mod for mod in mods if mod.user == user]
+        return mods if fee is None else [mod for mod in mods if mod.fee == fee]
+
+    async def create(self, cycle: int, user: int, fee: str, coeff: float) -> None:  # noqa: D102
+        self.store.fee_mods.append(new_record(FeeModificator, cycle=cycle, user=user, fee=fee, coeff=coeff))
+
+
+class MarketDAO(MemoryDAO):
+    """In-memory markets, market connections & market shares."""
+
+    async def select_markets(self) -> list[Market]:  # noqa: D102
+        return list(self.store.markets)
+
+    async def select_connections(self) -> list[tuple[int, int]]:  # noqa: D102
+        return list(self.store.connections)
+
+    async def get_graph(self) -> nx.Graph:  # noqa: D102
+        graph = nx.Graph()
+        graph.add_edges_from(self.store.connections)
+        return graph
+
+    async def get_market_npcs(self) -> dict[int, int]:  # noqa: D102
+        return {market.id: self.store.npcs[market.ring] for market in self.store.markets}
+
+    async def select_npcs(self) -> dict[int, int]:  # noqa: D102
+        return dict(self.store.npcs)
+
+    async def select_shares(  # noqa: D102
+        self,
+        cycle: int | None = None,
+        user: int | None = None,
+        nonzero: bool = False,
+    ) -> list[MarketShare]:
+        cycles = self.store.shares.keys() if cycle is None else [cycle]
+        return [
+            share
+            for cyc in cycles
+            for share in self.store.shares.get(cyc, {}).values()
+            if (user is None or share.user == user) and (not nonzero or share.position > 0)
+        ]
+
+    async def create_shares(self, cycle: int, new_unlocks: dict[tuple[int, int], bool]) -> None:  # noqa: D102
+        self.store.shares[cycle].update(
+            {
+                (user, market): new_record(MarketShare, cycle=cycle, user=user, market=market, unlocked=status)
+                for (user, market), status in new_unlocks.items()
+            },
+        )
+
+    async def update_shares(self, shares: list[MarketShare]) -> None:  # noqa: D102
+        for share in shares:
+            self.store.shares[share.cycle][share.user, share.market] = share
+
+    async def unlock_market(self, cycle: int, user: int, market: int) -> None:  # noqa: D102
+        self.store.shares[cycle][user, market].unlocked = True
+
+
+class MarketPriceDAO(MemoryDAO):
+    """In-memory market prices."""
+
+    async def get(self, cycle: int, market: int) -> MarketPrice:  # noqa: D102
+        return self.store.prices[cycle][market]
+
+    async def select(self, cycle: int | None = None) -> list[MarketPrice]:  # noqa: D102
+        cycles = sorted(self.store.prices) if cycle is None else [cycle]
+        return [price for cyc in cycles for price in self.store.prices.get(cyc, {}).values()]
+
+    async def create(self, cycle: int, new_prices: dict[int, tuple[float, float]]) -> None:  # noqa: D102
+        self.store.prices[cycle].update(
+            {
+                market: new_record(MarketPrice, cycle=cycle, market=market, buy=buy, sell=sell)
+                for market, (buy, sell) in new_prices.items()
+            },
+        )
+
+
+class ProductionDAO(MemoryDAO):
+    """In-memory production log."""
+
+    async def select(self, cycle: int | None = None, user: int | None = None) -> list[Production]:  # noqa: D102
+        cycles = sorted(self.store.production) if cycle is None else [cycle]
+        return [
+            prod for cyc in cycles for prod in self.store.production.get(cyc, []) if user is None or prod.user == user
+        ]
+
+    async def create(self, cycle: int, user: int, market: int, quantity: int) -> None:  # noqa: D102
+        self.store.production[cycle].append(
+            new_record(
+                Production,
+                id=self.store.next_id("production"),
+                ts=self.store.clock,
+                cycle=cycle,
+                user=user,
+                market=market,
+                quantity=quantity,
+            ),
+        )
+        await WarehouseDAO(self.store).add({(cycle, user, market): quantity})
+
+
+class StockDAO(MemoryDAO):
+    """In-memory stocks."""
+
+    async def select(self, cycle: int | None = None) -> list[Stock]:  # noqa: D102
+        cycles = sorted(self.store.stocks) if cycle is None else [cycle]
+        return [stock for cyc in cycles for stock in self.store.stocks.get(cyc, {}).values()]
+
+    async def create(self, cycle: int, new_stocks: dict[int, float]) -> None:  # noqa: D102
+        self.store.stocks[cycle].update(
+            {user: new_record(Stock, cycle=cycle, user=user, price=price) for user, price in new_stocks.items()},
+        )
+
+
+class SupplyDAO(MemoryDAO):
+    """In-memory supplies."""
+
+    async def select(self, cycle: int, user: int | None = None, ongoing=False) -> list[Supply]:  # noqa: D102
+        return [
+            _copy(supply)
+            for supply in self.store.supplies.get(cycle, [])
+            if (user is None or supply.user == user) and (not ongoing or supply.delivered == 0)
+        ]
+
+    async def create(self, cycle: int, user: int, market: int, quantity: int) -> None:  # noqa: D102
+        self.store.supplies[cycle].append(
+            new_record(
+                Supply,
+                id=self.store.next_id("supplies"),
+                ts_start=self.store.clock,
+                cycle=cycle,
+                user=user,
+                market=market,
+                quantity=quantity,
+            ),
+        )
+        await WarehouseDAO(self.store).add({(cycle, user, market): -quantity})
+
+    async def update(self, supplies: list[Supply]) -> dict[tuple[int, int, int], int]:  # noqa: D102
+        deltas: dict[tuple[int, int, int], int] = defaultdict(int)
+        for supply in supplies:
+            stored = self.store.supplies[supply.cycle]
+            index = next(idx for idx, prev in enumerate(stored) if prev.id == supply.id)
+            prev_taken = stored[index].sold or supply.quantity
+            deltas[(supply.cycle, supply.user, supply.market)] += prev_taken - (supply.sold or supply.quantity)
+            stored[index] = supply
+        inventory_deltas = {key: delta for key, delta in deltas.items() if delta != 0}
+        await WarehouseDAO(self.store).add(inventory_deltas)
+        return inventory_deltas
+
+
+class ThetaDAO(MemoryDAO):
+    """In-memory thetas."""
+
+    async def get(self, cycle: int, user: int, market: int) -> float:  # noqa: D102
+        return self.store.thetas[cycle][user, market].theta
+
+    async def select(self, cycle: int | None = None, user: int | None = None) -> list[Theta]:  # noqa: D102
+        cycles = sorted(self.store.thetas) if cycle is None else [cycle]
+        return [
+            theta
+            for cyc in cycles
+            for theta in self.store.thetas.get(cyc, {}).values()
+            if user is None or theta.user == user
+        ]
+
+    async def create(self, cycle: int, new_thetas: dict[tuple[int, int], float]) -> None:  # noqa: D102
+        self.store.thetas[cycle].update(
+            {
+                (user, market): new_record(Theta, cycle=cycle, user=user, market=market, theta=theta)
+                for (user, market), theta in new_thetas.items()
+            },
+        )
+
+
+class TransactionDAO(MemoryDAO):
+    """In-memory transactions."""
+
+    async def select(self, user: int | None = None) -> list[Transaction]:  # noqa: D102
+        transactions = [
+            transaction for transaction in self.store.transactions if user is None or transaction.user == user
+        ]
+        return sorted(transactions, key=lambda transaction: (transaction.cycle, transaction.ts))
+
+    async def create(self, cycle: int, user: int, amount: float, description: str) -> None:  # noqa: D102
+        transaction = new_record(
+            Transaction,
+            ts=self.store.clock,
+            cycle=cycle,
+            user=user,
+            amount=amount,
+            description=description,
+        )
+        await self.add([transaction])
+
+    async def add(self, transactions: list[Transaction]) -> None:  # noqa: D102
+        deltas: dict[tuple[int, int], float] = defaultdict(float)
+        for transaction in transactions:
+            deltas[(transaction.cycle, transaction.user)] += transaction.amount
+            transaction.id = self.store.next_id("transactions")
+            self.store.transactions.append(transaction)
+        await BalanceDAO(self.store).add(deltas)
+
+    async def get_init_balance(self) -> float:  # noqa: D102
+        return self.store.transactions[0].amount
+
+
+class UserDAO(MemoryDAO):
+    """In-memory users."""
+
+    async def get_names(self) -> dict[int, str]:  # noqa: D102
+        return {user.id: user.name for user in self.store.users if user.role in {"player", "npc"}}
+
+    async def get_players(self) -> list[int]:  # noqa: D102
+        return self.players
+
+
+class WarehouseDAO(MemoryDAO):
+    """In-memory inventory."""
+
+    async def get(self, cycle: int, user: int, market: int) -> int:  # noqa: D102
+        return self.store.inventory.get((cycle, user, market), 0)
+
+    async def select(self, cycle: int | None = None, user: int | None = None) -> list[Inventory]:  # noqa: D102
+        inventory = self.store.inventory
+        cycles = sorted(self.store.inventory_cycles) if cycle is None else [cycle]
+        users = self.players if user is None else [user]
+        markets = [market.id for market in self.store.markets]
+        return [
+            new_record(Inventory, cycle=cyc, user=usr, market=mrkt, quantity=inventory[cyc, usr, mrkt])
+            for cyc, usr, mrkt in itertools.product(cycles, users, markets)
+            if (cyc, usr, mrkt) in inventory
+        ]
+
+    async def add(self, deltas: dict[tuple[int, int, int], int]) -> None:  # noqa: D102
+        for key, delta in deltas.items():
+            add_running_delta(self.store.inventory, key, delta, self.store.inventory_cycles)
+
+    async def carry_forward(self, cycle: int, users: list[int], markets: list[int]) -> None:  # noqa: D102
+        for user, market in itertools.product(users, markets):
+            add_running_delta(self.store.inventory, (cycle + 1, user, market), 0, self.store.inventory_cycles)
+
+
+class WorldDemandDAO(MemoryDAO):
+    """In-memory world demand."""
+
+    async def select(self, cycle: int) -> dict[int, int]:  # noqa: D102
+        return {ring: demand for (cyc, ring), demand in self.store.world_demand.items() if cyc == cycle}
+
+
+MEMORY_DAOS: dict[type, type[MemoryDAO]] = {
+    db.BalanceDAO: BalanceDAO,
+    db.BulletinDAO: BulletinDAO,
+    db.CycleDAO: CycleDAO,
+    db.FeeModificatorDAO: FeeModificatorDAO,
+    db.MarketDAO: MarketDAO,
+    db.MarketPriceDAO: MarketPriceDAO,
+    db.ProductionDAO: ProductionDAO,
+    db.StockDAO: StockDAO,
+    db.SupplyDAO: SupplyDAO,
+    db.ThetaDAO: ThetaDAO,
+    db.TransactionDAO: TransactionDAO,
+    db.UserDAO: UserDAO,
+    db.WarehouseDAO: WarehouseDAO,
+    db.WorldDemandDAO: WorldDemandDAO,
+}
+
+DAO = TypeVar("DAO")
+
+
+def dao_provider(store: GameStore) -> DAOProvider:
+    """Make provider of in-memory DAOs for `db` DAO classes (see `db.session.dao_provider`).
+
+    Args:
+        store (GameStore): in-memory game state.
+
+    Returns:
+        DAOProvider: async context manager factory, yielding in-memory DAO for requested `db` DAO class.
+    """
+
+    @asynccontextmanager
+    async def provide(dao_class: type[DAO]) -> AsyncIterator[Any]:  # noqa: WPS430
+        yield MEMORY_DAOS[dao_class](store)
+
+    return provide
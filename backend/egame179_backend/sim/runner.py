@@ -0,0 +1,170 @@
+import time
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+import numpy as np
+
+from egame179_backend.db.cycle import Cycle
+from egame179_backend.engine.bids import BidError, make_production, make_supply
+from egame179_backend.engine.mechanics import finish_cycle, prepare_new_cycle
+from egame179_backend.engine.snapshot import CycleSnapshot
+from egame179_backend.sim import dao
+from egame179_backend.sim.bots import BOTS, Bid, BidKind, Bot, PlayerView
+from egame179_backend.sim.world import SimConfig, generate_world
+
+
+@dataclass
+class CycleReport:
+    """Simulated cycle results."""
+
+    cycle: int
+    bids: int = 0
+    rejected: int = 0
+    bids_seconds: float = 0
+    finish_seconds: float = 0
+    balances: dict[int, float] = field(default_factory=dict)  # {user: balance} after the cycle finish
+    stocks: dict[int, float] = field(default_factory=dict)  # {user: stocks price} for the next cycle
+
+
+class Simulation:
+    """Headless game: bots make bids, cycles are finished by the engine over in-memory DAOs."""
+
+    def __init__(self, config: SimConfig, bots: list[Bot] | None = None, strategy: str = "greedy"):
+        """Generate game world & players.
+
+        Args:
+            config (SimConfig): simulated game parameters.
+            bots (list[Bot] | None): players, one bot of `strategy` per player if not set.
+            strategy (str): default bot strategy (see `bots.BOTS`).
+        """
+        self.config = config
+        self.store = generate_world(config)
+        self.rng = np.random.default_rng(config.seed)
+        np.random.seed(config.seed)  # engine noise (bulletins & stocks) uses global random state
+        players = range(1, config.players + 1)
+        self.bots = bots or [BOTS[strategy](user=player, rng=self.rng) for player in players]
+        self.reports: list[CycleReport] = []
+
+    async def run(self, cycles: int | None = None) -> list[CycleReport]:
+        """Play cycles.
+
+        Args:
+            cycles (int | None): number of cycles, all configured cycles if not set.
+
+        Returns:
+            list[CycleReport]: reports of played cycles.
+        """
+        for _ in range(cycles or self.config.cycles):
+            self.reports.append(await self.play_cycle())
+        return self.reports
+
+    async def play_cycle(self) -> CycleReport:
+        """Start current cycle, make bots bids & finish cycle.
+
+        Returns:
+            CycleReport: cycle results.
+        """
+        cycle_dao = dao.CycleDAO(self.store)
+        await cycle_dao.start()
+        cycle = await cycle_dao.get_current()
+        report = CycleReport(cycle=cycle.id)
+        started = time.perf_counter()
+        # bots act in random order at random moments of the first half of the cycle
+        offsets = np.sort(self.rng.uniform(0, self.config.cycle_duration / 2, len(self.bots)))
+        for bot_idx, offset in zip(self.rng.permutation(len(self.bots)).tolist(), offsets.tolist()):
+            self.store.clock = cycle.ts_start + timedelta(seconds=offset)  # type: ignore
+            bot = self.bots[bot_idx]
+            for bid in bot.make_bids(await self.get_view(cycle, bot.user)):
+                report.bids += 1
+                try:
+                    await self.make_bid(cycle, bot.user, bid)
+                except BidError:
+                    report.rejected += 1
+        report.bids_seconds = time.perf_counter() - started
+        self.store.clock = cycle.ts_start + timedelta(seconds=self.config.cycle_duration)  # type: ignore
+        started = time.perf_counter()
+        await self.finish_cycle()
+        report.finish_seconds = time.perf_counter() - started
+        report.balances = {bal.user: bal.balance for bal in await dao.BalanceDAO(self.store).select(cycle=cycle.id)}
+        report.stocks = {stock.user: stock.price for stock in await dao.StockDAO(self.store).select(cycle=cycle.id + 1)}
+        return report
+
+    async def finish_cycle(self) -> None:
+        """Finish current cycle, the same way as `/cycle/finish` endpoint."""
+        finished_cycle = await dao.CycleDAO(self.store).finish()
+        snapshot = await CycleSnapshot.load(cycle=finished_cycle, provide=dao.dao_provider(self.store))
+        await finish_cycle(
+            snapshot=snapshot,
+            market_dao=dao.MarketDAO(self.store),  # type: ignore
+            supply_dao=dao.SupplyDAO(self.store),  # type: ignore
+            transaction_dao=dao.TransactionDAO(self.store),  # type: ignore
+        )
+        await prepare_new_cycle(
+            snapshot=snapshot,
+            balance_dao=dao.BalanceDAO(self.store),  # type: ignore
+            market_dao=dao.MarketDAO(self.store),  # type: ignore
+            price_dao=dao.MarketPriceDAO(self.store),  # type: ignore
+            stock_dao=dao.StockDAO(self.store),  # type: ignore
+            theta_dao=dao.ThetaDAO(self.store),  # type: ignore
+            wh_dao=dao.WarehouseDAO(self.store),  # type: ignore
+        )
+
+    async def get_view(self, cycle: Cycle, user: int) -> PlayerView:
+        """Get game state visible to the player.
+
+        Args:
+            cycle (Cycle): current cycle.
+            user (int): player user id.
+
+        Returns:
+            PlayerView: visible game state.
+        """
+        store = self.store
+        shares = store.shares[cycle.id]
+        unlocked = [market.id for market in store.markets if shares[user, market.id].unlocked]
+        return PlayerView(
+            cycle=cycle,
+            balance=store.balances[cycle.id, user],
+            unlocked=unlocked,
+            prices={market: (price.buy, price.sell) for market, price in store.prices[cycle.id].items()},
+            thetas={market: store.thetas[cycle.id][user, market].theta for market in unlocked},
+            inventory={market.id: store.inventory.get((cycle.id, user, market.id), 0) for market in store.markets},
+            demand={market.id: store.world_demand[cycle.id, market.ring] for market in store.markets},
+        )
+
+    async def make_bid(self, cycle: Cycle, user: int, bid: Bid) -> None:
+        """Make bid with the same checks & writes as the bids API.
+
+        Args:
+            cycle (Cycle): current cycle.
+            user (int): bidding user id.
+            bid (Bid): bid.
+        """
+        store = self.store
+        if bid.kind == BidKind.production:
+            await make_production(
+                cycle=cycle,
+                user=user,
+                market=bid.market,
+                quantity=bid.quantity,
+                balance_dao=dao.BalanceDAO(store),  # type: ignore
+                market_dao=dao.MarketDAO(store),  # type: ignore
+                price_dao=dao.MarketPriceDAO(store),  # type: ignore
+                production_dao=dao.ProductionDAO(store),  # type: ignore
+                theta_dao=dao.ThetaDAO(store),  # type: ignore
+                transaction_dao=dao.TransactionDAO(store),  # type: ignore
+            )
+        else:
+            await make_supply(
+                cycle=cycle,
+                user=user,
+                market=bid.market,
+                quantity=bid.quantity,
+                bulletin_dao=dao.BulletinDAO(store),  # type: ignore
+                market_dao=dao.MarketDAO(store),  # type: ignore
+                mod_dao=dao.FeeModificatorDAO(store),  # type: ignore
+                supply_dao=dao.SupplyDAO(store),  # type: ignore
+                transaction_dao=dao.TransactionDAO(store),  # type: ignore
+                user_dao=dao.UserDAO(store),  # type: ignore
+                wh_dao=dao.WarehouseDAO(store),  # type: ignore
+            )
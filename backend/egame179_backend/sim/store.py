@@ -0,0 +1,90 @@
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cache
+from typing import Any, TypeVar
+
+from sqlalchemy.orm import class_mapper, configure_mappers
+from sqlmodel import SQLModel
+
+from egame179_backend.db.bulletin import Bulletin
+from egame179_backend.db.cycle import Cycle
+from egame179_backend.db.market import Market, MarketShare
+from egame179_backend.db.market_price import MarketPrice
+from egame179_backend.db.modificators import FeeModificator
+from egame179_backend.db.production import Production
+from egame179_backend.db.stocks import Stock
+from egame179_backend.db.supply import Supply
+from egame179_backend.db.theta import Theta
+from egame179_backend.db.transaction import Transaction
+from egame179_backend.db.user import User
+
+Record = TypeVar("Record", bound=SQLModel)
+
+configure_mappers()  # records are created without __init__, which configures mappers on first call
+
+
+def new_record(model: type[Record], **values: Any) -> Record:
+    """Create table model record without validation.
+
+    Validation of SQLModel table models dominates simulation time, while in-memory values are already typed.
+
+    Args:
+        model (type[Record]): table model.
+        values (Any): field values, defaults are used for missing ones.
+
+    Returns:
+        Record: new record (transient, as a validated one).
+    """
+    record = class_mapper(model).class_manager.new_instance()
+    record.__dict__.update(_defaults(model), **values)  # noqa: WPS609
+    object.__setattr__(record, "__fields_set__", set(values))  # noqa: WPS609
+    return record
+
+
+@cache
+def _defaults(model: type[SQLModel]) -> dict[str, Any]:
+    return {name: model_field.get_default() for name, model_field in model.__fields__.items()}
+
+
+@dataclass
+class GameStore:  # noqa: WPS230
+    """In-memory game state, the counterpart of the game database tables.
+
+    Per-cycle tables are stored as {cycle: {key: record}} or {cycle: [records]} to make cycle selects cheap.
+    Balances & inventory are running totals {(cycle, *partition): value}, as their tables.
+    """
+
+    clock: datetime  # simulated time, used instead of datetime.now()
+    users: list[User] = field(default_factory=list)
+    npcs: dict[int, int] = field(default_factory=dict)  # {ring: npc user}
+    cycles: list[Cycle] = field(default_factory=list)
+    markets: list[Market] = field(default_factory=list)
+    connections: list[tuple[int, int]] = field(default_factory=list)
+    world_demand: dict[tuple[int, int], int] = field(default_factory=dict)  # {(cycle, ring): demand}
+    prices: dict[int, dict[int, MarketPrice]] = field(default_factory=lambda: defaultdict(dict))
+    thetas: dict[int, dict[tuple[int, int], Theta]] = field(default_factory=lambda: defaultdict(dict))
+    shares: dict[int, dict[tuple[int, int], MarketShare]] = field(default_factory=lambda: defaultdict(dict))
+    stocks: dict[int, dict[int, Stock]] = field(default_factory=lambda: defaultdict(dict))
+    fee_mods: list[FeeModificator] = field(default_factory=list)
+    transactions: list[Transaction] = field(default_factory=list)
+    production: dict[int, list[Production]] = field(default_factory=lambda: defaultdict(list))
+    supplies: dict[int, list[Supply]] = field(default_factory=lambda: defaultdict(list))
+    bulletins: list[Bulletin] = field(default_factory=list)
+    balances: dict[tuple[int, int], float] = field(default_factory=dict)
+    balance_cycles: set[int] = field(default_factory=set)
+    inventory: dict[tuple[int, int, int], int] = field(default_factory=dict)
+    inventory_cycles: set[int] = field(default_factory=set)
+    last_ids: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    def next_id(self, table: str) -> int:
+        """Get next autoincrement id.
+
+        Args:
+            table (str): table name.
+
+        Returns:
+            int: new record id.
+        """
+        self.last_ids[table] += 1
+        return self.last_ids[table]
@@ -0,0 +1,193 @@
+import itertools
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+
+from egame179_backend.db.cycle import Cycle
+from egame179_backend.db.market import Market, MarketShare
+from egame179_backend.db.market_price import MarketPrice
+from egame179_backend.db.stocks import Stock
+from egame179_backend.db.theta import Theta
+from egame179_backend.db.transaction import Transaction
+from egame179_backend.db.user import User
+from egame179_backend.engine.snapshot import add_running_delta
+from egame179_backend.sim.store import GameStore, new_record
+
+N_RINGS = 3
+SIM_START = datetime(2023, 1, 1)
+
+
+@dataclass
+class SimConfig:  # noqa: WPS230
+    """Simulated game parameters, the counterpart of `alembic/initial_data.yaml`."""
+
+    players: int = 3
+    markets: int = 15
+    cycles: int = 10
+    seed: int = 179
+    cycle_duration: int = 600  # seconds
+    initial_balance: float = 1000
+    initial_stocks_price: float = 10
+    fees: dict[str, tuple[float, float]] = field(  # {fee: (init_fee, fee_mult)}
+        default_factory=lambda: {"alpha": (5, 1.1), "beta": (1, 1), "gamma": (0.5, 1)},
+    )
+    tau_s: int = 300
+    coeff_h: int = 10
+    coeff_k: int = 10
+    coeff_l: int = 2
+    overdraft_rate: float = 0.1
+    ring_prices: dict[int, tuple[float, float]] = field(  # {ring: (buy, sell)} on the first cycle
+        default_factory=lambda: {0: (10, 20), 1: (8, 15), 2: (5, 9)},
+    )
+    ring_demand: dict[int, int] = field(default_factory=lambda: {0: 200, 1: 100, 2: 50})
+
+    @property
+    def constants(self) -> dict[str, int | float]:
+        """Cycle constants.
+
+        Returns:
+            dict[str, int | float]: {constant: value}.
+        """
+        return {
+            "tau_s": self.tau_s,
+            "coeff_h": self.coeff_h,
+            "coeff_k": self.coeff_k,
+            "coeff_l": self.coeff_l,
+            "overdraft_rate": self.overdraft_rate,
+        }
+
+
+def initial_data(config: SimConfig) -> dict[str, Any]:  # noqa: WPS210
+    """Generate game initial data (`alembic/initial_data.yaml` schema).
+
+    Markets are split into rings 0 / 1 / 2 (1 : 2 : 2), connected within ring and to the next inner ring.
+    Each player gets a home market on the outer rings. Users have no passwords.
+
+    Args:
+        config (SimConfig): simulated game parameters.
+
+    Raises:
+        ValueError: not enough markets for player home markets.
+
+    Returns:
+        dict[str, Any]: initial data.
+    """
+    rng = np.random.default_rng(config.seed)
+    rings = _market_rings(config.markets)
+    outer = [market for market, ring in enumerate(rings) if ring > 0]
+    if len(outer) < config.players:
+        raise ValueError(f"Not enough outer ring markets ({len(outer)}) for {config.players} players")
+    players = list(range(1, config.players + 1))
+    npcs = {ring: config.players + ring + 1 for ring in range(N_RINGS)}
+    homes = dict(zip(rng.choice(outer, size=config.players, replace=False).tolist(), players))
+    n_cycles = config.cycles + 1  # the cycle after the last played one is prepared by the engine
+    return {
+        "initial_balance": config.initial_balance,
+        "initial_stocks_price": config.initial_stocks_price,
+        "users": [
+            _user(0, "root", "root", "root"),
+            *[_user(player, "player", f"PlayerCorp{player}", f"p{player}") for player in players],
+            *[_user(npc, "npc", f"NPC{ring}", None) for ring, npc in npcs.items()],
+        ],
+        "npcs": [{"user": npc, "ring": ring} for ring, npc in npcs.items()],
+        "cycles": {
+            "total": n_cycles,
+            "fees": {fee: list(fee_params) for fee, fee_params in config.fees.items()},
+            "constants": config.constants,
+        },
+        "markets": [
+            {"id": market, "name": f"M{market}", "ring": ring, "home_user": homes.get(market)}
+            for market, ring in enumerate(rings)
+        ],
+        "market_connections": [
+            {"source": source, "target": target} for source, target in _market_connections(rings, rng)
+        ],
+        "market_prices": [
+            {"cycle": 1, "market": market, "buy": buy, "sell": sell}
+            for market, ring in enumerate(rings)
+            for buy, sell in (config.ring_prices[ring],)
+        ],
+        "world_demand": {ring: [demand] * n_cycles for ring, demand in config.ring_demand.items()},
+    }
+
+
+def generate_world(config: SimConfig) -> GameStore:  # noqa: WPS210
+    """Generate initial game state, the same as filled by initial data migration.
+
+    Args:
+        config (SimConfig): simulated game parameters.
+
+    Returns:
+        GameStore: initial game state.
+    """
+    data = initial_data(config)
+    users = [new_record(User, **user) for user in data["users"]]
+    players = [user.id for user in users if user.role == "player"]
+    store = GameStore(clock=SIM_START, npcs={npc["ring"]: npc["user"] for npc in data["npcs"]}, users=users)
+    fees = data["cycles"]["fees"]
+    store.cycles = [
+        new_record(
+            Cycle,
+            id=cycle + 1,
+            **{fee: round(init_fee * mult**cycle, 2) for fee, (init_fee, mult) in fees.items()},
+            **data["cycles"]["constants"],
+        )
+        for cycle in range(data["cycles"]["total"])
+    ]
+    store.markets = [new_record(Market, **market) for market in data["markets"]]
+    store.connections = [(conn["source"], conn["target"]) for conn in data["market_connections"]]
+    store.world_demand = {
+        (cycle + 1, ring): demand
+        for ring, demands in data["world_demand"].items()
+        for cycle, demand in enumerate(demands)
+    }
+    store.prices[1] = {price["market"]: new_record(MarketPrice, **price) for price in data["market_prices"]}
+    for user, market in itertools.product(players, store.markets):
+        store.shares[1][user, market.id] = new_record(
+            MarketShare,
+            cycle=1,
+            user=user,
+            market=market.id,
+            unlocked=market.home_user == user,
+        )
+        store.thetas[1][user, market.id] = new_record(Theta, cycle=1, user=user, market=market.id, theta=0)
+    for user in [*players, *store.npcs.values()]:
+        store.stocks[1][user] = new_record(Stock, cycle=1, user=user, price=data["initial_stocks_price"])
+    for player in players:
+        transaction = new_record(
+            Transaction,
+            id=store.next_id("transactions"),
+            ts=store.clock,
+            cycle=1,
+            user=player,
+            amount=data["initial_balance"],
+            description="Initial balance",
+        )
+        store.transactions.append(transaction)
+        add_running_delta(store.balances, (1, player), transaction.amount, store.balance_cycles)
+    return store
+
+
+def _market_rings(n_markets: int) -> list[int]:
+    n_inner = max(1, n_markets // 5)
+    n_middle = max(1, 2 * n_markets // 5)
+    return [0] * n_inner + [1] * n_middle + [2] * (n_markets - n_inner - n_middle)
+
+
+def _market_connections(rings: list[int], rng: np.random.Generator) -> list[tuple[int, int]]:
+    connections: list[tuple[int, int]] = []
+    by_ring = {ring: [market for market, mring in enumerate(rings) if mring == ring] for ring in range(N_RINGS)}
+    for ring, markets in by_ring.items():
+        # ring cycle within ring & a link of each market to a random market of the next inner ring
+        neighbours = zip(markets, markets[1:] + markets[:1])
+        connections.extend((source, target) for source, target in neighbours if source != target)
+        if ring > 0 and by_ring[ring - 1]:
+            connections.extend((market, int(rng.choice(by_ring[ring - 1]))) for market in markets)
+    return connections
+
+
+def _user(user: int, role: str, name: str, login: str | None) -> dict[str, Any]:
+    # simulated users never log in, so no password hash is stored
+    return {"id": user, "role": role, "name": name, "login": login, "password": None}  # noqa: S105 (no password)
@@ -0,0 +1,269 @@
+"""Benchmarks of cycle finalization & bid endpoints on synthetic game state.
+
+Game history is played by simulator bots and written to SQLite (default) or any database from `--db-url`
+(all existing data in it is dropped!). Then the next cycle is started, bids are made through the API
+and the cycle is finished by the engine, timing each step. Results are stored as JSON to compare versions:
+
+    python -m tests.benchmark --players 30 --markets 60 --cycles 10 --output results.json --compare old.json
+"""
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import subprocess  # noqa: S404
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from importlib import metadata
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from icecream import ic
+from sqlalchemy.engine import make_url
+from sqlmodel.ext.asyncio.session import AsyncSession
+from tests.game_state import BACKEND_DIR, create_game_database, get_test_app, play_game
+
+from egame179_backend import db
+from egame179_backend.api.auth.views import create_access_token, user_claims
+from egame179_backend.db.session import dao_provider, single_transaction
+from egame179_backend.db.user import User
+from egame179_backend.engine.mechanics import finish_cycle, prepare_new_cycle
+from egame179_backend.engine.snapshot import CycleSnapshot
+from egame179_backend.sim import GameStore, SimConfig
+
+MS_IN_SECOND = 1000
+
+
+@dataclass
+class BenchmarkParams:
+    """Benchmark parameters."""
+
+    players: int = 10
+    markets: int = 30
+    cycles: int = 5
+    rounds: int = 3  # fresh database for each round
+    requests: int = 5  # list requests per round
+    strategy: str = "greedy"
+    db_url: str | None = None  # temporary SQLite database by default
+
+
+class Timer:
+    """Collects durations of named steps."""
+
+    def __init__(self) -> None:
+        self.samples: dict[str, list[float]] = defaultdict(list)
+
+    @contextmanager
+    def __call__(self, name: str) -> Iterator[None]:
+        """Time the block.
+
+        Args:
+            name (str): step name.
+
+        Yields:
+            None: timed block.
+        """
+        started = time.perf_counter()
+        yield
+        self.samples[name].append(time.perf_counter() - started)
+
+    def results(self) -> dict[str, dict[str, float]]:
+        """Summarize samples.
+
+        Returns:
+            dict[str, dict[str, float]]: {step: stats in milliseconds}.
+        """
+        return {name: _stats(samples) for name, samples in sorted(self.samples.items())}
+
+
+def _stats(samples: list[float]) -> dict[str, float]:
+    ms = sorted(sample * MS_IN_SECOND for sample in samples)
+    return {
+        "n": len(ms),
+        "mean": statistics.fmean(ms),
+        "median": statistics.median(ms),
+        "p95": ms[min(len(ms) - 1, round(0.95 * (len(ms) - 1)))],  # noqa: WPS432
+        "min": ms[0],
+        "max": ms[-1],
+    }
+
+
+def _auth(user: User) -> dict[str, str]:
+    token = create_access_token(user_claims(user))
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def run_round(url: str, params: BenchmarkParams, config: SimConfig, store: GameStore, timer: Timer) -> None:
+    """Benchmark one game cycle on fresh database.
+
+    Args:
+        url (str): async database URL.
+        params (BenchmarkParams): benchmark parameters.
+        config (SimConfig): game parameters.
+        store (GameStore): played game history.
+        timer (Timer): timer for results.
+    """
+    create_game_database(url, config, store)
+    app = get_test_app(url)
+    root = _auth(next(user for user in store.users if user.role == "root"))
+    cycle = params.cycles + 1
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test/api") as client:  # type: ignore
+        response = await client.get("/cycle/start", headers=root)
+        response.raise_for_status()
+        for user in store.users:
+            if user.role != "player":
+                continue
+            player = _auth(user)
+            shares = store.shares[cycle].values()
+            market = next(share.market for share in shares if share.user == user.id and share.unlocked)
+            with timer("POST /production/new"):
+                response = await client.post("/production/new", json={"market": market, "quantity": 1}, headers=player)
+            response.raise_for_status()
+            with timer("POST /supply/new"):
+                response = await client.post("/supply/new", json={"market": market, "quantity": 1}, headers=player)
+            response.raise_for_status()
+        for path in ("/supply/list/all", "/transaction/list/all"):
+            for _ in range(params.requests):
+                with timer(f"GET {path}"):
+                    response = await client.get(path, headers=root)
+                response.raise_for_status()
+    session: AsyncSession = app.state.db_session_factory()
+    with timer("cycle finish total"):
+        await _finish_cycle(app, session, timer)
+    await session.close()
+    await app.state.db_engine.dispose()
+
+
+async def _finish_cycle(app: FastAPI, session: AsyncSession, timer: Timer) -> None:
+    # the same steps as in `/cycle/finish` endpoint
+    async with single_transaction(session):
+        finished_cycle = await db.CycleDAO(session).finish()
+        with timer("snapshot_load"):
+            snapshot = await CycleSnapshot.load(
+                cycle=finished_cycle,
+                provide=dao_provider(app.state.db_session_factory),
+            )
+        with timer("finish_cycle"):
+            await finish_cycle(
+                snapshot=snapshot,
+                market_dao=db.MarketDAO(session),
+                supply_dao=db.SupplyDAO(session),
+                transaction_dao=db.TransactionDAO(session),
+            )
+        with timer("prepare_new_cycle"):
+            await prepare_new_cycle(
+                snapshot=snapshot,
+                balance_dao=db.BalanceDAO(session),
+                market_dao=db.MarketDAO(session),
+                price_dao=db.MarketPriceDAO(session),
+                stock_dao=db.StockDAO(session),
+                theta_dao=db.ThetaDAO(session),
+                wh_dao=db.WarehouseDAO(session),
+            )
+
+
+async def run_benchmark(params: BenchmarkParams) -> dict[str, Any]:
+    """Run benchmark.
+
+    Args:
+        params (BenchmarkParams): benchmark parameters.
+
+    Returns:
+        dict[str, Any]: results with environment info.
+    """
+    config = SimConfig(players=params.players, markets=params.markets, cycles=params.cycles)
+    store = await play_game(config, strategy=params.strategy)
+    timer = Timer()
+    with TemporaryDirectory() as tmp_dir:
+        url = params.db_url or f"sqlite+aiosqlite:///{tmp_dir}/game.db"
+        for _ in range(params.rounds):
+            await run_round(url, params, config, store, timer)
+    return {
+        "version": metadata.version("egame179_backend"),
+        "commit": _git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "params": {**asdict(params), "db_url": _hide_password(params.db_url)},
+        "results": timer.results(),
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        git_output = subprocess.run(  # noqa: S603, S607
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=BACKEND_DIR,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return git_output.stdout.strip()
+
+
+def _hide_password(url: str | None) -> str | None:
+    return None if url is None else repr(make_url(url))
+
+
+def compare(old: dict[str, Any], new: dict[str, Any]) -> str:
+    """Format comparison of mean timings of two benchmark results.
+
+    Args:
+        old (dict[str, Any]): previous results.
+        new (dict[str, Any]): current results.
+
+    Returns:
+        str: comparison table.
+    """
+    lines = [f"{'step':<28}{old.get('commit') or 'old':>12}{new.get('commit') or 'new':>12}{'ratio':>8}"]
+    for name, stats in new["results"].items():
+        old_stats = old["results"].get(name)
+        old_mean = "-" if old_stats is None else f"{old_stats['mean']:.2f}"
+        ratio = "-" if old_stats is None else f"{stats['mean'] / old_stats['mean']:.2f}"
+        lines.append(f"{name:<28}{old_mean:>12}{stats['mean']:>12.2f}{ratio:>8}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Benchmark entrypoint."""
+    defaults = BenchmarkParams()
+    parser = argparse.ArgumentParser(description="Benchmark cycle finalization & bid endpoints")
+    parser.add_argument("--players", type=int, default=defaults.players)
+    parser.add_argument("--markets", type=int, default=defaults.markets)
+    parser.add_argument("--cycles", type=int, default=defaults.cycles, help="played cycles before the benchmark")
+    parser.add_argument("--rounds", type=int, default=defaults.rounds)
+    parser.add_argument("--requests", type=int, default=defaults.requests)
+    parser.add_argument("--strategy", default=defaults.strategy)
+    parser.add_argument("--db-url", help="async database URL, its data is dropped (temporary SQLite by default)")
+    parser.add_argument("--output", type=Path, help="results JSON path")
+    parser.add_argument("--compare", type=Path, help="previous results JSON path")
+    args = parser.parse_args()
+    ic.disable()
+    params = BenchmarkParams(
+        players=args.players,
+        markets=args.markets,
+        cycles=args.cycles,
+        rounds=args.rounds,
+        requests=args.requests,
+        strategy=args.strategy,
+        db_url=args.db_url,
+    )
+    results = asyncio.run(run_benchmark(params))
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=2))
+    if args.compare is not None:
+        print(compare(json.loads(args.compare.read_text()), results))  # noqa: WPS421
+    else:
+        print(json.dumps(results["results"], indent=2))  # noqa: WPS421
+
+
+if __name__ == "__main__":
+    main()
@@ -1,138 +1,81 @@
 import asyncio
-import sys
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import Generator
+from pathlib import Path
 
-import nest_asyncio
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from icecream import ic
+from tests.game_state import create_game_database, get_test_app, play_game
 
-from egame179_backend.app.app import get_app
-from egame179_backend.db.dependencies import get_db_session
-from egame179_backend.settings import Settings
+from egame179_backend.sim import GameStore, SimConfig
 
-nest_asyncio.apply()
+ic.disable()
 
 
 @pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """
-    Create an instance of event loop for tests.
-
-    This hack is required in order to get `dbsession` fixture to work.
-    Because default fixture `event_loop` is function scoped,
-    but dbsession requires session scoped `event_loop` fixture.
+def game_config() -> SimConfig:
+    """Small game parameters.
 
-    :yields: event loop.
+    Returns:
+        SimConfig: game parameters.
     """
-    python_version = sys.version_info[:2]
-    if sys.platform.startswith("win") and python_version >= (3, 8):
-        # Avoid "RuntimeError: Event loop is closed" on Windows when tearing down tests
-        # https://github.com/encode/httpx/issues/914
-        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+    return SimConfig(players=3, markets=15, cycles=2)
 
 
 @pytest.fixture(scope="session")
-@pytest.mark.asyncio
-async def _engine() -> AsyncGenerator[AsyncEngine, None]:
-    """
-    Create engine and databases.
-
-    :yield: new engine.
-    """
-    from egame179_backend.db.meta import meta
-    from egame179_backend.db.models import load_all_models
-
-    load_all_models()
-
-    await create_database()
+def game_store(game_config: SimConfig) -> GameStore:
+    """Game history, played by bots.
 
-    engine = create_async_engine(str(settings.db_url))
-    async with engine.begin() as conn:
-        await conn.run_sync(meta.create_all)
+    Args:
+        game_config (SimConfig): game parameters.
 
-    try:
-        yield engine
-    finally:
-        await engine.dispose()
-        await drop_database()
+    Returns:
+        GameStore: game state after played cycles.
+    """
+    return asyncio.run(play_game(game_config))
 
 
 @pytest.fixture()
-@pytest.mark.asyncio
-async def dbsession(_engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
-    """
-    Get session to database.
+def game_db_url(tmp_path: Path, game_config: SimConfig, game_store: GameStore) -> str:
+    """SQLite game database with played history.
 
-    Fixture that returns a SQLAlchemy session with a SAVEPOINT, and the rollback to it
-    after the test completes.
+    Args:
+        tmp_path (Path): test temporary directory.
+        game_config (SimConfig): game parameters.
+        game_store (GameStore): played game state.
 
-    :param _engine: current engine.
-    :yields: async session.
+    Returns:
+        str: async database URL.
     """
-    connection = await _engine.connect()
-    trans = await connection.begin()
-
-    session_maker = sessionmaker(
-        connection,
-        expire_on_commit=False,
-        class_=AsyncSession,
-    )
-    session = session_maker()
-
-    try:
-        yield session
-    finally:
-        await session.close()
-        await trans.rollback()
-        await connection.close()
+    url = f"sqlite+aiosqlite:///{tmp_path}/game.db"
+    create_game_database(url, game_config, game_store)
+    return url
 
 
 @pytest.fixture()
-@pytest.mark.asyncio
-async def transaction(_engine: AsyncEngine) -> AsyncGenerator[AsyncConnection, None]:
-    """
-    Create and obtain a transaction.
-
-    :param _engine: current database engine.
-    :yield: connection.
-    """
-    conn = await _engine.begin()
-    try:
-        yield conn
-    finally:
-        await conn.rollback()
+def fastapi_app(game_db_url: str) -> Generator[FastAPI, None, None]:
+    """FastAPI application working with test game database.
 
+    Args:
+        game_db_url (str): async database URL.
 
-@pytest.fixture()
-def fastapi_app(
-    dbsession: AsyncSession,
-) -> FastAPI:
-    """
-    Fixture for creating FastAPI app.
-
-    :return: fastapi app with mocked dependencies.
+    Yields:
+        FastAPI: application.
     """
-    application = get_app()
-    application.dependency_overrides[get_db_session] = lambda: dbsession
+    app = get_test_app(game_db_url)
+    yield app
+    asyncio.run(app.state.db_engine.dispose())
 
-    return application
 
+@pytest.fixture()
+def client(fastapi_app: FastAPI) -> TestClient:
+    """Client for requesting the application.
 
-@pytest.fixture(scope="function")
-def client(
-    fastapi_app: FastAPI,
-) -> TestClient:
-    """
-    Fixture that creates client for requesting server.
+    Args:
+        fastapi_app (FastAPI): application.
 
-    :param fastapi_app: the application.
-    :return: client for the app.
+    Returns:
+        TestClient: client for the app.
     """
     return TestClient(app=fastapi_app)
@@ -0,0 +1,173 @@
+"""Synthetic game state generators: initial data, migrated database & played cycles history."""
+from argparse import Namespace
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import sqlalchemy as sa
+import yaml
+from alembic import command
+from alembic.config import Config
+from fastapi import FastAPI
+from sqlalchemy.engine import Connection, make_url
+from sqlalchemy.orm import sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from egame179_backend.app import get_app
+from egame179_backend.db.balance import Balance
+from egame179_backend.db.bulletin import Bulletin
+from egame179_backend.db.cycle import Cycle
+from egame179_backend.db.engine import create_db_engine
+from egame179_backend.db.market import MarketShare
+from egame179_backend.db.market_price import MarketPrice
+from egame179_backend.db.modificators import FeeModificator
+from egame179_backend.db.production import Production
+from egame179_backend.db.session import GAME_STATE_VERSION, TOPOLOGY_CACHE, GameStateVersion
+from egame179_backend.db.stocks import Stock
+from egame179_backend.db.supply import Supply
+from egame179_backend.db.theta import Theta
+from egame179_backend.db.topology import TopologyCache
+from egame179_backend.db.transaction import Transaction
+from egame179_backend.db.warehouse import Inventory
+from egame179_backend.sim import GameStore, SimConfig, Simulation, initial_data
+
+BACKEND_DIR = Path(__file__).parents[1]
+GAME_STATE_TABLES = (  # tables written by the game, in order of deletion
+    Balance,
+    Inventory,
+    Bulletin,
+    FeeModificator,
+    Supply,
+    Production,
+    Transaction,
+    Stock,
+    Theta,
+    MarketShare,
+    MarketPrice,
+)
+
+
+def sync_url(url: str) -> str:
+    """Get URL of sync database driver for async database URL (e.g. for migrations).
+
+    Args:
+        url (str): database URL, e.g. `sqlite+aiosqlite:///game.db` or `mysql+aiomysql://...`.
+
+    Returns:
+        str: database URL with default sync driver.
+    """
+    parsed_url = make_url(url)
+    return str(parsed_url.set(drivername=parsed_url.get_backend_name()))
+
+
+def migrate(connection: Connection, config: SimConfig) -> None:
+    """Recreate game database with alembic migrations, using generated initial data.
+
+    Args:
+        connection (Connection): database connection.
+        config (SimConfig): game parameters.
+    """
+    with TemporaryDirectory() as tmp_dir:
+        initial_yaml_path = Path(tmp_dir) / "initial_data.yaml"
+        initial_yaml_path.write_text(yaml.safe_dump(initial_data(config)))
+        alembic_config = Config(
+            str(BACKEND_DIR / "alembic.ini"),
+            cmd_opts=Namespace(x=[f"initial_data={initial_yaml_path}"]),
+        )
+        alembic_config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+        alembic_config.attributes["connection"] = connection
+        command.downgrade(alembic_config, "base")
+        command.upgrade(alembic_config, "head")
+
+
+def write_store(connection: Connection, store: GameStore) -> None:
+    """Replace game state in migrated database with simulated one.
+
+    Args:
+        connection (Connection): database connection.
+        store (GameStore): simulated game state.
+    """
+    for model in GAME_STATE_TABLES:
+        connection.execute(model.__table__.delete())  # type: ignore
+    tables = {
+        MarketPrice: [price for prices in store.prices.values() for price in prices.values()],
+        MarketShare: [share for shares in store.shares.values() for share in shares.values()],
+        Theta: [theta for thetas in store.thetas.values() for theta in thetas.values()],
+        Stock: [stock for stocks in store.stocks.values() for stock in stocks.values()],
+        Transaction: store.transactions,
+        Production: [prod for production in store.production.values() for prod in production],
+        Supply: [supply for supplies in store.supplies.values() for supply in supplies],
+        FeeModificator: store.fee_mods,
+        Bulletin: store.bulletins,
+    }
+    for model, records in tables.items():
+        if records:
+            connection.execute(model.__table__.insert(), [record.dict() for record in records])  # type: ignore
+    balances = [{"cycle": cycle, "user": user, "balance": bal} for (cycle, user), bal in store.balances.items()]
+    inventory = [
+        {"cycle": cycle, "user": user, "market": market, "quantity": quantity}
+        for (cycle, user, market), quantity in store.inventory.items()
+    ]
+    connection.execute(Balance.__table__.insert(), balances)  # type: ignore
+    if inventory:
+        connection.execute(Inventory.__table__.insert(), inventory)  # type: ignore
+    for cycle in store.cycles:
+        if cycle.ts_start is not None:
+            timestamps = {"ts_start": cycle.ts_start, "ts_finish": cycle.ts_finish}
+            connection.execute(sa.update(Cycle).where(Cycle.id == cycle.id).values(**timestamps))
+
+
+async def play_game(config: SimConfig, strategy: str = "greedy") -> GameStore:
+    """Play configured number of cycles with bots.
+
+    Args:
+        config (SimConfig): game parameters.
+        strategy (str): bots strategy.
+
+    Returns:
+        GameStore: game state after the last played cycle.
+    """
+    simulation = Simulation(config, strategy=strategy)
+    await simulation.run()
+    return simulation.store
+
+
+def create_game_database(url: str, config: SimConfig, store: GameStore) -> None:
+    """Create game database with played cycles history (all existing data is dropped).
+
+    Args:
+        url (str): database URL (sync or async driver).
+        config (SimConfig): game parameters.
+        store (GameStore): played game state, see `play_game`.
+    """
+    engine = sa.create_engine(sync_url(url))
+    with engine.begin() as connection:
+        migrate(connection, config)
+        write_store(connection, store)
+    engine.dispose()
+
+
+def get_test_app(url: str) -> FastAPI:
+    """Get application working with target database (instead of database from settings).
+
+    Static game topology cache is filled lazily, on first reads.
+
+    Args:
+        url (str): async database URL.
+
+    Returns:
+        FastAPI: application, its engine should be disposed by the caller.
+    """
+    app = get_app()
+    engine = create_db_engine(url)
+    app.state.db_engine = engine
+    app.state.game_state_version = GameStateVersion()
+    app.state.topology_cache = TopologyCache()
+    app.state.db_session_factory = sessionmaker(
+        engine,
+        autocommit=False,
+        autoflush=False,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        info={GAME_STATE_VERSION: app.state.game_state_version, TOPOLOGY_CACHE: app.state.topology_cache},
+    )
+    return app
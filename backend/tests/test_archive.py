@@ -0,0 +1,41 @@
+import asyncio
+from typing import Any
+
+import sqlalchemy as sa
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.engine import make_url
+
+from egame179_backend.api.auth.views import create_access_token
+from egame179_backend.db.archive import ARCHIVED_MODELS, LIVE_CYCLES
+
+
+def test_closed_cycles_are_archived(fastapi_app: FastAPI, game_db_url: str) -> None:
+    """Finished cycle moves logs of closed cycles to archive, history & reconciliation are unchanged."""
+    root = {"Authorization": f"Bearer {create_access_token({'sub': 'root', 'scopes': ['root']})}"}
+
+    async def requests() -> tuple[int, list[Any], list[Any], list[Any], list[Any]]:  # noqa: WPS430
+        transport = ASGITransport(app=fastapi_app)  # type: ignore
+        async with AsyncClient(transport=transport, base_url="http://test/api") as client:
+            cycle = (await client.get("/cycle/current", headers=root)).json()["id"]
+            history = (await client.get("/transaction/list/all", headers=root)).json()
+            diffs = (await client.get("/warehouse/verify", headers=root)).json()
+            (await client.get("/cycle/start", headers=root)).raise_for_status()
+            (await client.get("/cycle/finish", headers=root)).raise_for_status()
+            archived_history = (await client.get("/transaction/list/all", headers=root)).json()
+            archived_diffs = (await client.get("/warehouse/verify", headers=root)).json()
+        return cycle, history, archived_history, diffs, archived_diffs
+
+    finished_cycle, history, archived_history, diffs, archived_diffs = asyncio.run(requests())
+    assert archived_history[: len(history)] == history
+    assert archived_diffs == diffs == []
+    engine = sa.create_engine(make_url(game_db_url).set(drivername="sqlite"))
+    with engine.connect() as connection:
+        for model in ARCHIVED_MODELS:
+            name = model.__tablename__  # type: ignore
+            live_cycles = connection.execute(sa.text(f"SELECT DISTINCT cycle FROM {name}")).scalars().all()
+            archived_cycles = connection.execute(sa.text(f"SELECT DISTINCT cycle FROM {name}_archive")).scalars().all()
+            assert min(live_cycles, default=finished_cycle) > finished_cycle - LIVE_CYCLES, name
+            assert all(cycle <= finished_cycle - LIVE_CYCLES for cycle in archived_cycles), name
+        assert connection.execute(sa.text("SELECT COUNT(*) FROM transactions_archive")).scalar()
+    engine.dispose()
@@ -0,0 +1,110 @@
+import asyncio
+import threading
+import time
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+
+from egame179_backend.api.auth.token_cache import TokenCache, VerifiedToken
+from egame179_backend.api.auth.views import create_access_token, user_claims
+from egame179_backend.db import user as user_module
+from egame179_backend.db.user import User, UserDAO
+
+
+def test_verified_tokens_are_cached(fastapi_app: FastAPI) -> None:
+    """Repeated requests with the same token are authenticated from cache."""
+    root = {"Authorization": f"Bearer {create_access_token({'sub': 'root', 'scopes': ['root']})}"}
+
+    async def requests() -> tuple[list[str], dict[str, Any]]:  # noqa: WPS430
+        transport = ASGITransport(app=fastapi_app)  # type: ignore
+        async with AsyncClient(transport=transport, base_url="http://test/api") as client:
+            names = [(await client.get("/user", headers=root)).json()["name"] for _ in range(3)]
+            stats = (await client.get("/cache/tokens", headers=root)).json()
+        return names, stats
+
+    names, stats = asyncio.run(requests())
+    assert names == ["root"] * 3
+    assert stats["entries"] == 1
+    assert stats["misses"] == 1
+    assert stats["hits"] == 3
+
+
+def test_user_is_built_from_claims(fastapi_app: FastAPI) -> None:
+    """Token with user claims authenticates without users table reads, until revocation."""
+    root = {"Authorization": f"Bearer {create_access_token({'sub': 'root', 'scopes': ['root']})}"}
+    player = User(id=1, role="player", name="PlayerCorp1", login=None, password=None)
+    statements: list[str] = []
+
+    @event.listens_for(fastapi_app.state.db_engine.sync_engine, "before_cursor_execute")
+    def capture(conn: Any, cursor: Any, statement: str, *args: Any) -> None:  # noqa: WPS430
+        statements.append(statement)
+
+    async def requests() -> list[int]:  # noqa: WPS430
+        transport = ASGITransport(app=fastapi_app)  # type: ignore
+        async with AsyncClient(transport=transport, base_url="http://test/api") as client:
+            token = {"Authorization": f"Bearer {create_access_token(user_claims(player))}"}
+            user = (await client.get("/user", headers=token)).json()
+            assert user == {"id": player.id, "role": player.role, "name": player.name}
+            user_reads = len([statement for statement in statements if "FROM users" in statement])
+            (await client.post("/token/revoke", params={"user": player.id}, headers=root)).raise_for_status()
+            revoked = await client.get("/user", headers=token)
+            new_token = {"Authorization": f"Bearer {create_access_token(user_claims(player))}"}
+            reissued = await client.get("/user", headers=new_token)
+        return [user_reads, revoked.status_code, reissued.status_code]
+
+    assert asyncio.run(requests()) == [0, 401, 200]
+
+
+def test_revocation_is_shared_by_workers(fastapi_app: FastAPI) -> None:
+    """Worker with its own token cache rejects tokens revoked by another worker."""
+    root = {"Authorization": f"Bearer {create_access_token({'sub': 'root', 'scopes': ['root']})}"}
+    player = User(id=1, role="player", name="PlayerCorp1", login=None, password=None)
+
+    async def requests() -> list[int]:  # noqa: WPS430
+        transport = ASGITransport(app=fastapi_app)  # type: ignore
+        async with AsyncClient(transport=transport, base_url="http://test/api") as client:
+            token = {"Authorization": f"Bearer {create_access_token(user_claims(player))}"}
+            (await client.post("/token/revoke", params={"user": player.id}, headers=root)).raise_for_status()
+            fastapi_app.state.token_cache = TokenCache()  # another worker: revocation is only in database
+            revoked = await client.get("/user", headers=token)
+            new_token = {"Authorization": f"Bearer {create_access_token(user_claims(player))}"}
+            reissued = await client.get("/user", headers=new_token)
+        return [revoked.status_code, reissued.status_code]
+
+    assert asyncio.run(requests()) == [401, 200]
+
+
+def test_token_cache_drops_expired_and_old_tokens() -> None:
+    """Expired tokens are not served, the least recently used tokens are evicted."""
+    cache = TokenCache(maxsize=2)
+    user = User(id=1, role="player", name="player", login=None, password=None)
+    cache.add("expired", VerifiedToken(user=user, scopes=frozenset(), expires=time.time() - 1))
+    assert cache.get("expired") is None
+    for token in ("first", "second", "third"):
+        cache.add(token, VerifiedToken(user=user, scopes=frozenset(), expires=None))
+    assert cache.get("first") is None
+    assert cache.get("third") is not None
+
+
+def test_password_is_verified_off_loop(fastapi_app: FastAPI, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Password verification doesn't block the event loop."""
+    verify_threads: list[int] = []
+
+    class FakeContext:  # noqa: WPS431
+        def verify(self, password: str, password_hash: str | None) -> bool:  # noqa: D102
+            verify_threads.append(threading.get_ident())
+            return True
+
+    monkeypatch.setattr(user_module, "PWD_CONTEXT", FakeContext())
+
+    async def check() -> User | None:  # noqa: WPS430
+        async with fastapi_app.state.db_session_factory() as session:
+            return await UserDAO(session).check_credentials("root", "password")
+
+    user = asyncio.run(check())
+    assert user is not None
+    assert verify_threads
+    assert verify_threads[0] != threading.get_ident()
@@ -0,0 +1,23 @@
+import asyncio
+
+from tests.benchmark import BenchmarkParams, compare, run_benchmark
+
+STEPS = {
+    "GET /supply/list/all",
+    "GET /transaction/list/all",
+    "POST /production/new",
+    "POST /supply/new",
+    "cycle finish total",
+    "finish_cycle",
+    "prepare_new_cycle",
+    "snapshot_load",
+}
+
+
+def test_benchmark_runs() -> None:
+    """Benchmark on tiny game state times all steps & results can be compared."""
+    params = BenchmarkParams(players=2, markets=10, cycles=2, rounds=1, requests=1)
+    results = asyncio.run(run_benchmark(params))
+    assert set(results["results"]) == STEPS
+    assert results["results"]["POST /production/new"]["n"] == params.players
+    assert "finish_cycle" in compare(results, results)
@@ -0,0 +1,95 @@
+import asyncio
+import math
+from typing import Any
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from egame179_backend.api.auth.views import create_access_token, user_claims
+from egame179_backend.bid_queue import UserLocks
+from egame179_backend.sim import GameStore
+
+BIDS_PER_PLAYER = 120
+
+
+def test_user_locks_serialize_only_the_same_user() -> None:
+    """Lock of the user blocks the same user, but not users of other stripes."""
+
+    async def acquire() -> list[bool]:  # noqa: WPS430
+        locks = UserLocks(stripes=4)
+        blocked = []
+        async with locks.hold([1, 2]):
+            for users in ([3], [5], [2, 3]):  # user 5 shares the stripe with user 1
+                try:
+                    await asyncio.wait_for(_hold(locks, users), timeout=0.01)
+                except asyncio.TimeoutError:
+                    blocked.append(True)
+                else:
+                    blocked.append(False)
+        return blocked
+
+    assert asyncio.run(acquire()) == [False, True, True]
+
+
+async def _hold(locks: UserLocks, users: list[int]) -> None:
+    async with locks.hold(users):
+        await asyncio.sleep(0)
+
+
+def test_concurrent_bids_never_overdraw(fastapi_app: FastAPI, game_store: GameStore) -> None:  # noqa: WPS210
+    """Hundreds of concurrent bids leave no production overdraft or negative warehouse & consistent running totals.
+
+    Supply fee isn't checked against the balance, so only supply fees may take the balance below zero.
+    """
+    root = {"Authorization": f"Bearer {create_access_token({'sub': 'root', 'scopes': ['root']})}"}
+    players = [user for user in game_store.users if user.role == "player"]
+
+    async def requests() -> dict[str, Any]:  # noqa: WPS430
+        transport = ASGITransport(app=fastapi_app)  # type: ignore
+        async with AsyncClient(transport=transport, base_url="http://test/api") as client:
+            cycle = (await client.get("/cycle/current", headers=root)).json()["id"]
+            (await client.get("/cycle/start", headers=root)).raise_for_status()
+            bids = []
+            for player in players:
+                headers = {"Authorization": f"Bearer {create_access_token(user_claims(player))}"}
+                shares = game_store.shares[cycle].values()
+                market = next(share.market for share in shares if share.user == player.id and share.unlocked)
+                probe = {"orders": [{"market": market, "quantity": 1}]}
+                probed = (await client.post("/production/batch", json=probe, headers=headers)).json()
+                unit_cost = -probed["orders"][0]["delta"]
+                balance = (await client.get("/balance/list", headers=headers)).json()[-1]["balance"]
+                quantity = math.ceil(balance / unit_cost / 20)  # about 20 production bids drain the balance
+                for index in range(BIDS_PER_PLAYER):
+                    kind = "production" if index % 2 else "supply"
+                    order = {"market": market, "quantity": quantity if kind == "production" else 1 + index % 3}
+                    if index % 4 < 2:
+                        bids.append(client.post(f"/{kind}/new", json=order, headers=headers))
+                    else:
+                        bids.append(client.post(f"/{kind}/batch", json={"orders": [order]}, headers=headers))
+            responses = await asyncio.gather(*bids)
+            results = {"cycle": cycle, "statuses": [response.status_code for response in responses]}
+            for name, url in (
+                ("balances", "/balance/list/all"),
+                ("transactions", "/transaction/list/all"),
+                ("inventory", "/warehouse/list/all"),
+                ("diffs", "/warehouse/verify"),
+            ):
+                results[name] = (await client.get(url, headers=root)).json()
+            (await client.post("/balance/rebuild", headers=root)).raise_for_status()
+            results["rebuilt_balances"] = (await client.get("/balance/list/all", headers=root)).json()
+            results["stats"] = (await client.get("/monitoring/bids", headers=root)).json()
+        return results
+
+    results = asyncio.run(requests())
+    cycle = results["cycle"]
+    assert set(results["statuses"]) == {200, 400}  # some bids are rejected
+    fees = {player.id: 0.0 for player in players}
+    for transaction in results["transactions"]:
+        if transaction["cycle"] == cycle and transaction["description"].startswith("Fee for supply"):
+            fees[transaction["user"]] -= transaction["amount"]
+    for balance in results["balances"]:
+        assert balance["balance"] + (fees.get(balance["user"], 0) if balance["cycle"] == cycle else 0) >= 0
+    assert all(wh["quantity"] >= 0 for wh in results["inventory"])
+    assert not results["diffs"]
+    assert sorted(results["balances"], key=repr) == sorted(results["rebuilt_balances"], key=repr)
+    assert results["stats"]["bids"] == len(players) * (BIDS_PER_PLAYER + 1)
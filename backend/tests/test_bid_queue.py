@@ -0,0 +1,134 @@
+import asyncio
+import math
+from datetime import datetime
+from typing import Any
+
+import sqlalchemy as sa
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.engine import make_url
+
+from egame179_backend.api.auth.views import create_access_token, user_claims
+from egame179_backend.db.cycle import Cycle
+from egame179_backend.sim import GameStore
+
+BIDS_PER_PLAYER = 4
+
+
+def test_concurrent_bids_are_committed_together(fastapi_app: FastAPI, game_store: GameStore) -> None:
+    """Concurrent supplies are written in shared batches, each checked against preceding accepted bids."""
+    root = {"Authorization": f"Bearer {create_access_token({'sub': 'root', 'scopes': ['root']})}"}
+    players = [user for user in game_store.users if user.role == "player"]
+
+    async def requests() -> tuple[dict[int, Any], dict[int, int], dict[str, Any], list[Any]]:  # noqa: WPS430
+        transport = ASGITransport(app=fastapi_app)  # type: ignore
+        async with AsyncClient(transport=transport, base_url="http://test/api") as client:
+            cycle = (await client.get("/cycle/current", headers=root)).json()["id"]
+            (await client.get("/cycle/start", headers=root)).raise_for_status()
+            storages: dict[int, tuple[int, int, int]] = {}  # {user: (market, storage, bid quantity)}
+            for player in players:
+                headers = {"Authorization": f"Bearer {create_access_token(user_claims(player))}"}
+                share = next(sh for sh in game_store.shares[cycle].values() if sh.user == player.id and sh.unlocked)
+                bid = {"market": share.market, "quantity": 3}
+                (await client.post("/production/new", json=bid, headers=headers)).raise_for_status()
+                warehouses = (await client.get("/warehouse/list", headers=headers)).json()
+                storage = next(wh["quantity"] for wh in warehouses if wh["market"] == share.market)
+                storages[player.id] = (share.market, storage, math.ceil(storage / 3))
+            responses = await asyncio.gather(
+                *[
+                    client.post(
+                        "/supply/new",
+                        json={"market": storages[player.id][0], "quantity": storages[player.id][2]},
+                        headers={"Authorization": f"Bearer {create_access_token(user_claims(player))}"},
+                    )
+                    for player in players
+                    for _ in range(BIDS_PER_PLAYER)
+                ]
+            )
+            accepted = {player.id: 0 for player in players}
+            for index, response in enumerate(responses):
+                assert response.status_code in {200, 400}
+                accepted[players[index // BIDS_PER_PLAYER].id] += response.status_code == 200
+            stats = (await client.get("/monitoring/bids", headers=root)).json()
+            diffs = (await client.get("/warehouse/verify", headers=root)).json()
+        return storages, accepted, stats, diffs
+
+    storages, accepted, stats, diffs = asyncio.run(requests())
+    for player, (_, storage, quantity) in storages.items():
+        assert accepted[player] == min(BIDS_PER_PLAYER, storage // quantity)
+    assert stats["bids"] == len(players) * (BIDS_PER_PLAYER + 1)
+    assert stats["batches"] < stats["bids"]
+    assert not diffs
+
+
+def test_batch_orders(fastapi_app: FastAPI, game_store: GameStore) -> None:
+    """Batch orders are checked in order, atomic batch is written only if all orders are accepted."""
+    root = {"Authorization": f"Bearer {create_access_token({'sub': 'root', 'scopes': ['root']})}"}
+    player = next(user for user in game_store.users if user.role == "player")
+    headers = {"Authorization": f"Bearer {create_access_token(user_claims(player))}"}
+
+    async def requests() -> tuple[list[Any], list[int], int, list[Any]]:  # noqa: WPS430
+        transport = ASGITransport(app=fastapi_app)  # type: ignore
+        async with AsyncClient(transport=transport, base_url="http://test/api") as client:
+            cycle = (await client.get("/cycle/current", headers=root)).json()["id"]
+            (await client.get("/cycle/start", headers=root)).raise_for_status()
+            market = next(sh.market for sh in game_store.shares[cycle].values() if sh.user == player.id and sh.unlocked)
+            production = {"orders": [{"market": market, "quantity": 2}, {"market": market, "quantity": 0}]}
+            produced = await client.post("/production/batch", json={**production, "atomic": False}, headers=headers)
+            warehouses = (await client.get("/warehouse/list", headers=headers)).json()
+            storage = next(wh["quantity"] for wh in warehouses if wh["market"] == market)
+            orders = [{"market": market, "quantity": storage}, {"market": market, "quantity": 1}]
+            rejected = await client.post("/supply/batch", json={"orders": orders}, headers=headers)
+            supplied = await client.post("/supply/batch", json={"orders": orders, "atomic": False}, headers=headers)
+            warehouses = (await client.get("/warehouse/list", headers=headers)).json()
+            left = next(wh["quantity"] for wh in warehouses if wh["market"] == market)
+            results = [produced.json(), rejected.json()["detail"], supplied.json()]
+            statuses = [produced.status_code, rejected.status_code, supplied.status_code]
+            diffs = (await client.get("/warehouse/verify", headers=root)).json()
+        return [[order["accepted"] for order in res["orders"]] for res in results], statuses, left, diffs
+
+    accepted, statuses, left, diffs = asyncio.run(requests())
+    assert accepted == [[True, False], [False, False], [True, False]]
+    assert statuses == [200, 400, 200]
+    assert left == 0
+    assert not diffs
+
+
+def test_cycle_finish_closes_bid_admission(fastapi_app: FastAPI, game_db_url: str, game_store: GameStore) -> None:
+    """Bids sent during cycle finish are written to the next cycle, after the finish."""
+    root = {"Authorization": f"Bearer {create_access_token({'sub': 'root', 'scopes': ['root']})}"}
+    players = [user for user in game_store.users if user.role == "player"]
+    engine = sa.create_engine(make_url(game_db_url).set(drivername="sqlite"))
+    cycles = Cycle.__table__  # type: ignore
+    with engine.begin() as connection:  # the next cycle for bids sent during finish
+        last_cycle = connection.execute(sa.select(cycles).order_by(cycles.c.id.desc())).mappings().first()
+        connection.execute(sa.insert(cycles).values({**last_cycle, "id": last_cycle["id"] + 1}))
+
+    async def requests() -> tuple[int, list[int], list[Any], list[Any]]:  # noqa: WPS430
+        transport = ASGITransport(app=fastapi_app)  # type: ignore
+        async with AsyncClient(transport=transport, base_url="http://test/api") as client:
+            cycle = (await client.get("/cycle/current", headers=root)).json()["id"]
+            (await client.get("/cycle/start", headers=root)).raise_for_status()
+            bids = []
+            for player in players:
+                headers = {"Authorization": f"Bearer {create_access_token(user_claims(player))}"}
+                shares = game_store.shares[cycle].values()
+                market = next(share.market for share in shares if share.user == player.id and share.unlocked)
+                bids.extend(
+                    client.post("/production/new", json={"market": market, "quantity": 1}, headers=headers)
+                    for _ in range(BIDS_PER_PLAYER)
+                )
+            bids.insert(len(bids) // 2, client.get("/cycle/finish", headers=root))
+            responses = await asyncio.gather(*bids)
+            production = (await client.get("/production/list/all", headers=root)).json()
+            diffs = (await client.get("/warehouse/verify", headers=root)).json()
+        return cycle, [response.status_code for response in responses], production, diffs
+
+    cycle, statuses, production, diffs = asyncio.run(requests())
+    with engine.connect() as connection:
+        ts_finish = connection.execute(sa.select(Cycle.ts_finish).where(Cycle.id == cycle)).scalar_one()
+    engine.dispose()
+    assert set(statuses) == {200}
+    assert all(datetime.fromisoformat(prod["ts"]) < ts_finish for prod in production if prod["cycle"] == cycle)
+    assert any(prod["cycle"] == cycle + 1 for prod in production)
+    assert not diffs
@@ -0,0 +1,78 @@
+import asyncio
+from typing import Any
+
+import sqlalchemy as sa
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.engine import make_url
+
+from egame179_backend.api.auth.views import create_access_token
+from egame179_backend.db.balance import Balance
+from egame179_backend.db.running import add_running_deltas
+from egame179_backend.engine.snapshot import add_running_delta
+from egame179_backend.sim import GameStore
+
+
+def test_cycle_finish_carries_running_totals(fastapi_app: FastAPI, game_db_url: str, game_store: GameStore) -> None:
+    """Finished cycle carries balances & warehouses over without auxiliary log records."""
+    root = {"Authorization": f"Bearer {create_access_token({'sub': 'root', 'scopes': ['root']})}"}
+
+    async def requests() -> tuple[int, list[Any], list[Any], list[Any]]:  # noqa: WPS430
+        transport = ASGITransport(app=fastapi_app)  # type: ignore
+        async with AsyncClient(transport=transport, base_url="http://test/api") as client:
+            cycle = (await client.get("/cycle/current", headers=root)).json()["id"]
+            (await client.get("/cycle/start", headers=root)).raise_for_status()
+            (await client.get("/cycle/finish", headers=root)).raise_for_status()
+            diffs = (await client.get("/warehouse/verify", headers=root)).json()
+            balances = (await client.get("/balance/list/all", headers=root)).json()
+            (await client.post("/balance/rebuild", headers=root)).raise_for_status()
+            rebuilt_balances = (await client.get("/balance/list/all", headers=root)).json()
+        return cycle, diffs, balances, rebuilt_balances
+
+    finished_cycle, diffs, balances, rebuilt_balances = asyncio.run(requests())
+    assert not diffs
+    assert sorted(balances, key=repr) == sorted(rebuilt_balances, key=repr)
+    users = {balance["user"] for balance in balances if balance["cycle"] == finished_cycle}
+    assert users == {balance["user"] for balance in balances if balance["cycle"] == finished_cycle + 1}
+    engine = sa.create_engine(make_url(game_db_url).set(drivername="sqlite"))
+    with engine.connect() as connection:
+        assert not connection.execute(sa.text("SELECT COUNT(*) FROM production WHERE quantity = 0")).scalar()
+        assert not connection.execute(sa.text("SELECT COUNT(*) FROM transactions WHERE amount = 0")).scalar()
+        query = sa.text("SELECT COUNT(*) FROM inventory WHERE cycle = :cycle")
+        carried = connection.execute(query, {"cycle": finished_cycle + 1}).scalar()
+    engine.dispose()
+    assert carried == len(users) * len(game_store.markets)
+
+
+def test_running_deltas_are_written_in_bulk(fastapi_app: FastAPI) -> None:
+    """Bulk writes give the same running totals as deltas added one by one, missing records start from previous ones."""
+    existing = {  # {(cycle, user): balance}
+        (1, 1): 10.0,
+        (2, 1): 12.0,
+        (5, 1): 20.0,
+        (2, 2): 7.0,
+    }
+    deltas = {  # missing records of later cycles, out of cycles order & of a user without records
+        (2, 1): 5.0,
+        (4, 1): 1.0,
+        (3, 1): 2.0,
+        (3, 2): -1.0,
+        (1, 3): 3.0,
+    }
+    expected = dict(existing)
+    for key, delta in deltas.items():
+        add_running_delta(expected, key, delta, {expected_key[0] for expected_key in expected})
+
+    async def write() -> dict[tuple[int, int], float]:  # noqa: WPS430
+        async with fastapi_app.state.db_session_factory() as session:
+            await session.execute(sa.delete(Balance))
+            for (cycle, user), balance in existing.items():
+                session.add(Balance(cycle=cycle, user=user, balance=balance))
+            await session.flush()
+            await add_running_deltas(session, Balance, partition=("user",), value="balance", deltas=deltas)
+            raw_balances = await session.execute(sa.select(Balance.cycle, Balance.user, Balance.balance))
+            balances = {(row.cycle, row.user): row.balance for row in raw_balances.all()}
+            await session.rollback()
+        return balances
+
+    assert asyncio.run(write()) == expected
@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from egame179_backend.db.cycle import Cycle
+from egame179_backend.db.production import Production
+from egame179_backend.db.theta import Theta
+from egame179_backend.engine import math as smath
+from egame179_backend.engine.calc import calculate_new_thetas
+
+COEFF_K = 10
+
+
+def test_thetas_average_production_over_window() -> None:
+    """Mean production is taken over all cycles of the window, cycles without production count as zero."""
+    cycle = Cycle(id=3, alpha=1, beta=1, gamma=1, tau_s=1, coeff_h=1, coeff_k=COEFF_K, coeff_l=1, overdraft_rate=0)
+    thetas = [Theta(cycle=3, user=user, market=market, theta=0) for user in (1, 2) for market in (1, 2)]
+    production = [
+        Production(ts=datetime.now(), cycle=prod_cycle, user=user, market=1, quantity=quantity)
+        for prod_cycle, user, quantity in ((3, 1, 4), (3, 1, 6), (1, 2, 9), (2, 2, 12), (3, 2, 15))
+    ]
+    new_thetas = calculate_new_thetas(cycle=cycle, thetas=thetas, production=production, n_cycles=3)
+    assert new_thetas == {
+        (1, 1): smath.theta_next(n_mean=(4 + 6) / 3, coeff_k=COEFF_K),  # produced in one cycle of three
+        (1, 2): 0,
+        (2, 1): smath.theta_next(n_mean=(9 + 12 + 15) / 3, coeff_k=COEFF_K),
+        (2, 2): 0,
+    }
+    # the first cycles of the game have a shorter window
+    new_thetas = calculate_new_thetas(cycle=cycle, thetas=thetas, production=production[:2], n_cycles=1)
+    assert new_thetas[(1, 1)] == smath.theta_next(n_mean=4 + 6, coeff_k=COEFF_K)
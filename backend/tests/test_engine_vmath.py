@@ -0,0 +1,105 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from egame179_backend.engine import math as smath
+from egame179_backend.engine import vmath
+
+N_SAMPLES = 10000
+
+
+@pytest.fixture()
+def rng() -> np.random.Generator:
+    """Seeded random generator for formula inputs.
+
+    Returns:
+        np.random.Generator: random generator.
+    """
+    return np.random.default_rng(179)
+
+
+def test_production_cost(rng: np.random.Generator) -> None:
+    """Array production cost equals scalar one."""
+    theta = np.round(rng.uniform(0, 0.34, N_SAMPLES), 3)
+    price = np.round(rng.uniform(1, 1000, N_SAMPLES), 2)
+    quantity = rng.integers(1, 100, N_SAMPLES)
+    expected = [smath.production_cost(*args) for args in zip(theta.tolist(), price.tolist(), quantity.tolist())]
+    assert vmath.production_cost(theta, price, quantity).tolist() == expected
+
+
+def test_buy_price_next(rng: np.random.Generator) -> None:
+    """Array buy price equals scalar one."""
+    n_mt = rng.integers(0, 500, N_SAMPLES)
+    n_mt1 = rng.integers(0, 500, N_SAMPLES)
+    p_mt = np.round(rng.uniform(1, 1000, N_SAMPLES), 2)
+    expected = [
+        smath.buy_price_next(n_mt=n, n_mt1=n1, coeff_h=50, p_mt=price)
+        for n, n1, price in zip(n_mt.tolist(), n_mt1.tolist(), p_mt.tolist())
+    ]
+    assert vmath.buy_price_next(n_mt=n_mt, n_mt1=n_mt1, coeff_h=50, p_mt=p_mt).tolist() == expected
+
+
+def test_sell_price_next(rng: np.random.Generator) -> None:
+    """Array sell price equals scalar one, including rounding of decimal ties."""
+    n_mt = rng.integers(0, 500, N_SAMPLES)
+    d_mt = rng.integers(1, 500, N_SAMPLES)
+    s_mt = np.round(rng.uniform(1, 1000, N_SAMPLES), 2)
+    expected = [
+        smath.sell_price_next(n_mt=n, d_mt=demand, coeff_l=2, s_mt=price)
+        for n, demand, price in zip(n_mt.tolist(), d_mt.tolist(), s_mt.tolist())
+    ]
+    assert vmath.sell_price_next(n_mt=n_mt, d_mt=d_mt, coeff_l=2, s_mt=s_mt).tolist() == expected
+
+
+def test_theta_next(rng: np.random.Generator) -> None:
+    """Array theta equals scalar one."""
+    n_mean = rng.integers(0, 300, N_SAMPLES) / rng.integers(1, 4, N_SAMPLES)
+    expected = [smath.theta_next(n_mean=mean, coeff_k=100) for mean in n_mean.tolist()]
+    assert vmath.theta_next(n_mean=n_mean, coeff_k=100).tolist() == expected
+
+
+def test_delivered_items(rng: np.random.Generator) -> None:
+    """Array delivered items equal scalar ones."""
+    ts_finish = datetime(2023, 1, 1, 12)
+    ts_start = [ts_finish - timedelta(microseconds=int(us)) for us in rng.integers(0, 10**9, N_SAMPLES)]
+    velocity = rng.uniform(0, 2, N_SAMPLES)
+    quantity = rng.integers(1, 1000, N_SAMPLES)
+    expected = [
+        smath.delivered_items(ts_start=start, ts_finish=ts_finish, velocity=vel, quantity=qnt)
+        for start, vel, qnt in zip(ts_start, velocity.tolist(), quantity.tolist())
+    ]
+    delivery_time = np.datetime64(ts_finish, "us") - np.array(ts_start, dtype="datetime64[us]")
+    delivery_time = delivery_time / np.timedelta64(1, "s")
+    assert vmath.delivered_items(delivery_time=delivery_time, velocity=velocity, quantity=quantity).tolist() == expected
+
+
+def test_sold_items(rng: np.random.Generator) -> None:
+    """Array sold items equal scalar ones."""
+    delivered = rng.integers(0, 100, N_SAMPLES)
+    total = delivered + rng.integers(1, 1000, N_SAMPLES)
+    demand = rng.integers(1, 1000, N_SAMPLES)
+    expected = [
+        smath.sold_items(delivered=dlv, demand=dmd, total=tot)
+        for dlv, dmd, tot in zip(delivered.tolist(), demand.tolist(), total.tolist())
+    ]
+    assert vmath.sold_items(delivered=delivered, demand=demand, total=total).tolist() == expected
+
+
+def test_bulletin_quantity(rng: np.random.Generator) -> None:
+    """Array bulletin quantities equal scalar ones drawn from the same random state."""
+    quantity = rng.integers(1, 100, N_SAMPLES)
+    np.random.seed(0)
+    expected = [smath.bulletin_quantity(qnt) for qnt in quantity.tolist()]
+    np.random.seed(0)
+    assert vmath.bulletin_quantity(quantity).tolist() == expected
+
+
+def test_stocks_price(rng: np.random.Generator) -> None:
+    """Array stock prices equal scalar ones drawn from the same random state."""
+    prev_price = np.round(rng.uniform(1, 1000, N_SAMPLES), 2)
+    rel_income = rng.uniform(0, 3, N_SAMPLES)
+    np.random.seed(0)
+    expected = [smath.stocks_price(*args) for args in zip(prev_price.tolist(), rel_income.tolist())]
+    np.random.seed(0)
+    assert vmath.stocks_price(prev_price=prev_price, rel_income=rel_income).tolist() == expected
@@ -0,0 +1,41 @@
+import asyncio
+
+from egame179_backend.db.user import User
+from egame179_backend.events import EventBus, EventType, GameEvent
+
+
+def _user(user_id: int, role: str = "player") -> User:
+    return User(id=user_id, role=role, name=f"user{user_id}")
+
+
+def test_private_events_are_visible_to_user_and_root() -> None:
+    """Events of the user are delivered to the user & root only, public events to everybody."""
+    bus = EventBus()
+
+    async def received() -> dict[str, list[EventType]]:  # noqa: WPS430
+        async with bus.subscribe(_user(1)) as player, bus.subscribe(_user(2)) as other:
+            async with bus.subscribe(_user(0, role="root")) as root:
+                bus.publish(GameEvent(type=EventType.balance, user=1, data={"delta": -10}))
+                bus.publish(GameEvent(type=EventType.cycle_finish, cycle=1))
+                queues = {"player": player, "other": other, "root": root}
+                return {name: [queue.get_nowait().type for _ in range(queue.qsize())] for name, queue in queues.items()}
+
+    assert asyncio.run(received()) == {
+        "player": [EventType.balance, EventType.cycle_finish],
+        "other": [EventType.cycle_finish],
+        "root": [EventType.balance, EventType.cycle_finish],
+    }
+    assert bus.subscribers == 0
+
+
+def test_slow_subscriber_gets_reset() -> None:
+    """Overflowed subscriber queue is replaced with a single reset event."""
+    bus = EventBus(maxsize=2)
+
+    async def received() -> list[EventType]:  # noqa: WPS430
+        async with bus.subscribe(_user(1)) as queue:
+            for cycle in range(3):
+                bus.publish(GameEvent(type=EventType.cycle_start, cycle=cycle))
+            return [queue.get_nowait().type for _ in range(queue.qsize())]
+
+    assert asyncio.run(received()) == [EventType.reset]
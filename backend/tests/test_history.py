@@ -0,0 +1,82 @@
+import asyncio
+from datetime import datetime
+from typing import Any
+
+import sqlalchemy as sa
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.engine import make_url
+
+from egame179_backend.api.auth.views import create_access_token
+from egame179_backend.db.transaction import Transaction
+
+
+def test_history_cursors_return_tail(fastapi_app: FastAPI) -> None:
+    """History requested with a cursor is the tail of the full history."""
+    root = {"Authorization": f"Bearer {create_access_token({'sub': 'root', 'scopes': ['root']})}"}
+
+    async def requests() -> dict[str, tuple[list[dict[str, Any]], list[dict[str, Any]]]]:  # noqa: WPS430
+        transport = ASGITransport(app=fastapi_app)  # type: ignore
+        histories = {}
+        async with AsyncClient(transport=transport, base_url="http://test/api") as client:
+            for url, cursor in (
+                ("/transaction/list/all", "since_id"),
+                ("/production/list/all", "since_id"),
+                ("/balance/list/all", "since_cycle"),
+                ("/market/prices", "since_cycle"),
+                ("/production/thetas/all", "since_cycle"),
+                ("/stocks/list", "since_cycle"),
+            ):
+                full = (await client.get(url, headers=root)).json()
+                key = "id" if cursor == "since_id" else "cycle"
+                middle = sorted(record[key] for record in full)[len(full) // 2]
+                tail = (await client.get(url, params={cursor: middle}, headers=root)).json()
+                if key == "id":  # the last known record, records of its cycle are returned again
+                    cycle = next(record["cycle"] for record in full if record["id"] == middle)
+                    expected = [record for record in full if record["id"] > middle or record["cycle"] >= cycle]
+                else:  # the first changed cycle
+                    expected = [record for record in full if record["cycle"] >= middle]
+                histories[url] = (tail, expected)
+        return histories
+
+    for url, (tail, expected) in asyncio.run(requests()).items():
+        assert tail, url
+        assert sorted(tail, key=repr) == sorted(expected, key=repr), url
+
+
+def test_id_cursor_gets_out_of_order_commits(fastapi_app: FastAPI, game_db_url: str) -> None:
+    """Record committed after a record with greater id is returned by the next `since_id` request."""
+    root = {"Authorization": f"Bearer {create_access_token({'sub': 'root', 'scopes': ['root']})}"}
+    engine = sa.create_engine(make_url(game_db_url).set(drivername="sqlite"))
+
+    def commit_transaction(transaction_id: int, cycle: int) -> None:  # noqa: WPS430
+        with engine.begin() as connection:
+            connection.execute(
+                sa.insert(Transaction.__table__).values(  # type: ignore
+                    id=transaction_id,
+                    ts=datetime.now(),
+                    cycle=cycle,
+                    user=1,
+                    amount=-1,
+                    description="Out of order",
+                ),
+            )
+
+    async def requests() -> list[set[int]]:  # noqa: WPS430
+        transport = ASGITransport(app=fastapi_app)  # type: ignore
+        async with AsyncClient(transport=transport, base_url="http://test/api") as client:
+            cycle = (await client.get("/cycle/current", headers=root)).json()["id"]
+            cursor = max(record["id"] for record in (await client.get("/transaction/list/all", headers=root)).json())
+            synced = []
+            for transaction_id in (cursor + 2, cursor + 1):  # the second writer commits first
+                commit_transaction(transaction_id, cycle)
+                params = {"since_id": cursor}
+                tail = (await client.get("/transaction/list/all", params=params, headers=root)).json()
+                synced.append({record["id"] for record in tail})
+                cursor = max(synced[-1], default=cursor)
+        return synced
+
+    first, second = asyncio.run(requests())
+    engine.dispose()
+    assert max(first) in second
+    assert max(first) - 1 in second
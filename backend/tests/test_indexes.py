@@ -0,0 +1,67 @@
+import asyncio
+import sqlite3
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from egame179_backend import db
+from egame179_backend.sim import GameStore
+
+HOT_QUERIES: dict[str, Callable[[AsyncSession, int], Awaitable[Any]]] = {  # {name: DAO call with (session, user)}
+    "supplies of user": lambda session, user: db.SupplyDAO(session).select(cycle=1, user=user),
+    "ongoing supplies of user": lambda session, user: db.SupplyDAO(session).select(cycle=1, user=user, ongoing=True),
+    "supplies of cycle": lambda session, _: db.SupplyDAO(session).select(cycle=1),
+    "production of user": lambda session, user: db.ProductionDAO(session).select(user=user),
+    "production of cycle": lambda session, _: db.ProductionDAO(session).select(cycle=1),
+    "transactions of user": lambda session, user: db.TransactionDAO(session).select(user=user),
+    "new transactions": lambda session, _: db.TransactionDAO(session).select(since_id=1),
+    "bulletins of cycle": lambda session, _: db.BulletinDAO(session).select(cycle=1),
+    "balances of user": lambda session, user: db.BalanceDAO(session).select(user=user),
+    "balances of cycle": lambda session, _: db.BalanceDAO(session).select(cycle=1),
+    "thetas of user": lambda session, user: db.ThetaDAO(session).select(user=user),
+    "thetas of cycle": lambda session, _: db.ThetaDAO(session).select(cycle=1),
+    "inventory of user": lambda session, user: db.WarehouseDAO(session).select(cycle=1, user=user),
+    "shares of user": lambda session, user: db.MarketDAO(session).select_shares(cycle=1, user=user),
+    "prices of cycle": lambda session, _: db.MarketPriceDAO(session).select(cycle=1),
+    "stocks of cycle": lambda session, _: db.StockDAO(session).select(cycle=1),
+}
+
+
+async def _capture_queries(url: str, user: int) -> dict[str, list[tuple[str, Any]]]:
+    engine = create_async_engine(url)
+    queries: dict[str, list[tuple[str, Any]]] = {}
+    current: list[tuple[str, Any]] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def capture(conn: Any, cursor: Any, statement: str, parameters: Any, *args: Any) -> None:  # noqa: WPS430
+        if statement.lstrip().upper().startswith("SELECT"):
+            current.append((statement, parameters))
+
+    for name, call in HOT_QUERIES.items():
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            await call(session, user)
+        queries[name] = current.copy()
+        current.clear()
+    await engine.dispose()
+    return queries
+
+
+def test_dao_queries_use_indexes(game_db_url: str, game_store: GameStore) -> None:
+    """DAO queries with predicates search by index, without full table scans."""
+    user = next(player.id for player in game_store.users if player.role == "player")
+    queries = asyncio.run(_capture_queries(game_db_url, user))
+    connection = sqlite3.connect(make_url(game_db_url).database)  # type: ignore
+    full_scans = {}
+    for name, statements in queries.items():
+        assert statements, name
+        for statement, parameters in statements:
+            plan = connection.execute(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+            scans = [row[-1] for row in plan if row[-1].startswith("SCAN")]
+            if scans:
+                full_scans[name] = scans
+    connection.close()
+    assert not full_scans
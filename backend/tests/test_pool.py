@@ -0,0 +1,50 @@
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import exc as sa_exc
+
+from egame179_backend.api.auth.views import create_access_token
+from egame179_backend.db.engine import create_db_engine, pool_stats
+
+
+def test_pool_stats_endpoint(fastapi_app: FastAPI) -> None:
+    """Pool statistics count checkouts of the served requests."""
+    root = {"Authorization": f"Bearer {create_access_token({'sub': 'root', 'scopes': ['root']})}"}
+
+    async def requests() -> dict[str, Any]:  # noqa: WPS430
+        transport = ASGITransport(app=fastapi_app)  # type: ignore
+        async with AsyncClient(transport=transport, base_url="http://test/api") as client:
+            (await client.get("/root/state", headers=root)).raise_for_status()
+            return (await client.get("/monitoring/db", headers=root)).json()
+
+    stats = asyncio.run(requests())
+    assert stats["pool"] == "InstrumentedPool"
+    assert stats["checkouts"] >= 1
+    assert stats["max_checked_out"] >= 1
+    assert stats["checked_out"] == stats["timeouts"] == 0
+
+
+def test_pool_exhaustion_is_counted(tmp_path: Path) -> None:
+    """Checkout timeouts & wait times are counted when all connections are busy."""
+
+    async def exhaust() -> dict[str, Any]:  # noqa: WPS430
+        engine = create_db_engine(
+            f"sqlite+aiosqlite:///{tmp_path}/game.db",
+            pool_options={"pool_size": 1, "max_overflow": 0, "pool_timeout": 0.1},
+        )
+        async with engine.connect():
+            with pytest.raises(sa_exc.TimeoutError):
+                async with engine.connect():
+                    pass  # noqa: WPS420
+        stats = pool_stats(engine)
+        await engine.dispose()
+        return stats
+
+    stats = asyncio.run(exhaust())
+    assert (stats["size"], stats["max_overflow"], stats["timeout"]) == (1, 0, 0.1)
+    assert stats["timeouts"] == 1
+    assert stats["wait_max"] >= 0.1
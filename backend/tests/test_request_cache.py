@@ -0,0 +1,39 @@
+import asyncio
+from types import SimpleNamespace
+
+from egame179_backend.db.session import invalidate, request_cached
+
+
+class CountingDAO:
+    """DAO counting database reads."""
+
+    def __init__(self) -> None:
+        self.session = SimpleNamespace(info={})
+        self.reads = 0
+
+    @request_cached("items")
+    async def select(self, cycle: int) -> list[int]:
+        self.reads += 1
+        return [cycle]
+
+
+def test_reads_are_cached_per_arguments() -> None:
+    """Repeated reads with the same arguments hit the database once."""
+    dao = CountingDAO()
+
+    async def read_all() -> list[list[int]]:  # noqa: WPS430
+        return [await dao.select(1), await dao.select(1), await dao.select(2)]
+
+    assert asyncio.run(read_all()) == [[1], [1], [2]]
+    assert dao.reads == 2
+
+
+def test_invalidate_drops_table_reads() -> None:
+    """Invalidated table is read again."""
+    dao = CountingDAO()
+    asyncio.run(dao.select(1))
+    invalidate(dao.session, "other")  # type: ignore
+    asyncio.run(dao.select(1))
+    invalidate(dao.session, "items")  # type: ignore
+    asyncio.run(dao.select(1))
+    assert dao.reads == 2
@@ -0,0 +1,60 @@
+import asyncio
+import time
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from jose import jwt
+
+from egame179_backend.api.auth.dependencies import ALGORITHM
+from egame179_backend.api.auth.views import create_access_token, user_claims
+from egame179_backend.settings import settings
+from egame179_backend.sim import GameStore
+
+
+def test_etag_is_valid_until_write(fastapi_app: FastAPI) -> None:
+    """Unchanged response gets 304 Not Modified, any write changes ETag."""
+    root = {"Authorization": f"Bearer {create_access_token({'sub': 'root', 'scopes': ['root']})}"}
+
+    async def requests() -> list[tuple[int, str | None]]:  # noqa: WPS430
+        transport = ASGITransport(app=fastapi_app)  # type: ignore
+        async with AsyncClient(transport=transport, base_url="http://test/api") as client:
+            first = await client.get("/balance/list/all", headers=root)
+            etag = first.headers["ETag"]
+            not_modified = await client.get("/balance/list/all", headers={**root, "If-None-Match": etag})
+            (await client.get("/cycle/start", headers=root)).raise_for_status()
+            changed = await client.get("/balance/list/all", headers={**root, "If-None-Match": etag})
+        return [(response.status_code, response.headers.get("ETag")) for response in (first, not_modified, changed)]
+
+    first, not_modified, changed = asyncio.run(requests())
+    assert first[0] == 200  # noqa: WPS432
+    assert not_modified == (304, first[1])  # noqa: WPS432
+    assert changed[0] == 200  # noqa: WPS432
+    assert changed[1] != first[1]
+
+
+def test_cached_response_needs_valid_token(fastapi_app: FastAPI, game_store: GameStore) -> None:
+    """Cached response isn't served for revoked or expired token."""
+    root = {"Authorization": f"Bearer {create_access_token({'sub': 'root', 'scopes': ['root']})}"}
+    player = next(user for user in game_store.users if user.role == "player")
+    revoked = create_access_token(user_claims(player))
+    expiring = jwt.encode(
+        {**user_claims(player), "exp": time.time() + 0.5, "iat": time.time()},
+        settings.jwt_secret,
+        algorithm=ALGORITHM,
+    )
+
+    async def requests() -> list[int]:  # noqa: WPS430
+        transport = ASGITransport(app=fastapi_app)  # type: ignore
+        async with AsyncClient(transport=transport, base_url="http://test/api") as client:
+            statuses = []
+            for token in (expiring, revoked):
+                headers = {"Authorization": f"Bearer {token}"}
+                statuses.append((await client.get("/balance/list", headers=headers)).status_code)
+                if token == revoked:
+                    (await client.post("/token/revoke", params={"user": player.id}, headers=root)).raise_for_status()
+                else:
+                    await asyncio.sleep(1.5)
+                statuses.append((await client.get("/balance/list", headers=headers)).status_code)
+        return statuses
+
+    assert asyncio.run(requests()) == [200, 401, 200, 401]  # noqa: WPS432
@@ -0,0 +1,38 @@
+import asyncio
+from collections import defaultdict
+
+import pytest
+
+from egame179_backend.sim import SimConfig, Simulation
+
+CONFIG = SimConfig(players=4, markets=15, cycles=4)
+
+
+@pytest.mark.parametrize("strategy", ["idle", "random", "greedy"])
+def test_simulation_is_consistent(strategy: str) -> None:
+    """Running balances & inventory agree with transactions & production/supply logs."""
+    simulation = Simulation(CONFIG, strategy=strategy)
+    reports = asyncio.run(simulation.run())
+    store = simulation.store
+    assert [report.cycle for report in reports] == [1, 2, 3, 4]
+    totals: dict[int, float] = defaultdict(float)
+    for transaction in store.transactions:
+        totals[transaction.user] += transaction.amount
+    assert totals == pytest.approx({user: store.balances[5, user] for user in totals})
+    items: dict[tuple[int, int], int] = defaultdict(int)
+    for production in store.production.values():
+        for prod in production:
+            items[(prod.user, prod.market)] += prod.quantity
+    for supplies in store.supplies.values():
+        for supply in supplies:
+            items[(supply.user, supply.market)] -= supply.sold or supply.quantity
+    assert all(quantity >= 0 for quantity in store.inventory.values())
+    assert items == {key: store.inventory[(5, *key)] for key in items}
+
+
+def test_simulation_is_reproducible() -> None:
+    """Same seed gives the same game."""
+    first = asyncio.run(Simulation(CONFIG, strategy="random").run())
+    second = asyncio.run(Simulation(CONFIG, strategy="random").run())
+    assert [report.balances for report in first] == [report.balances for report in second]
+    assert [report.stocks for report in first] == [report.stocks for report in second]
@@ -0,0 +1,29 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+
+from egame179_backend.db.engine import create_db_engine
+from egame179_backend.settings import Settings
+
+
+def test_db_url_setting(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Database URL is assembled for MariaDB unless it is set explicitly."""
+    settings = Settings(db_host="db", db_pass="secret", db_base="egame179")
+    assert settings.db_url == "mysql+aiomysql://egame179_backend:secret@db:3306/egame179"
+    monkeypatch.setenv("EGAME179_BACKEND_DB_URL", "sqlite+aiosqlite:///game.db")
+    assert Settings().db_url == "sqlite+aiosqlite:///game.db"
+
+
+def test_sqlite_engine_uses_wal(tmp_path: Path) -> None:
+    """SQLite connections work in WAL mode."""
+
+    async def journal_mode() -> str:  # noqa: WPS430
+        engine = create_db_engine(f"sqlite+aiosqlite:///{tmp_path}/game.db")
+        async with engine.connect() as connection:
+            mode = (await connection.execute(text("PRAGMA journal_mode"))).scalar()
+        await engine.dispose()
+        return mode
+
+    assert asyncio.run(journal_mode()) == "wal"
@@ -0,0 +1,71 @@
+import asyncio
+from typing import Any
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from egame179_backend.api.auth.views import create_access_token
+from egame179_backend.sim import GameStore
+
+PLAYER_SECTIONS = {  # {section: separate endpoint}
+    "balances": "/balance/list",
+    "production": "/production/list",
+    "shares": "/market/shares",
+    "storage": "/warehouse/list",
+    "supplies": "/supply/projection",
+}
+ROOT_SECTIONS = {
+    "prices": "/market/prices",
+    "stocks": "/stocks/list",
+    "supplies": "/supply/projection/all",
+    "sync_status": "/sync/status",
+}
+
+
+def _auth(name: str, role: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {create_access_token({'sub': name, 'scopes': [role]})}"}
+
+
+def test_state_sections_match_endpoints(fastapi_app: FastAPI, game_store: GameStore) -> None:
+    """Bootstrap state sections are the same as responses of separate endpoints."""
+    player = next(user for user in game_store.users if user.role == "player")
+    roles = [
+        ("/player/state", _auth(player.name, "player"), PLAYER_SECTIONS),
+        ("/root/state", _auth("root", "root"), ROOT_SECTIONS),
+    ]
+
+    async def requests() -> list[tuple[dict[str, Any], dict[str, Any]]]:  # noqa: WPS430
+        transport = ASGITransport(app=fastapi_app)  # type: ignore
+        responses = []
+        async with AsyncClient(transport=transport, base_url="http://test/api") as client:
+            for url, auth, sections in roles:
+                state = (await client.get(url, headers=auth)).json()
+                separate = {name: (await client.get(path, headers=auth)).json() for name, path in sections.items()}
+                responses.append((state, separate))
+        return responses
+
+    for state, separate in asyncio.run(requests()):
+        assert state["versions"].keys() == state["sections"].keys()
+        for name, content in separate.items():
+            assert state["sections"][name] == content
+
+
+def test_state_skips_known_sections(fastapi_app: FastAPI) -> None:
+    """Sections with versions known to client are not sent, unknown section is rejected."""
+    root = _auth("root", "root")
+
+    async def requests() -> tuple[dict[str, Any], dict[str, Any], int]:  # noqa: WPS430
+        transport = ASGITransport(app=fastapi_app)  # type: ignore
+        async with AsyncClient(transport=transport, base_url="http://test/api") as client:
+            params = {"sections": ["balances", "prices"]}
+            first = (await client.get("/root/state", params=params, headers=root)).json()
+            known = {"known": [f"{name}:{version}" for name, version in first["versions"].items() if name == "prices"]}
+            second = (await client.get("/root/state", params={**params, **known}, headers=root)).json()
+            invalid = await client.get("/root/state", params={"sections": ["unknown"]}, headers=root)
+        return first, second, invalid.status_code
+
+    first, second, invalid_status = asyncio.run(requests())
+    assert first["sections"].keys() == {"balances", "prices"}
+    assert second["versions"] == first["versions"]
+    assert second["sections"] == {"balances": first["sections"]["balances"]}
+    assert invalid_status == 400  # noqa: WPS432
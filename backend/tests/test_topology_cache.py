@@ -0,0 +1,51 @@
+import asyncio
+
+from fastapi import FastAPI
+from sqlalchemy import update
+
+from egame179_backend.db import MarketDAO, UserDAO
+from egame179_backend.db.user import User
+
+
+def test_topology_is_read_once(fastapi_app: FastAPI) -> None:
+    """Loaded topology is served from memory to all sessions until invalidation."""
+    cache = fastapi_app.state.topology_cache
+    session_factory = fastapi_app.state.db_session_factory
+
+    async def read_topology() -> tuple[int, int, int]:  # noqa: WPS430
+        async with session_factory() as session:
+            markets = await MarketDAO(session).select_markets()
+            graph = await MarketDAO(session).get_graph()
+            names = await UserDAO(session).get_names()
+        return len(markets), graph.number_of_nodes(), len(names)
+
+    asyncio.run(cache.load(session_factory))
+    misses = cache.misses
+    first = asyncio.run(read_topology())
+    assert asyncio.run(read_topology()) == first
+    assert cache.misses == misses
+    assert cache.hits >= 6  # noqa: WPS432
+    cache.invalidate()
+    asyncio.run(read_topology())
+    assert cache.misses > misses
+
+
+def test_users_lookup_is_not_cached(fastapi_app: FastAPI) -> None:
+    """Authentication lookup reads users table, changed user rows are seen at once."""
+    cache = fastapi_app.state.topology_cache
+    session_factory = fastapi_app.state.db_session_factory
+
+    async def change_password() -> tuple[User | None, User | None]:  # noqa: WPS430
+        async with session_factory() as session:
+            before = await UserDAO(session).get_by_name("root")
+        async with session_factory() as session:
+            await session.execute(update(User).where(User.name == "root").values(password="changed"))
+            await session.commit()
+        async with session_factory() as session:
+            after = await UserDAO(session).get_by_name("root")
+        return before, after
+
+    asyncio.run(cache.load(session_factory))
+    before, after = asyncio.run(change_password())
+    assert before is not None and after is not None
+    assert before.password != after.password == "changed"
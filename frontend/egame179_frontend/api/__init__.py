@@ -2,10 +2,12 @@
 from egame179_frontend.api.balance import BalanceAPI
 from egame179_frontend.api.bulletin import BulletinAPI
 from egame179_frontend.api.cycle import CycleAPI
+from egame179_frontend.api.events import EventsAPI
 from egame179_frontend.api.market import MarketAPI
 from egame179_frontend.api.modificators import ModificatorAPI
 from egame179_frontend.api.price import PriceAPI
 from egame179_frontend.api.production import ProductionAPI
+from egame179_frontend.api.state import StateAPI
 from egame179_frontend.api.stocks import StocksAPI
 from egame179_frontend.api.supply import SupplyAPI
 from egame179_frontend.api.sync import SyncStatusAPI
@@ -17,10 +19,12 @@ __all__ = [
     "BalanceAPI",
     "BulletinAPI",
     "CycleAPI",
+    "EventsAPI",
     "MarketAPI",
     "ModificatorAPI",
     "PriceAPI",
     "ProductionAPI",
+    "StateAPI",
     "StocksAPI",
     "SupplyAPI",
     "SyncStatusAPI",
@@ -1,8 +1,7 @@
 """Balances API."""
-import httpx
-import streamlit as st
 from pydantic import BaseModel, parse_obj_as
 
+from egame179_frontend.api.client import get_json
 from egame179_frontend.settings import settings
 
 
@@ -22,23 +21,27 @@ class BalanceAPI:
     _list_all_url = str(_api_url / "list" / "all")
 
     @classmethod
-    def get_user_balances(cls) -> list[Balance]:
+    def get_user_balances(cls, since_cycle: int | None = None) -> list[Balance]:
         """Get current user balances.
 
+        Args:
+            since_cycle (int, optional): get only records of this & later cycles.
+
         Returns:
             list[Balance]: current user balance history.
         """
-        response = httpx.get(cls._list_url, headers=st.session_state.auth_header)
-        response.raise_for_status()
-        return parse_obj_as(list[Balance], response.json())
+        records = get_json(cls._list_url, section="balances", params={"since_cycle": since_cycle})
+        return parse_obj_as(list[Balance], records)
 
     @classmethod
-    def get_balances(cls) -> list[Balance]:
+    def get_balances(cls, since_cycle: int | None = None) -> list[Balance]:
         """Get all users balances.
 
+        Args:
+            since_cycle (int, optional): get only records of this & later cycles.
+
         Returns:
             list[Balance]: all users balance history.
         """
-        response = httpx.get(cls._list_all_url, headers=st.session_state.auth_header)
-        response.raise_for_status()
-        return parse_obj_as(list[Balance], response.json())
+        records = get_json(cls._list_all_url, section="balances", params={"since_cycle": since_cycle})
+        return parse_obj_as(list[Balance], records)
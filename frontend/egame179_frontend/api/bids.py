@@ -0,0 +1,46 @@
+"""Batch bids API."""
+import streamlit as st
+from pydantic import BaseModel
+
+from egame179_frontend.api.client import get_client
+
+
+class OrderResult(BaseModel):
+    """Bid order result."""
+
+    market: int
+    quantity: int
+    accepted: bool
+    delta: float = 0
+    error: str | None = None
+
+
+class BatchResult(BaseModel):
+    """Bid orders batch result."""
+
+    cycle: int
+    committed: bool
+    orders: list[OrderResult]
+
+
+def post_batch(url: str, orders: dict[int, int], atomic: bool) -> BatchResult:
+    """Send bid orders for several markets.
+
+    Args:
+        url (str): batch endpoint URL.
+        orders (dict[int, int]): {market id: number of items}.
+        atomic (bool): if True, orders are accepted only all together.
+
+    Returns:
+        BatchResult: result of each order, rejected atomic batch is not committed.
+    """
+    batch = {
+        "orders": [{"market": market, "quantity": quantity} for market, quantity in orders.items()],
+        "atomic": atomic,
+    }
+    response = get_client().post(url, json=batch, headers=st.session_state.auth_header)
+    detail = response.json().get("detail") if response.status_code == 400 else None
+    if isinstance(detail, dict):
+        return BatchResult.parse_obj(detail)
+    response.raise_for_status()
+    return BatchResult.parse_obj(response.json())
@@ -1,10 +1,10 @@
 """Bulletins API."""
 from datetime import datetime
 
-import httpx
 import streamlit as st
 from pydantic import BaseModel, parse_obj_as
 
+from egame179_frontend.api.client import get_client
 from egame179_frontend.settings import settings
 
 
@@ -29,6 +29,6 @@ class BulletinAPI:
         Returns:
             list[Bulletin]: current cycle bulletins.
         """
-        response = httpx.get(cls._list_url, headers=st.session_state.auth_header)
+        response = get_client().get(cls._list_url, headers=st.session_state.auth_header)
         response.raise_for_status()
         return parse_obj_as(list[Bulletin], response.json())
@@ -0,0 +1,41 @@
+"""Shared HTTP client."""
+from typing import Any
+
+import httpx
+import streamlit as st
+
+MAX_CONNECTIONS = 100
+PREFETCHED = "prefetched_sections"  # session state key of game state sections, loaded by `StateAPI`
+
+
+@st.cache_resource
+def get_client() -> httpx.Client:
+    """Get HTTP client with keep-alive connection pool.
+
+    The client is thread-safe and shared by all user sessions, auth headers are passed per request.
+
+    Returns:
+        httpx.Client: HTTP client.
+    """
+    return httpx.Client(limits=httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS))
+
+
+def get_json(url: str, section: str | None = None, params: dict[str, Any] | None = None) -> Any:
+    """Get JSON response with user auth, prefetched game state section is used instead of request.
+
+    Args:
+        url (str): endpoint URL.
+        section (str, optional): game state section with the same data as the endpoint.
+        params (dict[str, Any], optional): query parameters, None values are skipped.
+            Prefetched section is not filtered by them.
+
+    Returns:
+        Any: decoded JSON response.
+    """
+    prefetched: dict[str, Any] = st.session_state.get(PREFETCHED) or {}
+    if section in prefetched:
+        return prefetched.pop(section)
+    params = {name: value for name, value in (params or {}).items() if value is not None}
+    response = get_client().get(url, params=params, headers=st.session_state.auth_header)
+    response.raise_for_status()
+    return response.json()
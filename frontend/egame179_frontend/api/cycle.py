@@ -1,10 +1,10 @@
 """Cycles API."""
 from datetime import datetime
 
-import httpx
 import streamlit as st
 from pydantic import BaseModel
 
+from egame179_frontend.api.client import get_client
 from egame179_frontend.settings import settings
 
 
@@ -39,18 +39,18 @@ class CycleAPI:
         Returns:
             Cycle: current cycle info.
         """
-        response = httpx.get(cls._current_url, headers=st.session_state.auth_header)
+        response = get_client().get(cls._current_url, headers=st.session_state.auth_header)
         response.raise_for_status()
         return Cycle.parse_obj(response.json())
 
     @classmethod
     def start_cycle(cls) -> None:
         """Start new cycle."""
-        response = httpx.get(cls._start_url, headers=st.session_state.auth_header)
+        response = get_client().get(cls._start_url, headers=st.session_state.auth_header)
         response.raise_for_status()
 
     @classmethod
     def finish_cycle(cls) -> None:
         """Finish current cycle."""
-        response = httpx.get(cls._finish_url, headers=st.session_state.auth_header)
+        response = get_client().get(cls._finish_url, headers=st.session_state.auth_header)
         response.raise_for_status()
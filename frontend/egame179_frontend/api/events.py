@@ -0,0 +1,43 @@
+"""Game events API (server-sent events)."""
+from collections.abc import Iterator
+from typing import Any
+
+import httpx
+from pydantic import BaseModel
+
+from egame179_frontend.settings import settings
+
+KEEPALIVE_TIMEOUT = 60  # seconds, the server sends keepalive every 15 seconds
+
+
+class GameEvent(BaseModel):
+    """Game state change event."""
+
+    id: int
+    type: str
+    cycle: int | None
+    user: int | None
+    data: dict[str, Any]
+
+
+class EventsAPI:
+    """Game events API."""
+
+    _events_url = str(settings.backend_url / "events")
+
+    @classmethod
+    def stream(cls, auth_header: dict[str, str]) -> Iterator[GameEvent]:
+        """Listen to game events, until connection is closed.
+
+        Args:
+            auth_header (dict[str, str]): user authentication header.
+
+        Yields:
+            GameEvent: game event.
+        """
+        timeout = httpx.Timeout(10, read=KEEPALIVE_TIMEOUT)
+        with httpx.stream("GET", cls._events_url, headers=auth_header, timeout=timeout) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if line.startswith("data:"):
+                    yield GameEvent.parse_raw(line.removeprefix("data:"))
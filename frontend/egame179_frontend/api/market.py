@@ -1,8 +1,8 @@
 """Markets API."""
-import httpx
 import streamlit as st
 from pydantic import BaseModel, parse_obj_as
 
+from egame179_frontend.api.client import get_client, get_json
 from egame179_frontend.settings import settings
 
 
@@ -43,9 +43,7 @@ class MarketAPI:
         Returns:
             list[Market]: all market graph nodes.
         """
-        response = httpx.get(cls._nodes_url, headers=st.session_state.auth_header)
-        response.raise_for_status()
-        return parse_obj_as(list[Market], response.json())
+        return parse_obj_as(list[Market], get_json(cls._nodes_url, section="markets"))
 
     @classmethod
     def get_edges(cls) -> list[tuple[int, int]]:
@@ -54,9 +52,7 @@ class MarketAPI:
         Returns:
             list[tuple[int, int]]: all market graph edges.
         """
-        response = httpx.get(cls._edges_url, headers=st.session_state.auth_header)
-        response.raise_for_status()
-        return parse_obj_as(list[tuple[int, int]], response.json())
+        return parse_obj_as(list[tuple[int, int]], get_json(cls._edges_url, section="edges"))
 
     @classmethod
     def get_unlocked_markets(cls) -> list[int]:
@@ -65,9 +61,7 @@ class MarketAPI:
         Returns:
             list[int]: list of unlocked markets for the user.
         """
-        response = httpx.get(cls._unlocked_url, headers=st.session_state.auth_header)
-        response.raise_for_status()
-        return parse_obj_as(list[int], response.json())
+        return parse_obj_as(list[int], get_json(cls._unlocked_url, section="unlocked_markets"))
 
     @classmethod
     def get_shares_user(cls) -> list[MarketShare]:
@@ -76,9 +70,7 @@ class MarketAPI:
         Returns:
             list[MarketShare]: list of market shares.
         """
-        response = httpx.get(cls._shares_url, headers=st.session_state.auth_header)
-        response.raise_for_status()
-        return parse_obj_as(list[MarketShare], response.json())
+        return parse_obj_as(list[MarketShare], get_json(cls._shares_url, section="shares"))
 
     @classmethod
     def get_shares(cls) -> list[MarketShare]:
@@ -87,9 +79,7 @@ class MarketAPI:
         Returns:
             list[MarketShare]: list of market shares.
         """
-        response = httpx.get(cls._shares_all_url, headers=st.session_state.auth_header)
-        response.raise_for_status()
-        return parse_obj_as(list[MarketShare], response.json())
+        return parse_obj_as(list[MarketShare], get_json(cls._shares_all_url, section="shares"))
 
     @classmethod
     def unlock_market(cls, cycle: int, user: int, market: int) -> None:
@@ -101,7 +91,7 @@ class MarketAPI:
             market (int): market to unlock.
         """
         unlock_request = {"cycle": cycle, "user": user, "market": market}
-        response = httpx.post(cls._unlock_url, json=unlock_request, headers=st.session_state.auth_header)
+        response = get_client().post(cls._unlock_url, json=unlock_request, headers=st.session_state.auth_header)
         response.raise_for_status()
 
     @classmethod
@@ -111,6 +101,4 @@ class MarketAPI:
         Returns:
             dict[int, float]: demand factors for all markets.
         """
-        response = httpx.get(cls._demand_factors_url, headers=st.session_state.auth_header)
-        response.raise_for_status()
-        return parse_obj_as(dict[int, float], response.json())
+        return parse_obj_as(dict[int, float], get_json(cls._demand_factors_url, section="demand_factors"))
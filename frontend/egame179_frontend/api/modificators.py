@@ -1,8 +1,8 @@
 """Modificators API."""
-import httpx
 import streamlit as st
 from pydantic import BaseModel, parse_obj_as
 
+from egame179_frontend.api.client import get_client, get_json
 from egame179_frontend.settings import settings
 
 
@@ -30,9 +30,7 @@ class ModificatorAPI:
         Returns:
             list[Modificator]: current user modificators.
         """
-        response = httpx.get(cls._list_url, headers=st.session_state.auth_header)
-        response.raise_for_status()
-        return parse_obj_as(list[FeeModificator], response.json())
+        return parse_obj_as(list[FeeModificator], get_json(cls._list_url, section="modificators"))
 
     @classmethod
     def get_modificators(cls) -> list[FeeModificator]:
@@ -41,9 +39,7 @@ class ModificatorAPI:
         Returns:
             list[Modificator]: all users modificators.
         """
-        response = httpx.get(cls._list_all_url, headers=st.session_state.auth_header)
-        response.raise_for_status()
-        return parse_obj_as(list[FeeModificator], response.json())
+        return parse_obj_as(list[FeeModificator], get_json(cls._list_all_url, section="modificators"))
 
     @classmethod
     def new(cls, cycle: int, user: int, fee: str, coeff: float) -> None:
@@ -56,5 +52,5 @@ class ModificatorAPI:
             coeff (float): fee coefficient.
         """
         new_mod = {"cycle": cycle, "user": user, "fee": fee, "coeff": coeff}
-        response = httpx.post(cls._new_url, json=new_mod, headers=st.session_state.auth_header)
+        response = get_client().post(cls._new_url, json=new_mod, headers=st.session_state.auth_header)
         response.raise_for_status()
@@ -1,8 +1,7 @@
 """Prices API."""
-import httpx
-import streamlit as st
 from pydantic import BaseModel, parse_obj_as
 
+from egame179_frontend.api.client import get_json
 from egame179_frontend.settings import settings
 
 
@@ -21,12 +20,14 @@ class PriceAPI:
     _prices_url = str(settings.backend_url / "market" / "prices")
 
     @classmethod
-    def get_market_prices(cls) -> list[Price]:
+    def get_market_prices(cls, since_cycle: int | None = None) -> list[Price]:
         """Get market prices.
 
+        Args:
+            since_cycle (int, optional): get only records of this & later cycles.
+
         Returns:
             list[Prices]: prices for all markets.
         """
-        response = httpx.get(cls._prices_url, headers=st.session_state.auth_header)
-        response.raise_for_status()
-        return parse_obj_as(list[Price], response.json())
+        records = get_json(cls._prices_url, section="prices", params={"since_cycle": since_cycle})
+        return parse_obj_as(list[Price], records)
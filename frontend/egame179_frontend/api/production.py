@@ -1,10 +1,11 @@
 """Production API."""
 from datetime import datetime
 
-import httpx
 import streamlit as st
 from pydantic import BaseModel, parse_obj_as
 
+from egame179_frontend.api.bids import BatchResult, post_batch
+from egame179_frontend.api.client import get_client, get_json
 from egame179_frontend.settings import settings
 
 
@@ -38,40 +39,59 @@ class ProductionAPI:
     _user_thetas_url = str(_api_url / "thetas")
     _thetas_url = str(_api_url / "thetas" / "all")
     _new_url = str(_api_url / "new")
+    _batch_url = str(_api_url / "batch")
 
     @classmethod
-    def get_user_products(cls) -> list[Production]:
+    def get_user_products(cls, since_id: int | None = None) -> list[Production]:
         """Get current user production.
 
+        Args:
+            since_id (int, optional): get only records after this id.
+
         Returns:
             list[Production]: current user production history.
         """
-        response = httpx.get(cls._user_products_url, headers=st.session_state.auth_header)
-        response.raise_for_status()
-        return parse_obj_as(list[Production], response.json())
+        records = get_json(cls._user_products_url, section="production", params={"since_id": since_id})
+        return parse_obj_as(list[Production], records)
 
     @classmethod
-    def get_products(cls) -> list[Production]:
+    def get_products(cls, since_id: int | None = None) -> list[Production]:
         """Get all users products.
 
+        Args:
+            since_id (int, optional): get only records after this id.
+
         Returns:
             list[Production]: all users product history.
         """
-        response = httpx.get(cls._products_url, headers=st.session_state.auth_header)
-        response.raise_for_status()
-        return parse_obj_as(list[Production], response.json())
+        records = get_json(cls._products_url, section="production", params={"since_id": since_id})
+        return parse_obj_as(list[Production], records)
 
     @classmethod
-    def get_user_thetas(cls) -> list[Theta]:
-        response = httpx.get(cls._user_thetas_url, headers=st.session_state.auth_header)
-        response.raise_for_status()
-        return parse_obj_as(list[Theta], response.json())
+    def get_user_thetas(cls, since_cycle: int | None = None) -> list[Theta]:
+        """Get current user thetas.
+
+        Args:
+            since_cycle (int, optional): get only records of this & later cycles.
+
+        Returns:
+            list[Theta]: current user thetas history.
+        """
+        records = get_json(cls._user_thetas_url, section="thetas", params={"since_cycle": since_cycle})
+        return parse_obj_as(list[Theta], records)
 
     @classmethod
-    def get_thetas(cls) -> list[Theta]:
-        response = httpx.get(cls._thetas_url, headers=st.session_state.auth_header)
-        response.raise_for_status()
-        return parse_obj_as(list[Theta], response.json())
+    def get_thetas(cls, since_cycle: int | None = None) -> list[Theta]:
+        """Get all users thetas.
+
+        Args:
+            since_cycle (int, optional): get only records of this & later cycles.
+
+        Returns:
+            list[Theta]: all users thetas history.
+        """
+        records = get_json(cls._thetas_url, section="thetas", params={"since_cycle": since_cycle})
+        return parse_obj_as(list[Theta], records)
 
     @classmethod
     def new(cls, market: int, quantity: int) -> None:
@@ -82,5 +102,18 @@ class ProductionAPI:
             quantity (int): number of items.
         """
         bid = {"market": market, "quantity": quantity}
-        response = httpx.post(cls._new_url, json=bid, headers=st.session_state.auth_header)
+        response = get_client().post(cls._new_url, json=bid, headers=st.session_state.auth_header)
         response.raise_for_status()
+
+    @classmethod
+    def new_batch(cls, orders: dict[int, int], atomic: bool = True) -> BatchResult:
+        """Buy items on several markets.
+
+        Args:
+            orders (dict[int, int]): {market id: number of items}.
+            atomic (bool): if True, items are bought only if all orders are accepted.
+
+        Returns:
+            BatchResult: result of each order.
+        """
+        return post_batch(cls._batch_url, orders=orders, atomic=atomic)
@@ -0,0 +1,51 @@
+"""Game state bootstrap API."""
+from collections.abc import Iterable
+from typing import Any
+
+import streamlit as st
+
+from egame179_frontend.api.client import get_client
+from egame179_frontend.api.user import UserRoles
+from egame179_frontend.settings import settings
+
+COMMON_SECTIONS = frozenset(("cycle", "names", "players", "markets", "edges", "prices", "demand_factors", "stocks"))
+GAME_SECTIONS = frozenset(
+    ("modificators", "balances", "transactions", "production", "thetas", "storage", "shares", "supplies"),
+)
+STATE_SECTIONS = {  # {role: sections of role state endpoint}
+    UserRoles.PLAYER.value: COMMON_SECTIONS | GAME_SECTIONS | {"unlocked_markets"},
+    UserRoles.ROOT.value: COMMON_SECTIONS | GAME_SECTIONS | {"sync_status"},
+}
+
+
+class StateAPI:
+    """Game state bootstrap API: many game state sections in one request."""
+
+    _state_urls = {
+        UserRoles.PLAYER.value: str(settings.backend_url / "player" / "state"),
+        UserRoles.ROOT.value: str(settings.backend_url / "root" / "state"),
+    }
+
+    @classmethod
+    def get_sections(cls, role: str, sections: Iterable[str]) -> dict[str, Any]:
+        """Get game state sections, unchanged sections are taken from the session cache.
+
+        Args:
+            role (str): user role.
+            sections (Iterable[str]): requested sections.
+
+        Returns:
+            dict[str, Any]: {section: decoded JSON of the section endpoint}
+        """
+        cached: dict[str, tuple[str, Any]] = st.session_state.state_sections  # {section: (version, content)}
+        sections = list(sections)
+        params = {
+            "sections": sections,
+            "known": [f"{section}:{cached[section][0]}" for section in sections if section in cached],
+        }
+        response = get_client().get(cls._state_urls[role], params=params, headers=st.session_state.auth_header)
+        response.raise_for_status()
+        state = response.json()
+        for section, content in state["sections"].items():
+            cached[section] = (state["versions"][section], content)
+        return {section: cached[section][1] for section in state["versions"]}
@@ -1,8 +1,7 @@
 """Stocks API."""
-import httpx
-import streamlit as st
 from pydantic import BaseModel, parse_obj_as
 
+from egame179_frontend.api.client import get_json
 from egame179_frontend.settings import settings
 
 
@@ -20,12 +19,14 @@ class StocksAPI:
     _api_url = str(settings.backend_url / "stocks/list")
 
     @classmethod
-    def get_stocks(cls) -> list[Stock]:
+    def get_stocks(cls, since_cycle: int | None = None) -> list[Stock]:
         """Get stocks.
 
+        Args:
+            since_cycle (int, optional): get only records of this & later cycles.
+
         Returns:
             list[Stock]: stocks price history.
         """
-        response = httpx.get(cls._api_url, headers=st.session_state.auth_header)
-        response.raise_for_status()
-        return parse_obj_as(list[Stock], response.json())
+        records = get_json(cls._api_url, section="stocks", params={"since_cycle": since_cycle})
+        return parse_obj_as(list[Stock], records)
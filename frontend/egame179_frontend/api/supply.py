@@ -1,10 +1,12 @@
 """Products API."""
+import math
 from datetime import datetime
 
-import httpx
 import streamlit as st
 from pydantic import BaseModel, parse_obj_as
 
+from egame179_frontend.api.bids import BatchResult, post_batch
+from egame179_frontend.api.client import get_client, get_json
 from egame179_frontend.settings import settings
 
 
@@ -22,6 +24,28 @@ class Supply(BaseModel):
     sold: int
 
 
+class SupplyProjection(Supply):
+    """Supply with delivery parameters, to compute delivered items without backend requests."""
+
+    velocity: float  # items per second
+    ts_full_delivery: datetime | None
+
+    def project(self, ts: datetime) -> Supply:
+        """Get supply state at the moment (the same way as backend supplies list).
+
+        Args:
+            ts (datetime): moment of time.
+
+        Returns:
+            Supply: supply with delivered items at the moment.
+        """
+        supply = Supply.parse_obj(self.dict(exclude={"velocity", "ts_full_delivery"}))
+        if supply.delivered == 0:
+            delivery_time = (ts - supply.ts_start).total_seconds()
+            supply.delivered = min(supply.quantity, math.floor(self.velocity * delivery_time))
+        return supply
+
+
 class SupplyAPI:
     """Supply API."""
 
@@ -29,7 +53,10 @@ class SupplyAPI:
 
     _user_supplies_url = str(_api_url / "list")
     _supplies_url = str(_api_url / "list/all")
+    _user_projections_url = str(_api_url / "projection")
+    _projections_url = str(_api_url / "projection/all")
     _new_url = str(_api_url / "new")
+    _batch_url = str(_api_url / "batch")
 
     @classmethod
     def get_user_supplies(cls) -> list[Supply]:
@@ -38,7 +65,7 @@ class SupplyAPI:
         Returns:
             list[Supply]: current user supplies.
         """
-        response = httpx.get(cls._user_supplies_url, headers=st.session_state.auth_header)
+        response = get_client().get(cls._user_supplies_url, headers=st.session_state.auth_header)
         response.raise_for_status()
         return parse_obj_as(list[Supply], response.json())
 
@@ -49,10 +76,28 @@ class SupplyAPI:
         Returns:
             list[Supply]: all users supplies.
         """
-        response = httpx.get(cls._supplies_url, headers=st.session_state.auth_header)
+        response = get_client().get(cls._supplies_url, headers=st.session_state.auth_header)
         response.raise_for_status()
         return parse_obj_as(list[Supply], response.json())
 
+    @classmethod
+    def get_user_projections(cls) -> list[SupplyProjection]:
+        """Get current user supplies with delivery parameters.
+
+        Returns:
+            list[SupplyProjection]: current user supplies.
+        """
+        return parse_obj_as(list[SupplyProjection], get_json(cls._user_projections_url, section="supplies"))
+
+    @classmethod
+    def get_projections(cls) -> list[SupplyProjection]:
+        """Get all users supplies with delivery parameters.
+
+        Returns:
+            list[SupplyProjection]: all users supplies.
+        """
+        return parse_obj_as(list[SupplyProjection], get_json(cls._projections_url, section="supplies"))
+
     @classmethod
     def new(cls, market: int, quantity: int) -> None:
         """Start supply to target market.
@@ -62,5 +107,18 @@ class SupplyAPI:
             quantity (int): number of items.
         """
         bid = {"market": market, "quantity": quantity}
-        response = httpx.post(cls._new_url, json=bid, headers=st.session_state.auth_header)
+        response = get_client().post(cls._new_url, json=bid, headers=st.session_state.auth_header)
         response.raise_for_status()
+
+    @classmethod
+    def new_batch(cls, orders: dict[int, int], atomic: bool = True) -> BatchResult:
+        """Start supplies to several markets.
+
+        Args:
+            orders (dict[int, int]): {market id: number of items}.
+            atomic (bool): if True, supplies are started only if all orders are accepted.
+
+        Returns:
+            BatchResult: result of each order.
+        """
+        return post_batch(cls._batch_url, orders=orders, atomic=atomic)
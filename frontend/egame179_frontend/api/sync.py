@@ -1,8 +1,8 @@
 """Sync status API."""
-import httpx
 import streamlit as st
 from pydantic import parse_obj_as
 
+from egame179_frontend.api.client import get_client, get_json
 from egame179_frontend.settings import settings
 
 
@@ -16,7 +16,7 @@ class SyncStatusAPI:
     @classmethod
     def sync(cls) -> None:
         """Send sync signal."""
-        response = httpx.get(cls._sync_url, headers=st.session_state.auth_header)
+        response = get_client().get(cls._sync_url, headers=st.session_state.auth_header)
         response.raise_for_status()
 
     @classmethod
@@ -26,6 +26,4 @@ class SyncStatusAPI:
         Returns:
             dict[int, bool]: users sync status.
         """
-        response = httpx.get(cls._status_url, headers=st.session_state.auth_header)
-        response.raise_for_status()
-        return parse_obj_as(dict[int, bool], response.json())
+        return parse_obj_as(dict[int, bool], get_json(cls._status_url, section="sync_status"))
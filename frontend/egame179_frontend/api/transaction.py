@@ -1,10 +1,9 @@
 """Transactions API."""
 from datetime import datetime
 
-import httpx
-import streamlit as st
 from pydantic import BaseModel, parse_obj_as
 
+from egame179_frontend.api.client import get_json
 from egame179_frontend.settings import settings
 
 
@@ -27,23 +26,27 @@ class TransactionAPI:
     _transactions_url = str(_api_url / "list/all")
 
     @classmethod
-    def get_user_transactions(cls) -> list[Transaction]:
+    def get_user_transactions(cls, since_id: int | None = None) -> list[Transaction]:
         """Get current user transactions.
 
+        Args:
+            since_id (int, optional): get only records after this id.
+
         Returns:
             list[Transaction]: current user transactions.
         """
-        response = httpx.get(cls._user_transactions_url, headers=st.session_state.auth_header)
-        response.raise_for_status()
-        return parse_obj_as(list[Transaction], response.json())
+        records = get_json(cls._user_transactions_url, section="transactions", params={"since_id": since_id})
+        return parse_obj_as(list[Transaction], records)
 
     @classmethod
-    def get_transactions(cls) -> list[Transaction]:
+    def get_transactions(cls, since_id: int | None = None) -> list[Transaction]:
         """Get transactions.
 
+        Args:
+            since_id (int, optional): get only records after this id.
+
         Returns:
             list[Transaction]: current user transactions.
         """
-        response = httpx.get(cls._transactions_url, headers=st.session_state.auth_header)
-        response.raise_for_status()
-        return parse_obj_as(list[Transaction], response.json())
+        records = get_json(cls._transactions_url, section="transactions", params={"since_id": since_id})
+        return parse_obj_as(list[Transaction], records)
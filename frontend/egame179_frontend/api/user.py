@@ -2,9 +2,9 @@
 from enum import Enum
 
 import httpx
-import streamlit as st
 from pydantic import BaseModel, parse_obj_as
 
+from egame179_frontend.api.client import get_client, get_json
 from egame179_frontend.settings import settings
 
 
@@ -43,7 +43,7 @@ class AuthAPI:
         Returns:
             dict[str, str] | None: auth header or None if login or password is incorrect.
         """
-        response = httpx.post(cls._token_url, data={"username": login, "password": password})
+        response = get_client().post(cls._token_url, data={"username": login, "password": password})
         if response.status_code == httpx.codes.UNAUTHORIZED:
             return None
         token_data = response.json()
@@ -59,7 +59,7 @@ class AuthAPI:
         Returns:
             User | None: user info or None if auth header is incorrect.
         """
-        response = httpx.get(cls._user_url, headers=auth_header)
+        response = get_client().get(cls._user_url, headers=auth_header)
         if response.status_code == httpx.codes.UNAUTHORIZED:
             return None
         return User.parse_obj(response.json())
@@ -71,9 +71,7 @@ class AuthAPI:
         Returns:
             dict[int, str]: {user: name} mapping.
         """
-        response = httpx.get(cls._names_url, headers=st.session_state.auth_header)
-        response.raise_for_status()
-        return parse_obj_as(dict[int, str], response.json())
+        return parse_obj_as(dict[int, str], get_json(cls._names_url, section="names"))
 
     @classmethod
     def get_players(cls) -> list[int]:
@@ -82,6 +80,4 @@ class AuthAPI:
         Returns:
             list[int]: player ids.
         """
-        response = httpx.get(cls._players_url, headers=st.session_state.auth_header)
-        response.raise_for_status()
-        return parse_obj_as(list[int], response.json())
+        return parse_obj_as(list[int], get_json(cls._players_url, section="players"))
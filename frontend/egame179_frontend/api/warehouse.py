@@ -1,8 +1,7 @@
 """Warehouse API."""
-import httpx
-import streamlit as st
 from pydantic import BaseModel, parse_obj_as
 
+from egame179_frontend.api.client import get_json
 from egame179_frontend.settings import settings
 
 
@@ -29,9 +28,7 @@ class WarehouseAPI:
         Returns:
             list[Warehouse]: current user storage.
         """
-        response = httpx.get(cls._list_url, headers=st.session_state.auth_header)
-        response.raise_for_status()
-        return parse_obj_as(list[Warehouse], response.json())
+        return parse_obj_as(list[Warehouse], get_json(cls._list_url, section="storage"))
 
     @classmethod
     def get_storages(cls) -> list[Warehouse]:
@@ -40,6 +37,4 @@ class WarehouseAPI:
         Returns:
             list[Warehouse]: all users storage.
         """
-        response = httpx.get(cls._list_all_url, headers=st.session_state.auth_header)
-        response.raise_for_status()
-        return parse_obj_as(list[Warehouse], response.json())
+        return parse_obj_as(list[Warehouse], get_json(cls._list_all_url, section="storage"))
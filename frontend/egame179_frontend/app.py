@@ -7,7 +7,7 @@ import streamlit as st
 from streamlit_option_menu import option_menu
 
 from egame179_frontend.api.user import UserRoles
-from egame179_frontend.state import clean_cached_state, init_game_state, init_session_state
+from egame179_frontend.state import clean_cached_state, hydrate, init_game_state, init_session_state
 from egame179_frontend.style import load_css
 from egame179_frontend.views.login import login_form
 from egame179_frontend.views.registry import AppView
@@ -33,7 +33,9 @@ def app() -> None:
             )
             under_menu_block()
         # render current app view
-        user_views[menu_option].render()
+        view = user_views[menu_option]
+        hydrate(st.session_state.game, view.state_properties)
+        view.render()
 
 
 def header() -> None:
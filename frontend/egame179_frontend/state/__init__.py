@@ -2,13 +2,14 @@
 from egame179_frontend.state.news import NewsState
 from egame179_frontend.state.player import PlayerState
 from egame179_frontend.state.root import RootState
-from egame179_frontend.state.state import clean_cached_state, init_game_state, init_session_state
+from egame179_frontend.state.state import clean_cached_state, hydrate, init_game_state, init_session_state
 
 __all__ = [
     "NewsState",
     "PlayerState",
     "RootState",
     "clean_cached_state",
+    "hydrate",
     "init_game_state",
     "init_session_state",
 ]
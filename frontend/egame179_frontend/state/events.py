@@ -0,0 +1,84 @@
+import logging
+import threading
+from typing import Any
+
+import httpx
+
+from egame179_frontend.api.events import EventsAPI, GameEvent
+
+RECONNECT_SECONDS = 5
+RESET_EVENTS = frozenset(("cycle_start", "cycle_finish", "reset"))  # whole game state should be reloaded
+EVENT_FIELDS = {  # cached game state fields, changed by event
+    "balance": ("_balances", "_transactions"),
+    "supply": ("_storage", "_supply_projections"),
+    "bulletin": ("_bulletins",),
+    "sync": ("_sync_status",),
+}
+
+
+class EventListener:
+    """Listener of game events, running in a background thread of the user session."""
+
+    def __init__(self, auth_header: dict[str, str]):
+        self.auth_header = auth_header
+        self.connected = False
+        self._events: list[GameEvent] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._listen, daemon=True)
+        self._thread.start()
+
+    @property
+    def alive(self) -> bool:
+        """Listener is running (stopped on logout & session expiration).
+
+        Returns:
+            bool: listener thread is alive.
+        """
+        return self._thread.is_alive()
+
+    def drain(self) -> list[GameEvent]:
+        """Get events received since the previous call.
+
+        Returns:
+            list[GameEvent]: received events.
+        """
+        with self._lock:
+            events, self._events = self._events, []
+        return events
+
+    def stop(self) -> None:
+        """Stop listening (after the next received event or keepalive)."""
+        self._stop.set()
+
+    def _listen(self) -> None:
+        while not self._stop.is_set():
+            try:
+                for event in EventsAPI.stream(self.auth_header):
+                    if self._stop.is_set():
+                        return
+                    with self._lock:
+                        self._events.append(event)
+                    self.connected = True
+            except httpx.HTTPStatusError as exc:
+                if exc.response.status_code == httpx.codes.UNAUTHORIZED:
+                    self.connected = False
+                    return
+                logging.warning("Game events stream error: %s", exc)
+            except httpx.HTTPError as exc:
+                logging.warning("Game events stream is broken: %s", exc)
+            self.connected = False
+            self._stop.wait(RECONNECT_SECONDS)
+
+
+def apply_events(game: Any, events: list[GameEvent]) -> None:
+    """Drop cached game state fields, changed by events (they are reloaded on access).
+
+    Args:
+        game (Any): user game state.
+        events (list[GameEvent]): received events.
+    """
+    for event in events:
+        for field in EVENT_FIELDS.get(event.type, ()):
+            if hasattr(game, field):
+                setattr(game, field, None)
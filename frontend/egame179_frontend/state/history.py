@@ -0,0 +1,89 @@
+"""Game history, synced incrementally."""
+from dataclasses import dataclass, field
+from typing import Any
+
+import pandas as pd
+
+
+@dataclass
+class History:
+    """Game history records, merged with records changed since the previous sync.
+
+    History is keyed by `id` for append-only logs (cursor is the last known id, records of its cycle are
+    requested again, as they may be committed out of id order) or by `cycle` (cursor is the last known cycle,
+    its records are still changing and are replaced).
+    """
+
+    key: str
+    records: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def cursor(self) -> int | None:
+        """Cursor for the next sync request.
+
+        Returns:
+            int | None: `since_id` or `since_cycle` value, None for empty history.
+        """
+        if not self.records:
+            return None
+        return max(record[self.key] for record in self.records)
+
+    def merge(self, records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Merge records requested with the current cursor.
+
+        Known records are skipped, so full history can be merged as well.
+
+        Args:
+            records (list[dict[str, Any]]): new records.
+
+        Returns:
+            list[dict[str, Any]]: merged history.
+        """
+        cursor = self.cursor
+        if self.key == "cycle":
+            if cursor is not None:
+                self.records = [record for record in self.records if record["cycle"] < cursor]
+                records = [record for record in records if record["cycle"] >= cursor]
+            records = sorted(records, key=lambda record: record["cycle"])
+        elif cursor is not None:
+            known = {record[self.key] for record in self.records}
+            records = [record for record in records if record[self.key] not in known]
+        self.records.extend(records)
+        return list(self.records)
+
+
+@dataclass
+class FrameHistory:
+    """Game history dataframe, keyed by cycle: the last known cycle records are replaced on merge."""
+
+    frame: pd.DataFrame | None = None
+
+    @property
+    def cursor(self) -> int | None:
+        """Cursor for the next sync request.
+
+        Returns:
+            int | None: `since_cycle` value, None for empty history.
+        """
+        if self.frame is None or self.frame.empty:
+            return None
+        return int(self.frame["cycle"].max())
+
+    def merge(self, records: list[dict[str, Any]]) -> pd.DataFrame:
+        """Merge records requested with the current cursor.
+
+        Args:
+            records (list[dict[str, Any]]): new records.
+
+        Returns:
+            pd.DataFrame: merged history.
+        """
+        cursor = self.cursor
+        new_frame = pd.DataFrame(records)
+        if cursor is None:
+            self.frame = new_frame
+        elif not new_frame.empty:
+            old_frame = self.frame[self.frame["cycle"] < cursor]  # type: ignore
+            new_frame = new_frame[new_frame["cycle"] >= cursor]
+            self.frame = pd.concat([old_frame, new_frame], ignore_index=True)
+        return self.frame.copy()
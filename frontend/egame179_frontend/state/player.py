@@ -1,5 +1,6 @@
 from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Any
 
 import networkx as nx
@@ -7,6 +8,8 @@ import pandas as pd
 
 from egame179_frontend import api
 from egame179_frontend.api.cycle import Cycle
+from egame179_frontend.api.supply import SupplyProjection
+from egame179_frontend.state.history import FrameHistory, History
 
 
 @dataclass
@@ -30,6 +33,13 @@ class PlayerState:  # noqa: WPS214
     _shares: dict[tuple[int, int], tuple[int, float | None]] | None = None
     _stocks: pd.DataFrame | None = None
     _detailed_markets: nx.Graph | None = None
+    _supply_projections: list[SupplyProjection] | None = None
+    # histories are kept on invalidation: only records changed since the previous sync are requested
+    _balances_history: History = field(default_factory=lambda: History(key="cycle"))
+    _transactions_history: History = field(default_factory=lambda: History(key="id"))
+    _prices_history: FrameHistory = field(default_factory=FrameHistory)
+    _production_history: History = field(default_factory=lambda: History(key="id"))
+    _stocks_history: FrameHistory = field(default_factory=FrameHistory)
 
     @property
     def names(self) -> dict[int, str]:
@@ -86,7 +96,8 @@ class PlayerState:  # noqa: WPS214
             list[float]: balances ordered by cycle.
         """
         if self._balances is None:
-            self._balances = [bal.balance for bal in api.BalanceAPI.get_user_balances()]
+            balances = api.BalanceAPI.get_user_balances(since_cycle=self._balances_history.cursor)
+            self._balances = [bal["balance"] for bal in self._balances_history.merge([bal.dict() for bal in balances])]
         return self._balances
 
     @property
@@ -97,7 +108,8 @@ class PlayerState:  # noqa: WPS214
             list[dict[str, Any]]: player transactions.
         """
         if self._transactions is None:
-            self._transactions = [tr.dict() for tr in api.TransactionAPI.get_user_transactions()]
+            transactions = api.TransactionAPI.get_user_transactions(since_id=self._transactions_history.cursor)
+            self._transactions = self._transactions_history.merge([tr.dict() for tr in transactions])
         return self._transactions
 
     @property
@@ -119,7 +131,8 @@ class PlayerState:  # noqa: WPS214
             pd.DataFrame: pandas dataframe with columns (cycle, market_id, buy, sell)
         """
         if self._prices is None:
-            self._prices = pd.DataFrame([price.dict() for price in api.PriceAPI.get_market_prices()])
+            prices = api.PriceAPI.get_market_prices(since_cycle=self._prices_history.cursor)
+            self._prices = self._prices_history.merge([price.dict() for price in prices])
         return self._prices
 
     @property
@@ -141,7 +154,8 @@ class PlayerState:  # noqa: WPS214
             list[dict[str, Any]]: list of dicts with product info.
         """
         if self._production is None:
-            self._production = [prod.dict() for prod in api.ProductionAPI.get_user_products()]
+            production = api.ProductionAPI.get_user_products(since_id=self._production_history.cursor)
+            self._production = self._production_history.merge([prod.dict() for prod in production])
         return self._production
 
     @property
@@ -154,7 +168,7 @@ class PlayerState:  # noqa: WPS214
         if self._thetas is None:
             self._thetas = {
                 theta.market: theta.theta
-                for theta in api.ProductionAPI.get_user_thetas()
+                for theta in api.ProductionAPI.get_user_thetas(since_cycle=self.cycle.id)
                 if theta.cycle == self.cycle.id
             }
         return self._thetas
@@ -214,8 +228,11 @@ class PlayerState:  # noqa: WPS214
         Returns:
             list[dict[str, Any]]: list of dicts with supply info.
         """
-        # we do not cache supplies, because they are changing in real time
-        return [supply.dict() for supply in api.SupplyAPI.get_user_supplies()]
+        # supplies are changing in real time, so delivered items are projected from cached delivery parameters
+        if self._supply_projections is None:
+            self._supply_projections = api.SupplyAPI.get_user_projections()
+        ts = datetime.now()
+        return [projection.project(ts).dict() for projection in self._supply_projections]
 
     @property
     def stocks(self) -> pd.DataFrame:
@@ -225,7 +242,8 @@ class PlayerState:  # noqa: WPS214
             pd.DataFrame: pandas dataframe with columns (cycle, company, price)
         """
         if self._stocks is None:
-            self._stocks = pd.DataFrame([stock.dict() for stock in api.StocksAPI.get_stocks()])
+            stocks = api.StocksAPI.get_stocks(since_cycle=self._stocks_history.cursor)
+            self._stocks = self._stocks_history.merge([stock.dict() for stock in stocks])
             self._stocks["company"] = self._stocks["user"].map(self.names)
         return self._stocks
 
@@ -240,6 +258,7 @@ class PlayerState:  # noqa: WPS214
     def clear_after_supply(self) -> None:
         """Clean invalid caches after supply operation."""
         self._balances = None
+        self._supply_projections = None
         self._storage = None
         self._transactions = None
         self._detailed_markets = None
@@ -1,6 +1,7 @@
 from collections import defaultdict
 from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Any
 
 import networkx as nx
@@ -8,6 +9,8 @@ import pandas as pd
 
 from egame179_frontend import api
 from egame179_frontend.api.cycle import Cycle
+from egame179_frontend.api.supply import SupplyProjection
+from egame179_frontend.state.history import FrameHistory, History
 from egame179_frontend.style import PlayerColors
 
 
@@ -32,6 +35,13 @@ class RootState:  # noqa: WPS214
     _shares: dict[tuple[int, int], tuple[int, float | None]] | None = None
     _stocks: pd.DataFrame | None = None
     _detailed_markets: nx.Graph | None = None
+    _supply_projections: list[SupplyProjection] | None = None
+    # histories are kept on invalidation: only records changed since the previous sync are requested
+    _balances_history: History = field(default_factory=lambda: History(key="cycle"))
+    _transactions_history: History = field(default_factory=lambda: History(key="id"))
+    _prices_history: FrameHistory = field(default_factory=FrameHistory)
+    _production_history: History = field(default_factory=lambda: History(key="id"))
+    _stocks_history: FrameHistory = field(default_factory=FrameHistory)
 
     @property
     def names(self) -> dict[int, str]:
@@ -57,12 +67,22 @@ class RootState:  # noqa: WPS214
 
     @property
     def player_colors(self) -> dict[int, str]:
+        """Player colors.
+
+        Returns:
+            dict[int, str]: {user_id: color}.
+        """
         if self._player_colors is None:
             self._player_colors = {user: color for user, color in zip(self.player_ids, PlayerColors)}
         return self._player_colors
 
     @property
     def sync_status(self) -> dict[int, bool]:
+        """Players sync status.
+
+        Returns:
+            dict[int, bool]: {user_id: synced}.
+        """
         if self._sync_status is None:
             self._sync_status = api.SyncStatusAPI.get_sync_status()
         return self._sync_status
@@ -94,10 +114,16 @@ class RootState:  # noqa: WPS214
 
     @property
     def balances(self) -> dict[int, list[float]]:
+        """Players balances history.
+
+        Returns:
+            dict[int, list[float]]: {user_id: balances by cycle}.
+        """
         if self._balances is None:
+            balances = api.BalanceAPI.get_balances(since_cycle=self._balances_history.cursor)
             self._balances = defaultdict(list)
-            for balance in api.BalanceAPI.get_balances():
-                self._balances[balance.user].append(balance.balance)
+            for balance in self._balances_history.merge([bal.dict() for bal in balances]):
+                self._balances[balance["user"]].append(balance["balance"])
         return self._balances
 
     @property
@@ -108,7 +134,8 @@ class RootState:  # noqa: WPS214
             list[dict[str, Any]]: player transactions.
         """
         if self._transactions is None:
-            self._transactions = [tr.dict() for tr in api.TransactionAPI.get_transactions()]
+            transactions = api.TransactionAPI.get_transactions(since_id=self._transactions_history.cursor)
+            self._transactions = self._transactions_history.merge([tr.dict() for tr in transactions])
         return self._transactions
 
     @property
@@ -119,7 +146,8 @@ class RootState:  # noqa: WPS214
             pd.DataFrame: pandas dataframe with columns (cycle, market_id, buy, sell)
         """
         if self._prices is None:
-            self._prices = pd.DataFrame([price.dict() for price in api.PriceAPI.get_market_prices()])
+            prices = api.PriceAPI.get_market_prices(since_cycle=self._prices_history.cursor)
+            self._prices = self._prices_history.merge([price.dict() for price in prices])
         return self._prices
 
     @property
@@ -141,7 +169,8 @@ class RootState:  # noqa: WPS214
             list[dict[str, Any]]: list of dicts with product info.
         """
         if self._production is None:
-            self._production = [prod.dict() for prod in api.ProductionAPI.get_products()]
+            production = api.ProductionAPI.get_products(since_id=self._production_history.cursor)
+            self._production = self._production_history.merge([prod.dict() for prod in production])
         return self._production
 
     @property
@@ -154,13 +183,18 @@ class RootState:  # noqa: WPS214
         if self._thetas is None:
             self._thetas = {
                 theta.market: theta.theta
-                for theta in api.ProductionAPI.get_thetas()
+                for theta in api.ProductionAPI.get_thetas(since_cycle=self.cycle.id)
                 if theta.cycle == self.cycle.id
             }
         return self._thetas
 
     @property
     def storage(self) -> dict[int, list[dict[str, Any]]]:
+        """Current cycle non-empty warehouses.
+
+        Returns:
+            dict[int, list[dict[str, Any]]]: {market_id: warehouses}.
+        """
         if self._storage is None:
             self._storage = defaultdict(list)
             for wh in api.WarehouseAPI.get_storages():
@@ -170,6 +204,11 @@ class RootState:  # noqa: WPS214
 
     @property
     def total_storage(self) -> dict[int, int]:
+        """Current cycle total storage quantity.
+
+        Returns:
+            dict[int, int]: {market_id: quantity}.
+        """
         total = {}
         for market, storages in self.storage.items():
             total[market] = sum([wh["quantity"] for wh in storages])
@@ -216,8 +255,11 @@ class RootState:  # noqa: WPS214
         Returns:
             list[dict[str, Any]]: list of dicts with supply info.
         """
-        # we do not cache supplies, because they are changing in real time
-        return [supply.dict() for supply in api.SupplyAPI.get_supplies()]
+        # supplies are changing in real time, so delivered items are projected from cached delivery parameters
+        if self._supply_projections is None:
+            self._supply_projections = api.SupplyAPI.get_projections()
+        ts = datetime.now()
+        return [projection.project(ts).dict() for projection in self._supply_projections]
 
     @property
     def stocks(self) -> pd.DataFrame:
@@ -227,6 +269,7 @@ class RootState:  # noqa: WPS214
             pd.DataFrame: pandas dataframe with columns (cycle, company, price)
         """
         if self._stocks is None:
-            self._stocks = pd.DataFrame([stock.dict() for stock in api.StocksAPI.get_stocks()])
+            stocks = api.StocksAPI.get_stocks(since_cycle=self._stocks_history.cursor)
+            self._stocks = self._stocks_history.merge([stock.dict() for stock in stocks])
             self._stocks["company"] = self._stocks["user"].map(self.names)
         return self._stocks
@@ -1,10 +1,24 @@
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import fields
+from typing import Any
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
-from egame179_frontend.api import CycleAPI, SyncStatusAPI
+from egame179_frontend.api import CycleAPI, StateAPI, SyncStatusAPI
+from egame179_frontend.api.client import PREFETCHED
+from egame179_frontend.api.state import STATE_SECTIONS
 from egame179_frontend.api.user import User, UserRoles
 from egame179_frontend.state import NewsState, PlayerState, RootState
+from egame179_frontend.state.events import RESET_EVENTS, EventListener, apply_events
+
+PROPERTY_SECTIONS = {  # {game state property: state sections}, if differ from the property name
+    "player_ids": ("players",),
+    "markets": ("markets", "edges"),
+}
+PROPERTY_FIELDS = {"supplies": "_supply_projections"}  # {game state property: cached field}, if not `_{property}`
 
 
 def init_session_state() -> None:
@@ -14,6 +28,8 @@ def init_session_state() -> None:
         "user": None,
         "views": None,
         "game": None,
+        "events": None,
+        "state_sections": {},
         "interim_block": False,
     }
     for field, init_value in init_state.items():
@@ -24,11 +40,66 @@ def init_session_state() -> None:
 def clean_cached_state() -> None:
     """Refresh user session."""
     st.session_state.game = None
+    st.session_state.state_sections = {}
     st.cache_data.clear()
 
 
+def hydrate(game: Any, properties: Iterable[str]) -> None:
+    """Load game state properties in one state request (instead of one by one on first access).
+
+    Properties, not covered by the state endpoint of the user role, are loaded concurrently.
+
+    Args:
+        game (Any): user game state.
+        properties (Iterable[str]): game state property names, unknown for the state are skipped.
+    """
+    properties = [prop for prop in properties if hasattr(type(game), prop)]
+    role_sections = STATE_SECTIONS.get(st.session_state.user.role, frozenset())
+    bootstrapped = [
+        prop
+        for prop in properties
+        if set(PROPERTY_SECTIONS.get(prop, (prop,))) <= role_sections
+        # synced histories are requested incrementally by properties
+        and getattr(getattr(game, f"_{prop}_history", None), "cursor", None) is None
+    ]
+    sections = {
+        section
+        for prop in bootstrapped
+        if getattr(game, PROPERTY_FIELDS.get(prop, f"_{prop}")) is None
+        for section in PROPERTY_SECTIONS.get(prop, (prop,))
+    }
+    if sections:
+        st.session_state[PREFETCHED] = StateAPI.get_sections(st.session_state.user.role, sections)
+        try:
+            for prop in bootstrapped:
+                getattr(game, prop)
+        finally:
+            st.session_state[PREFETCHED] = None
+    properties = [prop for prop in properties if prop not in bootstrapped]
+    if len(properties) < 2:
+        return
+    ctx = get_script_run_ctx()
+
+    def load(prop: str) -> None:  # noqa: WPS430
+        add_script_run_ctx(threading.current_thread(), ctx)  # API calls read session state
+        getattr(game, prop)
+
+    with ThreadPoolExecutor(max_workers=len(properties)) as pool:
+        list(pool.map(load, properties))  # re-raises the first error
+
+
 def init_game_state() -> None:  # noqa: WPS231
-    """Initialize game state after user auth."""
+    """Initialize game state after user auth.
+
+    While game events stream is connected, only the state changed by received events is dropped.
+    Cycle is requested from the server on the first run, on cycle change and when the stream is broken.
+    """
+    listener = _get_event_listener()
+    events = listener.drain()
+    reset = any(event.type in RESET_EVENTS for event in events)
+    if st.session_state.game is not None and listener.connected and not reset:
+        apply_events(st.session_state.game, events)
+        return
     server_cycle = CycleAPI.get_cycle()  # get cycle info from server and check sync
     st.session_state.interim_block = server_cycle.ts_start is None
     user: User = st.session_state.user
@@ -46,7 +117,17 @@ def init_game_state() -> None:  # noqa: WPS231
         # clear cached state (except new cycle & constant markets graph)
         for field in fields(st.session_state.game):
             # TODO: refactor this to avoid hardcoded fields
-            if field.name not in {"cycle", "_names", "_player_ids", "_markets"}:
+            if field.name not in {"cycle", "_names", "_player_ids", "_markets"} and not field.name.endswith("_history"):
                 setattr(st.session_state.game, field.name, None)
         if user.role == UserRoles.PLAYER.value:
             SyncStatusAPI.sync()
+
+
+def _get_event_listener() -> EventListener:
+    listener: EventListener | None = st.session_state.events
+    if listener is None or listener.auth_header != st.session_state.auth_header or not listener.alive:
+        if listener is not None:
+            listener.stop()
+        listener = EventListener(st.session_state.auth_header)
+        st.session_state.events = listener
+    return listener
@@ -54,6 +54,7 @@ class RootDashboard(AppView):
     name = "Управление"
     icon = "house"
     roles = (UserRoles.ROOT.value,)
+    state_properties = ("names", "player_ids", "sync_status", "markets", "modificators")
 
     def render(self) -> None:
         """Render view."""
@@ -79,6 +79,7 @@ class RootMarketsView(AppView):
     name = "Рынки"
     icon = "pie-chart-fill"
     roles = (UserRoles.ROOT.value,)
+    state_properties = ("names", "player_ids", "markets", "prices", "demand_factors", "storage", "shares")
 
     def render(self) -> None:
         """Render view."""
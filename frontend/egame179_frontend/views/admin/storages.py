@@ -45,6 +45,7 @@ class RootStorageView(AppView):
     name = "Склады"
     icon = "box-seam"
     roles = (UserRoles.ROOT.value,)
+    state_properties = ("names", "markets", "storage")
 
     def render(self) -> None:
         """Render view."""
@@ -65,6 +65,7 @@ class RootSuppliesView(AppView):
     name = "Поставки"
     icon = "box-seam"
     roles = (UserRoles.ROOT.value,)
+    state_properties = ("names", "markets", "prices", "storage", "supplies")
 
     def render(self) -> None:
         """Render view."""
@@ -47,6 +47,7 @@ class RootTransactionsView(AppView):
     name = "Балансы и транзакции"
     icon = "cash-stack"
     roles = (UserRoles.ROOT.value,)
+    state_properties = ("names", "balances", "transactions")
 
     def render(self) -> None:
         """Render view."""
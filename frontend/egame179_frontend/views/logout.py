@@ -26,5 +26,8 @@ class Logout(AppView):
         st.session_state.auth_header = None
         st.session_state.views = None
         st.session_state.game = None
+        if st.session_state.events is not None:
+            st.session_state.events.stop()
+            st.session_state.events = None
         clean_cached_state()
         st.experimental_rerun()
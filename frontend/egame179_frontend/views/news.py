@@ -20,6 +20,7 @@ class BulletinsView(AppView):
     name = "Сводки новостей"
     icon = "graph-up"
     roles = (UserRoles.NEWS.value,)
+    state_properties = ("bulletins",)
 
     def render(self) -> None:
         """Render view."""
@@ -77,6 +77,7 @@ class ManufacturingView(AppView):
     name = "Производство"
     icon = "gear"
     roles = (UserRoles.PLAYER.value,)
+    state_properties = ("markets", "balances", "prices", "production", "thetas", "unlocked_markets")
 
     def render(self) -> None:  # noqa: WPS213
         """Render view."""
@@ -108,6 +109,12 @@ class ManufacturingView(AppView):
                 m_id2name=view_data.m_id2name,
                 name2m_id=view_data.name2m_id,
             )
+            _batch_buy_form_block(
+                unlocked_markets=view_data.unlocked_markets,
+                prices=view_data.prices,
+                thetas=view_data.thetas,
+                m_id2name=view_data.m_id2name,
+            )
         with col2:
             _theta_radar_block(thetas=view_data.thetas, m_id2name=view_data.m_id2name)
         st.markdown("---")
@@ -179,6 +186,51 @@ def _manufacturing(amount: int, market_id: int, market: str) -> None:
     st.experimental_rerun()
 
 
+def _batch_buy_form_block(
+    unlocked_markets: list[int],
+    prices: dict[int, tuple[float, str | None]],
+    thetas: dict[int, float],
+    m_id2name: dict[int, str],
+) -> None:
+    st.markdown("#### Производство на нескольких рынках")
+    with st.form(key="batch_production_form"):
+        amounts: dict[int, int] = {}
+        for m_id in unlocked_markets:
+            real_price = (1 - thetas[m_id]) * prices[m_id][0]
+            amounts[m_id] = int(
+                st.number_input(
+                    f"{m_id2name[m_id]} (цена с учетом скидки: {real_price})",
+                    min_value=0,
+                    value=0,
+                    step=1,
+                    key=f"batch_production_{m_id}",
+                ),
+            )
+        atomic = st.checkbox("Только все заказы вместе", value=True)
+        submitted = st.form_submit_button("Произвести все", disabled=st.session_state.interim_block)
+    orders = {m_id: amount for m_id, amount in amounts.items() if amount > 0}
+    if submitted and orders:
+        _batch_manufacturing(orders=orders, atomic=atomic, m_id2name=m_id2name)
+
+
+def _batch_manufacturing(orders: dict[int, int], atomic: bool, m_id2name: dict[int, str]) -> None:
+    try:
+        batch_result = ProductionAPI.new_batch(orders=orders, atomic=atomic)
+    except HTTPStatusError as exc:
+        st.error(f"Ошибка: {exc = }", icon="⚙")
+    else:
+        for order in batch_result.orders:
+            market = m_id2name[order.market]
+            if order.accepted:
+                st.success(f"{order.quantity} шт. товаров {market} отправлены на склад.", icon="⚙")
+            else:
+                st.error(f"{market}: {order.error or 'заказ не выполнен'}", icon="⚙")
+        if batch_result.committed:
+            st.session_state.game.clear_after_buy()
+    sleep(1.5)
+    st.experimental_rerun()
+
+
 def _theta_radar_block(thetas: dict[int, float], m_id2name: dict[int, str]) -> None:
     st.markdown("#### Текущая эффективность производства")
     st_pyecharts(
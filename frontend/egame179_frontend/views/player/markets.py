@@ -87,6 +87,16 @@ class MarketsView(AppView):
     name = "Рынки"
     icon = "pie-chart-fill"
     roles = (UserRoles.PLAYER.value,)
+    state_properties = (
+        "names",
+        "markets",
+        "prices",
+        "demand_factors",
+        "storage",
+        "shares",
+        "thetas",
+        "unlocked_markets",
+    )
 
     def render(self) -> None:
         """Render view."""
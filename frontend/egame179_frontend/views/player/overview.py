@@ -48,6 +48,7 @@ class PlayerDashboard(AppView):
     name = "Сводный отчёт"
     icon = "cash-stack"
     roles = (UserRoles.PLAYER.value,)
+    state_properties = ("balances", "modificators", "transactions")
 
     def render(self) -> None:
         """Render view."""
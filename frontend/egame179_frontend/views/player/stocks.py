@@ -37,6 +37,7 @@ class StocksView(AppView):
     name = "Биржевые сводки"
     icon = "graph-up"
     roles = (UserRoles.PLAYER.value,)
+    state_properties = ("names", "player_ids", "stocks")
 
     def __init__(self) -> None:
         self.view_data: _ViewData | None = None
@@ -76,6 +76,7 @@ class SuppliesView(AppView):
     name = "Склады и поставки"
     icon = "box-seam"
     roles = (UserRoles.PLAYER.value,)
+    state_properties = ("markets", "balances", "modificators", "prices", "storage", "supplies")
 
     def render(self) -> None:
         """Render view."""
@@ -106,6 +107,7 @@ class SuppliesView(AppView):
                 name2m_id=view_data.name2m_id,
                 beta=view_data.beta,
             )
+            _batch_supply_form_block(storage=view_data.storage, m_id2name=view_data.m_id2name, beta=view_data.beta)
         with col2:
             _supplies_block(supplies=view_data.supplies, m_id2name=view_data.m_id2name)
 
@@ -169,6 +171,47 @@ def _make_supply(amount: int, market_id: int, market: str) -> None:
     st.experimental_rerun()
 
 
+def _batch_supply_form_block(storage: dict[int, int], m_id2name: dict[int, str], beta: float) -> None:
+    st.markdown("#### Поставки на несколько рынков")
+    with st.form(key="batch_supply_form"):
+        amounts: dict[int, int] = {}
+        for m_id in [m_id for m_id in storage if storage[m_id] > 0]:
+            amounts[m_id] = int(
+                st.number_input(
+                    f"{m_id2name[m_id]} (на складе: {storage[m_id]})",
+                    min_value=0,
+                    max_value=storage[m_id],
+                    value=0,
+                    step=1,
+                    key=f"batch_supply_{m_id}",
+                ),
+            )
+        st.text(f"Комиссия за операцию на каждом рынке: {beta}")
+        atomic = st.checkbox("Только все поставки вместе", value=True)
+        submitted = st.form_submit_button("Оформить поставки", disabled=st.session_state.interim_block)
+    orders = {m_id: amount for m_id, amount in amounts.items() if amount > 0}
+    if submitted and orders:
+        _make_batch_supply(orders=orders, atomic=atomic, m_id2name=m_id2name)
+
+
+def _make_batch_supply(orders: dict[int, int], atomic: bool, m_id2name: dict[int, str]) -> None:
+    try:
+        batch_result = SupplyAPI.new_batch(orders=orders, atomic=atomic)
+    except HTTPStatusError as exc:
+        st.error(f"Ошибка: {exc = }", icon="⚙")
+    else:
+        for order in batch_result.orders:
+            market = m_id2name[order.market]
+            if order.accepted:
+                st.success(f"Создана поставка {order.quantity} шт. товаров {market}.", icon="⚙")
+            else:
+                st.error(f"{market}: {order.error or 'поставка не создана'}", icon="⚙")
+        if batch_result.committed:
+            st.session_state.game.clear_after_supply()
+    sleep(1.5)
+    st.experimental_rerun()
+
+
 def _supplies_block(supplies: list[dict[str, Any]], m_id2name: dict[int, str]) -> None:
     st.write("#### Активные поставки")
     for supply in supplies:
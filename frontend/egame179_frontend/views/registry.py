@@ -8,6 +8,7 @@ class AppView(Protocol):
     name: ClassVar[str]
     icon: ClassVar[str]
     roles: ClassVar[tuple[str, ...]]
+    state_properties: ClassVar[tuple[str, ...]] = ()  # game state properties, loaded concurrently before render
 
     def render(self) -> None:  # noqa: D102
         ...  # noqa: WPS428